@@ -1,10 +1,17 @@
 # This script demonstrates and evaluates different summarization methods.
+# Pass --dataset to stream a JSONL dataset ({"id", "text", "reference"} per line)
+# through every method with per-record results and resumable checkpoints, or
+# --score to evaluate existing predictions ({"reference", "candidate"} or
+# {"reference", "candidates": {...}} per line) in parallel worker processes.
+import argparse
 import json
 import sys
 import os
 from src.components.evaluate import SummarizationEvaluator
+from src.constants.constants import ROUGE_ENGINE, ROUGE_ENGINES
 from src.utils.nltk_resources import download_nltk_resources
 from src.components.summarizer import Summarizer
+from src.pipeline.streaming_evaluation import StreamingEvaluationPipeline
 from src.utils.logging_setup import logger
 
 # Ensure the project root is in the Python path to allow for imports
@@ -76,7 +83,24 @@ def save_results_to_json(results_data: dict, file_path: str):
         logger.error(f"Failed to save results to JSON file: {e}", exc_info=True)
 
 
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Demonstrate and evaluate summarization methods.")
+    parser.add_argument("--dataset", help="JSONL dataset to evaluate instead of the built-in sample.")
+    parser.add_argument("--output", default="evaluation_results.jsonl", help="Per-record results (JSONL).")
+    parser.add_argument("--summary", default="evaluation_summary.json", help="Corpus-level aggregates (JSON).")
+    parser.add_argument("--checkpoint", help="Checkpoint file (defaults to <output>.checkpoint.json).")
+    parser.add_argument("--checkpoint-every", type=int, default=50)
+    parser.add_argument("--restart", action="store_true", help="Ignore an existing checkpoint.")
+    parser.add_argument("--rouge-engine", choices=ROUGE_ENGINES, default=ROUGE_ENGINE,
+                        help="'native' computes the same ROUGE scores much faster.")
+    parser.add_argument("--score", help="JSONL predictions to evaluate against their references (no summarization).")
+    parser.add_argument("--workers", type=int, help="Worker processes for --score (defaults to the CPU count).")
+    parser.add_argument("--chunk-size", type=int, default=256, help="Records per worker task for --score.")
+    return parser.parse_args()
+
+
 if __name__ == "__main__":
+    args = parse_args()
     sample_text = """
     A solar eclipse is a celestial event where the Moon passes between the Sun and
     Earth, and the Moon fully or partially blocks the Sun. This can only happen at
@@ -100,9 +124,15 @@ if __name__ == "__main__":
 
 
 
-    # Instantiate the summarizer and evaluator
+    evaluator = SummarizationEvaluator(rouge_engine=args.rouge_engine)
+    if args.score:
+        report = evaluator.evaluate_corpus(args.score, workers=args.workers, chunk_size=args.chunk_size)
+        save_results_to_json(report, args.summary)
+        print(json.dumps(report, indent=4))
+        sys.exit(0 if report.get("evaluation_status") == "success" else 1)
+
+    # Instantiate the summarizer
     summarizer = Summarizer(language='english')
-    evaluator = SummarizationEvaluator()
 
     # Define the summarization methods and their specific arguments
     evaluation_methods = {
@@ -112,6 +142,14 @@ if __name__ == "__main__":
         'bert_extractive': {'num_sentences': 3}
     }
 
+    if args.dataset:
+        pipeline = StreamingEvaluationPipeline(summarizer, evaluator, evaluation_methods, args.output,
+                                               checkpoint_path=args.checkpoint,
+                                               checkpoint_every=args.checkpoint_every)
+        report = pipeline.run(args.dataset, summary_path=args.summary, resume=not args.restart)
+        print(json.dumps(report, indent=4))
+        sys.exit(0)
+
     all_results = {}
     summaries = {}
 
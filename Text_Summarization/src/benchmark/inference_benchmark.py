@@ -0,0 +1,166 @@
+# Sweeps inference slot count x torch threads per slot for a transformer summarizer
+# under concurrent requests and reports the configuration with the best throughput.
+#
+# Usage (from the Text_Summarization directory):
+#   python -m src.benchmark.inference_benchmark --method bert_extractive --requests 64
+#   python -m src.benchmark.inference_benchmark --slots 1 2 4 --threads 1 2 4 --output inference_sweep.json
+#
+# Apply the winner with SUMMARY_INFERENCE_SLOTS / SUMMARY_INFERENCE_THREADS.
+import argparse
+import json
+import logging
+import multiprocessing
+import os
+import platform
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from src.benchmark.summarizer_benchmark import latency_summary, peak_rss_mb, synthetic_document
+from src.constants.constants import INFERENCE_SLOTS_ENV, INFERENCE_THREADS_ENV
+from src.utils.logging_setup import logger
+
+DEFAULT_MODELS = {"bert_extractive": "bert-base-uncased", "t5": "t5-small"}
+
+
+def powers_of_two(limit: int) -> list[int]:
+    values, value = [], 1
+    while value <= limit:
+        values.append(value)
+        value *= 2
+    return values
+
+
+def sweep_grid(slots: list[int], threads: list[int], cores: int, oversubscribe: bool = False) -> list[tuple[int, int]]:
+    """
+    (slots, threads per slot) pairs to try; by default only those that fit in `cores`.
+    """
+    return [(s, t) for s in slots for t in threads if oversubscribe or s * t <= cores]
+
+
+def _run_configuration(method: str, model_name: str, slots: int, threads: int, documents: list[str],
+                       requests: int, concurrency: int, num_sentences: int, log_level: str) -> dict:
+    """
+    Runs in a fresh process: torch thread counts are process-wide and the
+    inter-op count cannot be changed once torch has used it.
+    """
+    os.environ[INFERENCE_SLOTS_ENV] = str(slots)
+    os.environ[INFERENCE_THREADS_ENV] = str(threads)
+    logging.getLogger().setLevel(log_level)
+    logger.setLevel(log_level)
+    from src.modules.text_preprocessing import TextProcessor
+    from src.core.inference_scheduler import inference_scheduler
+
+    if method == "t5":
+        from src.summarizers.T5_summarizer import T5Summarizer
+        summarizer = T5Summarizer(TextProcessor(), model_name=model_name)
+        kwargs = {}  # length bounds come from the summarizer's generation policy, as in production
+    else:
+        from src.summarizers.Bert_summarizer import BERTExtractiveSummarizer
+        summarizer = BERTExtractiveSummarizer(TextProcessor(), model_name=model_name)
+        kwargs = {"num_sentences": num_sentences}
+    result = {"slots": slots, "threads_per_slot": threads, "concurrency": concurrency}
+    if not summarizer.available:
+        result["error"] = f"Model '{model_name}' is not available in the local registry."
+        return result
+
+    summarizer.summarize(documents[0], **kwargs)  # warm-up (also starts the slots)
+
+    def timed_call(index: int) -> float:
+        start = time.perf_counter()
+        summarizer.summarize(documents[index % len(documents)], **kwargs)
+        return time.perf_counter() - start
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        latencies = list(pool.map(timed_call, range(requests)))
+    result.update(latency_summary(latencies, time.perf_counter() - start))
+    result["peak_rss_mb"] = peak_rss_mb()
+    result["cores"] = inference_scheduler.partitions
+    return result
+
+
+def run_sweep(method: str, model_name: str, grid: list[tuple[int, int]], documents: list[str], requests: int = 32,
+              concurrency: int = None, num_sentences: int = 3, log_level: str = "WARNING") -> dict:
+    """
+    Benchmarks each configuration in its own spawned process and returns a JSON-serializable report.
+    """
+    from src.core.inference_scheduler import available_cores
+
+    context = multiprocessing.get_context("spawn")
+    results = []
+    for slots, threads in grid:
+        clients = concurrency or 2 * slots  # keep every slot busy with a request waiting behind it
+        logger.info(f"Benchmarking {method} with {slots} slot(s) x {threads} thread(s), {clients} concurrent clients...")
+        with context.Pool(1) as pool:
+            try:
+                result = pool.apply(_run_configuration, (method, model_name, slots, threads, documents,
+                                                         requests, clients, num_sentences, log_level))
+            except Exception as e:
+                logger.error(f"Configuration {slots}x{threads} failed: {e}", exc_info=True)
+                result = {"slots": slots, "threads_per_slot": threads, "concurrency": clients, "error": str(e)}
+        if "error" not in result:
+            logger.info(f"{slots}x{threads}: {result['throughput_per_sec']:.2f} req/s, "
+                        f"p50={result['p50_ms']:.1f}ms p95={result['p95_ms']:.1f}ms")
+        results.append(result)
+
+    completed = [r for r in results if "error" not in r]
+    best = max(completed, key=lambda r: r["throughput_per_sec"]) if completed else None
+    return {
+        "created_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "environment": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cores": len(available_cores()),
+        },
+        "settings": {"method": method, "model": model_name, "requests": requests, "num_sentences": num_sentences,
+                     "documents": len(documents), "concurrency": concurrency},
+        "results": results,
+        "best": {"slots": best["slots"], "threads_per_slot": best["threads_per_slot"],
+                 "throughput_per_sec": best["throughput_per_sec"]} if best else None,
+    }
+
+
+def main(argv: list[str] = None) -> int:
+    # Imported here so that spawned configuration processes create their
+    # scheduler only after the slot settings are in the environment.
+    from src.core.inference_scheduler import available_cores
+
+    cores = len(available_cores())
+    parser = argparse.ArgumentParser(description="Find the inference slot/thread split with the best throughput.")
+    parser.add_argument("--method", choices=sorted(DEFAULT_MODELS), default="bert_extractive")
+    parser.add_argument("--model", help="Registry model name (defaults to the summarizer's default model).")
+    parser.add_argument("--slots", nargs="+", type=int, default=powers_of_two(cores))
+    parser.add_argument("--threads", nargs="+", type=int, default=powers_of_two(cores))
+    parser.add_argument("--oversubscribe", action="store_true", help="Also try slots x threads above the core count.")
+    parser.add_argument("--requests", type=int, default=32, help="Requests per configuration.")
+    parser.add_argument("--concurrency", type=int, help="Concurrent clients (default: twice the slot count).")
+    parser.add_argument("--doc-sentences", type=int, default=40)
+    parser.add_argument("--docs", type=int, default=8)
+    parser.add_argument("--num-sentences", type=int, default=3,
+                        help="Summary length of extractive methods; t5 sizes its summary with its generation policy.")
+    parser.add_argument("--output", default="inference_sweep.json")
+    parser.add_argument("--log-level", default="WARNING")
+    args = parser.parse_args(argv)
+
+    grid = sweep_grid(args.slots, args.threads, cores, args.oversubscribe)
+    if not grid:
+        parser.error(f"No slot/thread combination fits in {cores} cores; pass --oversubscribe to try anyway.")
+    documents = [synthetic_document(args.doc_sentences, seed) for seed in range(args.docs)]
+    report = run_sweep(args.method, args.model or DEFAULT_MODELS[args.method], grid, documents, args.requests,
+                       args.concurrency, args.num_sentences, args.log_level)
+
+    with open(args.output, "w") as f:
+        json.dump(report, f, indent=4)
+    logger.info(f"Inference sweep saved to {args.output}")
+    if report["best"] is None:
+        logger.error("No configuration completed.")
+        return 1
+    best = report["best"]
+    logger.info(f"Best: SUMMARY_INFERENCE_SLOTS={best['slots']} SUMMARY_INFERENCE_THREADS={best['threads_per_slot']} "
+                f"({best['throughput_per_sec']:.2f} req/s)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
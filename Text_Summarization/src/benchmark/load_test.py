@@ -0,0 +1,409 @@
+# Load test of the serving path: starts the app locally (asgi.py) or targets a
+# running one, replays a weighted mix of methods and document sizes at a target
+# request rate or concurrency, and records latency percentiles, error rates and
+# the server's RSS over time.
+#
+# Usage (from the Text_Summarization directory):
+#   python -m src.benchmark.load_test --mix tfidf=4 textrank=2 lsa=1 --sizes 10 50 200 --rate 20 --duration 60
+#   python -m src.benchmark.load_test --concurrency 16 --requests 2000 --baseline load_baseline.json --save-baseline
+#   python -m src.benchmark.load_test --url http://127.0.0.1:8000 --server-pid 1234 --rate 50
+import argparse
+import json
+import os
+import pathlib
+import platform
+import random
+import signal
+import socket
+import subprocess
+import sys
+import threading
+import time
+import urllib.error
+import urllib.request
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+
+from src.benchmark.summarizer_benchmark import latency_summary, synthetic_document
+from src.utils.logging_setup import logger
+
+REPO_ROOT = pathlib.Path(__file__).resolve().parents[3]
+
+
+def parse_weights(values: list[str], cast=str) -> dict:
+    """
+    Parses ["tfidf=3", "lsa"] into {"tfidf": 3.0, "lsa": 1.0}.
+    """
+    weights = {}
+    for value in values:
+        name, _, weight = value.partition("=")
+        weights[cast(name)] = float(weight) if weight else 1.0
+        if weights[cast(name)] < 0:
+            raise ValueError(f"Negative weight in '{value}'.")
+    if not sum(weights.values()):
+        raise ValueError("At least one weight must be positive.")
+    return weights
+
+
+def process_rss_mb(pid: int) -> float | None:
+    """
+    Current resident set size of process `pid` in MiB, or None if it cannot be read.
+    """
+    try:
+        with open(f"/proc/{pid}/status", "r") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    try:
+        output = subprocess.run(["ps", "-o", "rss=", "-p", str(pid)], capture_output=True, text=True, timeout=5).stdout
+        return int(output.strip()) / 1024 if output.strip() else None
+    except (OSError, ValueError, subprocess.SubprocessError):
+        return None
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+class LocalServer:
+    """
+    Runs `asgi.py` in a subprocess for the duration of a load test.
+    """
+    def __init__(self, port: int = None, log_path: str = "load_test_server.log", env: dict = None,
+                 startup_timeout: float = 300.0):
+        self.port = port or free_port()
+        self.url = f"http://127.0.0.1:{self.port}"
+        self.log_path = log_path
+        self.env = env or {}
+        self.startup_timeout = startup_timeout
+        self.process = None
+
+    def __enter__(self):
+        env = {**os.environ, **self.env}
+        env["PYTHONPATH"] = os.pathsep.join(filter(None, [str(REPO_ROOT / "Text_Summarization"), env.get("PYTHONPATH")]))
+        self._log = open(self.log_path, "w")
+        self.process = subprocess.Popen([sys.executable, "asgi.py", "--host", "127.0.0.1", "--port", str(self.port)],
+                                        cwd=REPO_ROOT, env=env, stdout=self._log, stderr=subprocess.STDOUT)
+        logger.info(f"Started server (pid {self.process.pid}) on {self.url}; waiting for /healthz...")
+        deadline = time.monotonic() + self.startup_timeout
+        while time.monotonic() < deadline:
+            if self.process.poll() is not None:
+                self.__exit__(None, None, None)
+                raise RuntimeError(f"Server exited with code {self.process.returncode}; see {self.log_path}.")
+            if fetch_json(f"{self.url}/healthz", timeout=2) is not None:
+                return self
+            time.sleep(0.5)
+        self.__exit__(None, None, None)
+        raise RuntimeError(f"Server did not become healthy within {self.startup_timeout:.0f}s; see {self.log_path}.")
+
+    def __exit__(self, *exc):
+        if self.process and self.process.poll() is None:
+            self.process.send_signal(signal.SIGTERM)  # drains in-flight requests
+            try:
+                self.process.wait(timeout=60)
+            except subprocess.TimeoutExpired:
+                self.process.kill()
+                self.process.wait()
+        self._log.close()
+
+
+def fetch_json(url: str, timeout: float = 5.0):
+    try:
+        with urllib.request.urlopen(url, timeout=timeout) as response:
+            return json.loads(response.read())
+    except (OSError, ValueError):
+        return None
+
+
+class ResourceSampler:
+    """
+    Samples the server's RSS and scheduler load every `interval` seconds in the background.
+    """
+    def __init__(self, url: str, pid: int = None, interval: float = 1.0):
+        self.url = url
+        self.pid = pid
+        self.interval = interval
+        self.samples = []
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="load-test-sampler", daemon=True)
+
+    def _run(self):
+        start = time.perf_counter()
+        while True:
+            health = fetch_json(f"{self.url}/healthz", timeout=self.interval) or {}
+            self.samples.append({
+                "t": round(time.perf_counter() - start, 3),
+                "rss_mb": process_rss_mb(self.pid) if self.pid else None,
+                "pending": sum(health.get("pending", {}).values()),
+            })
+            if self._stop.wait(self.interval):
+                return
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._stop.set()
+        self._thread.join()
+
+    def summary(self) -> dict:
+        rss = [s["rss_mb"] for s in self.samples if s["rss_mb"] is not None]
+        return {
+            "start_mb": rss[0] if rss else None,
+            "peak_mb": max(rss) if rss else None,
+            "end_mb": rss[-1] if rss else None,
+            "growth_mb": rss[-1] - rss[0] if rss else None,
+            "max_pending": max((s["pending"] for s in self.samples), default=0),
+            "samples": self.samples,
+        }
+
+
+class LoadGenerator:
+    """
+    Sends summarization requests drawn from a weighted mix of methods and
+    document sizes. Documents are unique per request by default, so the
+    response cache does not hide the cost of summarizing; `distinct_docs`
+    cycles through a fixed set per scenario to include cache hits.
+    """
+    def __init__(self, url: str, mix: dict[str, float], sizes: dict[int, float], num_sentences: int = 3,
+                 distinct_docs: int = 0, timeout: float = 120.0, seed: int = 0):
+        self.url = url.rstrip("/")
+        self.mix = mix
+        self.sizes = sizes
+        self.num_sentences = num_sentences
+        self.distinct_docs = distinct_docs
+        self.timeout = timeout
+        self.rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self.records = []
+
+    def next_request(self, index: int) -> tuple[str, int, str]:
+        with self._lock:
+            method = self.rng.choices(list(self.mix), weights=list(self.mix.values()))[0]
+            size = self.rng.choices(list(self.sizes), weights=list(self.sizes.values()))[0]
+        seed = index % self.distinct_docs if self.distinct_docs else index
+        return method, size, synthetic_document(size, seed=seed * 7919 + size)
+
+    def send(self, index: int, scheduled: float = None, record: bool = True) -> dict:
+        """
+        Sends one request. Latency is measured from `scheduled` (open-loop
+        runs) so time spent waiting for a free client counts against the server.
+        """
+        method, size, text = self.next_request(index)
+        body = json.dumps({"documents": [{"id": index, "text": text}], "method": method,
+                           "params": {"num_sentences": self.num_sentences}}).encode("utf-8")
+        request = urllib.request.Request(f"{self.url}/api/summarize", data=body,
+                                         headers={"Content-Type": "application/json"}, method="POST")
+        start = scheduled if scheduled is not None else time.perf_counter()
+        result = {"method": method, "size": size, "status": None, "error": None, "cache": None}
+        try:
+            with urllib.request.urlopen(request, timeout=self.timeout) as response:
+                payload = json.loads(response.read())
+                result["status"] = response.status
+                result["cache"] = response.headers.get("X-Cache")
+                item = (payload.get("results") or [{}])[0]
+                if item.get("status") != "success":
+                    result["error"] = item.get("error", "item error")
+        except urllib.error.HTTPError as e:
+            result["status"] = e.code
+            result["error"] = f"HTTP {e.code}"
+        except (OSError, ValueError) as e:
+            result["error"] = type(e).__name__
+        result["latency"] = time.perf_counter() - start
+        if record:
+            with self._lock:
+                self.records.append(result)
+        return result
+
+    def run_closed_loop(self, concurrency: int, requests: int = None, duration: float = None, offset: int = 0) -> float:
+        """
+        `concurrency` clients each send their next request as soon as the last one returns.
+        """
+        deadline = time.perf_counter() + duration if duration else None
+        counter = iter(range(offset, offset + requests) if requests else _count(offset))
+        counter_lock = threading.Lock()
+
+        def client():
+            while deadline is None or time.perf_counter() < deadline:
+                with counter_lock:
+                    index = next(counter, None)
+                if index is None:
+                    return
+                self.send(index)
+
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="load-client") as pool:
+            for _ in range(concurrency):
+                pool.submit(client)
+        return time.perf_counter() - start
+
+    def run_open_loop(self, rate: float, requests: int = None, duration: float = None, offset: int = 0,
+                      max_inflight: int = 512) -> float:
+        """
+        Sends requests at `rate` per second (Poisson arrivals), whether or not earlier ones have finished.
+        """
+        requests = requests or int(rate * duration)
+        start = time.perf_counter()
+        next_send = start
+        with ThreadPoolExecutor(max_workers=max_inflight, thread_name_prefix="load-client") as pool:
+            for index in range(offset, offset + requests):
+                with self._lock:
+                    next_send += self.rng.expovariate(rate)
+                delay = next_send - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+                pool.submit(self.send, index, next_send)
+        return time.perf_counter() - start
+
+    def summary(self, elapsed: float) -> dict:
+        """
+        Latency percentiles of successful requests, overall and per method/size,
+        plus error counts and rates.
+        """
+        def summarize(records):
+            ok = [r["latency"] for r in records if not r["error"]]
+            stats = latency_summary(ok, elapsed)
+            stats["requests"] = len(records)
+            stats["errors"] = len(records) - len(ok)
+            stats["error_rate"] = stats["errors"] / len(records) if records else 0.0
+            return stats
+
+        by_scenario = defaultdict(list)
+        errors = defaultdict(int)
+        for record in self.records:
+            by_scenario[f"{record['method']}/{record['size']}"].append(record)
+            if record["error"]:
+                errors[record["error"] if record["status"] != 200 else "item error"] += 1
+        overall = summarize(self.records)
+        overall["cache_hits"] = sum(1 for r in self.records if r["cache"] == "HIT")
+        return {"overall": overall, "scenarios": {name: summarize(records) for name, records in sorted(by_scenario.items())},
+                "errors": dict(errors)}
+
+
+def _count(start: int):
+    while True:
+        yield start
+        start += 1
+
+
+def compare_to_baseline(report: dict, baseline: dict, tolerance: float = 0.2) -> list[dict]:
+    """
+    Flags throughput, latency, error-rate and memory regressions against a
+    previous report, ignoring changes below per-metric noise floors.
+    """
+    # (metric, direction, absolute noise floor)
+    latency_checks = (("p50_ms", 1, 1.0), ("p95_ms", 1, 1.0), ("p99_ms", 1, 1.0),
+                      ("throughput_per_sec", -1, 0.0), ("error_rate", 1, 0.01))
+    memory_checks = (("peak_mb", 1, 10.0), ("growth_mb", 1, 10.0))
+    regressions = []
+
+    def check(scope, metric, direction, floor, base_value, value):
+        if base_value is None or value is None:
+            return
+        delta = (value - base_value) * direction
+        relative = delta / abs(base_value) if base_value else float("inf")
+        if delta > floor and relative > tolerance:
+            regressions.append({"scope": scope, "metric": metric, "baseline": base_value, "current": value})
+
+    scopes = [("overall", report["overall"], baseline.get("overall", {}))]
+    scopes += [(name, stats, baseline.get("scenarios", {}).get(name)) for name, stats in report["scenarios"].items()]
+    for scope, stats, base_stats in scopes:
+        if not base_stats:
+            continue
+        for metric, direction, floor in latency_checks:
+            check(scope, metric, direction, floor, base_stats.get(metric), stats.get(metric))
+    for metric, direction, floor in memory_checks:
+        check("server", metric, direction, floor, baseline.get("server", {}).get(metric), report["server"].get(metric))
+    return regressions
+
+
+def main(argv: list[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="Load test the summarization service.")
+    parser.add_argument("--url", help="Target a running server instead of starting one.")
+    parser.add_argument("--server-pid", type=int, help="PID of the --url server, to sample its RSS.")
+    parser.add_argument("--server-log", default="load_test_server.log")
+    parser.add_argument("--server-env", nargs="*", default=[], help="KEY=VALUE settings for the started server.")
+    parser.add_argument("--mix", nargs="+", default=["tfidf=4", "textrank=3", "lsa=2", "bert_extractive=1"],
+                        help="Methods with relative weights, e.g. tfidf=4 t5=1.")
+    parser.add_argument("--sizes", nargs="+", default=["10=2", "50=2", "200=1"],
+                        help="Document sizes in sentences with relative weights, e.g. 10=2 200=1.")
+    parser.add_argument("--num-sentences", type=int, default=3)
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument("--rate", type=float, help="Open loop: requests per second.")
+    mode.add_argument("--concurrency", type=int, help="Closed loop: concurrent clients (default 8).")
+    parser.add_argument("--duration", type=float, default=30.0, help="Seconds to run (ignored with --requests).")
+    parser.add_argument("--requests", type=int, help="Total requests to send instead of a duration.")
+    parser.add_argument("--warmup", type=int, default=10, help="Unrecorded requests sent first.")
+    parser.add_argument("--distinct-docs", type=int, default=0, help="Documents per scenario to cycle (0 = all unique).")
+    parser.add_argument("--sample-interval", type=float, default=1.0)
+    parser.add_argument("--timeout", type=float, default=120.0, help="Per-request client timeout in seconds.")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", default="load_test_results.json")
+    parser.add_argument("--baseline", help="Previous results JSON to compare against.")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="Relative slack before flagging a regression.")
+    parser.add_argument("--save-baseline", action="store_true", help="Also write the results to --baseline.")
+    args = parser.parse_args(argv)
+
+    mix, sizes = parse_weights(args.mix), parse_weights(args.sizes, int)
+    duration = None if args.requests else args.duration
+    concurrency = args.concurrency or (None if args.rate else 8)
+
+    def run(url: str, pid: int) -> dict:
+        generator = LoadGenerator(url, mix, sizes, args.num_sentences, args.distinct_docs, args.timeout, args.seed)
+        for index in range(args.warmup):
+            generator.send(-1 - index, record=False)
+        with ResourceSampler(url, pid, args.sample_interval) as sampler:
+            if args.rate:
+                elapsed = generator.run_open_loop(args.rate, args.requests, duration)
+            else:
+                elapsed = generator.run_closed_loop(concurrency, args.requests, duration)
+        report = generator.summary(elapsed)
+        report["elapsed_s"] = elapsed
+        report["server"] = sampler.summary()
+        return report
+
+    if args.url:
+        report = run(args.url, args.server_pid)
+    else:
+        server_env = dict(item.split("=", 1) for item in args.server_env)
+        with LocalServer(log_path=args.server_log, env=server_env) as server:
+            report = run(server.url, server.process.pid)
+
+    report = {
+        "created_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "environment": {"python": platform.python_version(), "platform": platform.platform(), "cpu_count": os.cpu_count()},
+        "settings": {"mix": mix, "sizes": sizes, "rate": args.rate, "concurrency": concurrency, "duration": duration,
+                     "requests": args.requests, "distinct_docs": args.distinct_docs, "num_sentences": args.num_sentences},
+        **report,
+    }
+    overall = report["overall"]
+    logger.info(f"{overall['requests']} requests in {report['elapsed_s']:.1f}s: {overall['throughput_per_sec']:.2f} req/s, "
+                f"p50={overall['p50_ms']:.1f}ms p95={overall['p95_ms']:.1f}ms p99={overall['p99_ms']:.1f}ms, "
+                f"error rate {overall['error_rate']:.2%}, server peak RSS {report['server']['peak_mb']} MiB")
+
+    if args.baseline and os.path.exists(args.baseline) and not args.save_baseline:
+        with open(args.baseline, "r") as f:
+            report["regressions"] = compare_to_baseline(report, json.load(f), args.tolerance)
+        for regression in report["regressions"]:
+            logger.warning(f"Regression in {regression['scope']} {regression['metric']}: "
+                           f"{regression['baseline']:.4f} -> {regression['current']:.4f}")
+
+    with open(args.output, "w") as f:
+        json.dump(report, f, indent=4)
+    logger.info(f"Load test results saved to {args.output}")
+
+    if args.save_baseline and args.baseline:
+        with open(args.baseline, "w") as f:
+            json.dump(report, f, indent=4)
+        logger.info(f"Baseline saved to {args.baseline}")
+
+    return 1 if report.get("regressions") else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
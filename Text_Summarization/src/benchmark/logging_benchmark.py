@@ -0,0 +1,122 @@
+# Measures the per-call cost of logging on the summarization hot path for the
+# old synchronous, eagerly formatted setup and the queue-based pipeline.
+#
+# Usage (from the Text_Summarization directory):
+#   python -m src.benchmark.logging_benchmark --calls 20000 --output logging_benchmark.json
+import argparse
+import json
+import logging
+import logging.handlers
+import os
+import queue
+import sys
+import tempfile
+import time
+from src.benchmark.summarizer_benchmark import percentile
+from src.utils.logging_setup import DeferredQueueHandler, JsonFormatter, SampledLoggerAdapter, logger
+
+LOG_FORMAT = "[%(asctime)s: %(levelname)s: %(module)s]: %(message)s"
+CONFIGURATIONS = ("sync_fstring", "sync_lazy", "async_lazy", "async_json", "async_sampled", "level_gated")
+
+
+def _build(configuration: str, log_dir: str, sample_rate: float):
+    """
+    Returns (log callable, listener or None, handlers) for one configuration,
+    using an isolated logger that writes to a file and a discarded stream.
+    """
+    bench_logger = logging.getLogger(f"logging_benchmark.{configuration}")
+    bench_logger.propagate = False
+    bench_logger.handlers.clear()
+    bench_logger.setLevel(logging.WARNING if configuration == "level_gated" else logging.INFO)
+
+    formatter = JsonFormatter() if configuration == "async_json" else logging.Formatter(LOG_FORMAT)
+    handlers = [logging.FileHandler(os.path.join(log_dir, f"{configuration}.log")),
+                logging.StreamHandler(open(os.devnull, "w"))]
+    for handler in handlers:
+        handler.setFormatter(formatter)
+
+    listener = None
+    if configuration.startswith("async"):
+        queue_handler = DeferredQueueHandler(queue.SimpleQueue())
+        bench_logger.addHandler(queue_handler)
+        listener = logging.handlers.QueueListener(queue_handler.queue, *handlers)
+        listener.start()
+    else:
+        for handler in handlers:
+            bench_logger.addHandler(handler)
+
+    if configuration == "sync_fstring":
+        def log(i, method="tfidf"):
+            bench_logger.info(f"TF-IDF summarization complete. Extracted {i % 5} sentences using '{method}'.")
+    elif configuration == "async_sampled":
+        sampled = SampledLoggerAdapter(bench_logger, sample_rate)
+
+        def log(i, method="tfidf"):
+            sampled.info("TF-IDF summarization complete. Extracted %d sentences using '%s'.", i % 5, method)
+    else:
+        def log(i, method="tfidf"):
+            bench_logger.info("TF-IDF summarization complete. Extracted %d sentences using '%s'.", i % 5, method)
+    return log, listener, handlers
+
+
+def benchmark_configuration(configuration: str, calls: int, log_dir: str, sample_rate: float = 0.01) -> dict:
+    """
+    Times `calls` log calls from the caller's point of view, then how long the
+    background writer needs to flush what was queued.
+    """
+    log, listener, handlers = _build(configuration, log_dir, sample_rate)
+    for i in range(min(calls, 1000)):  # warm-up
+        log(i)
+
+    latencies = []
+    start = time.perf_counter()
+    for i in range(calls):
+        call_start = time.perf_counter_ns()
+        log(i)
+        latencies.append(time.perf_counter_ns() - call_start)
+    elapsed = time.perf_counter() - start
+
+    flush_start = time.perf_counter()
+    if listener is not None:
+        listener.stop()
+    for handler in handlers:
+        handler.flush()
+        handler.close()
+    flush_s = time.perf_counter() - flush_start
+
+    return {
+        "calls": calls,
+        "mean_ns": elapsed / calls * 1e9,
+        "p50_ns": percentile(latencies, 50),
+        "p99_ns": percentile(latencies, 99),
+        "max_ns": max(latencies),
+        "flush_s": flush_s,
+    }
+
+
+def main(argv: list[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark per-call logging overhead.")
+    parser.add_argument("--calls", type=int, default=20000)
+    parser.add_argument("--configurations", nargs="+", default=list(CONFIGURATIONS), choices=CONFIGURATIONS)
+    parser.add_argument("--sample-rate", type=float, default=0.01, help="Kept fraction for 'async_sampled'.")
+    parser.add_argument("--output", default="logging_benchmark.json")
+    args = parser.parse_args(argv)
+
+    results = {}
+    with tempfile.TemporaryDirectory() as log_dir:
+        for configuration in args.configurations:
+            results[configuration] = benchmark_configuration(configuration, args.calls, log_dir, args.sample_rate)
+            stats = results[configuration]
+            logger.info(f"{configuration}: mean={stats['mean_ns']:.0f}ns p50={stats['p50_ns']:.0f}ns "
+                        f"p99={stats['p99_ns']:.0f}ns flush={stats['flush_s'] * 1000:.1f}ms")
+
+    report = {"created_at": time.strftime("%Y-%m-%dT%H:%M:%S"), "python": sys.version.split()[0],
+              "sample_rate": args.sample_rate, "results": results}
+    with open(args.output, "w") as f:
+        json.dump(report, f, indent=4)
+    logger.info(f"Logging benchmark results saved to {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,90 @@
+# Compares the native ROUGE engine with rouge_score on speed and agreement.
+#
+# Usage (from the Text_Summarization directory):
+#   python -m src.benchmark.rouge_benchmark --pairs 2000 --output rouge_benchmark.json
+#   python -m src.benchmark.rouge_benchmark --input predictions.jsonl   # {"reference", "candidate"} records
+#
+# Exits with code 1 when any score differs by more than --tolerance.
+import argparse
+import json
+import random
+import sys
+import time
+from src.benchmark.summarizer_benchmark import latency_summary, synthetic_document
+from src.components.rouge_engine import NativeRougeScorer
+from src.utils.helpers import read_jsonl
+from src.utils.logging_setup import logger
+from rouge_score import rouge_scorer
+
+ROUGE_TYPES = ["rouge1", "rouge2", "rougeL"]
+
+
+def synthetic_pairs(count: int, seed: int = 0) -> list[tuple[str, str]]:
+    """
+    (reference, candidate) pairs of varied length with partial overlap.
+    """
+    rng = random.Random(seed)
+    pairs = []
+    for index in range(count):
+        reference = synthetic_document(rng.randint(1, 12), seed=seed + 2 * index)
+        sentences = reference.split(". ")
+        candidate = ". ".join(rng.sample(sentences, rng.randint(1, len(sentences))))
+        candidate += " " + synthetic_document(rng.randint(0, 4), seed=seed + 2 * index + 1)
+        pairs.append((reference, candidate))
+    return pairs
+
+
+def compare_engines(pairs: list[tuple[str, str]], rouge_types: list[str] = ROUGE_TYPES) -> dict:
+    """
+    Scores every pair with both engines; reports timings and the largest absolute score difference.
+    """
+    reference_scorer = rouge_scorer.RougeScorer(rouge_types, use_stemmer=True)
+    native_scorer = NativeRougeScorer(rouge_types, use_stemmer=True)
+    results, timings = {}, {}
+    for name, scorer in (("rouge_score", reference_scorer), ("native", native_scorer)):
+        latencies = []
+        start = time.perf_counter()
+        for reference, candidate in pairs:
+            call_start = time.perf_counter()
+            results.setdefault(name, []).append(scorer.score(reference, candidate))
+            latencies.append(time.perf_counter() - call_start)
+        timings[name] = latency_summary(latencies, time.perf_counter() - start)
+
+    max_diff = {rouge_type: 0.0 for rouge_type in rouge_types}
+    for expected, actual in zip(results["rouge_score"], results["native"]):
+        for rouge_type in rouge_types:
+            difference = max(abs(e - a) for e, a in zip(expected[rouge_type], actual[rouge_type]))
+            max_diff[rouge_type] = max(max_diff[rouge_type], difference)
+    speedup = timings["native"]["throughput_per_sec"] / max(timings["rouge_score"]["throughput_per_sec"], 1e-12)
+    return {"pairs": len(pairs), "engines": timings, "max_abs_diff": max_diff, "speedup": speedup}
+
+
+def main(argv: list[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="Check the native ROUGE engine against rouge_score.")
+    parser.add_argument("--pairs", type=int, default=1000, help="Synthetic pairs when --input is not given.")
+    parser.add_argument("--input", help="JSONL file of {\"reference\", \"candidate\"} records.")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--tolerance", type=float, default=1e-9)
+    parser.add_argument("--output", default="rouge_benchmark.json")
+    args = parser.parse_args(argv)
+
+    if args.input:
+        pairs = [(r.get("reference", ""), r.get("candidate", "")) for r in read_jsonl(args.input)]
+    else:
+        pairs = synthetic_pairs(args.pairs, args.seed)
+    report = compare_engines(pairs)
+    report["tolerance"] = args.tolerance
+    report["mismatch"] = any(diff > args.tolerance for diff in report["max_abs_diff"].values())
+
+    with open(args.output, "w") as f:
+        json.dump(report, f, indent=4)
+    logger.info(f"ROUGE engines over {report['pairs']} pairs: native is {report['speedup']:.1f}x faster, "
+                f"max abs diff {max(report['max_abs_diff'].values()):.2e}. Saved to {args.output}")
+    if report["mismatch"]:
+        logger.error(f"Native ROUGE scores differ from rouge_score by more than {args.tolerance}: {report['max_abs_diff']}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,257 @@
+# Benchmark harness for the summarizers registered in SummarizerFactory.
+#
+# Usage (from the Text_Summarization directory):
+#   python -m src.benchmark.summarizer_benchmark --sizes 10 50 200 --output benchmark_results.json
+#   python -m src.benchmark.summarizer_benchmark --input-dir data/01_raw --baseline benchmark_baseline.json
+import argparse
+import json
+import logging
+import multiprocessing
+import os
+import pathlib
+import platform
+import random
+import resource
+import sys
+import time
+import numpy as np
+
+# Benchmarks must be reproducible offline on CPU: never reach the model hub or a GPU.
+os.environ.setdefault("HF_HUB_OFFLINE", "1")
+os.environ.setdefault("TRANSFORMERS_OFFLINE", "1")
+os.environ.setdefault("CUDA_VISIBLE_DEVICES", "")
+
+from src.utils.logging_setup import logger
+
+SYNTHETIC_VOCABULARY = (
+    "the moon sun earth eclipse light shadow orbit planet corona observer phase total partial "
+    "annular hybrid ring fire sky twilight disk alignment event rare safe viewing glasses damage "
+    "model data system network result method analysis report market policy research energy"
+).split()
+
+
+def percentile(values: list[float], q: float) -> float:
+    """
+    Linear-interpolated percentile (q in 0-100) of a list of numbers.
+    """
+    if not values:
+        return 0.0
+    return float(np.percentile(np.asarray(values, dtype=float), q))
+
+
+def latency_summary(latencies: list[float], elapsed: float = None) -> dict:
+    """
+    Summarizes per-call latencies (seconds) as milliseconds percentiles and throughput.
+    """
+    elapsed = elapsed if elapsed is not None else sum(latencies)
+    return {
+        "runs": len(latencies),
+        "p50_ms": percentile(latencies, 50) * 1000,
+        "p95_ms": percentile(latencies, 95) * 1000,
+        "p99_ms": percentile(latencies, 99) * 1000,
+        "mean_ms": (sum(latencies) / len(latencies) * 1000) if latencies else 0.0,
+        "throughput_per_sec": len(latencies) / elapsed if elapsed > 0 else 0.0,
+    }
+
+
+def peak_rss_mb() -> float:
+    """
+    Peak resident set size of the current process in MiB.
+    """
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is reported in bytes on macOS and in kilobytes elsewhere.
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def synthetic_document(num_sentences: int, seed: int = 0) -> str:
+    """
+    Builds a deterministic pseudo-random document with `num_sentences` sentences.
+    """
+    rng = random.Random(seed)
+    sentences = []
+    for _ in range(num_sentences):
+        words = rng.choices(SYNTHETIC_VOCABULARY, k=rng.randint(8, 24))
+        sentences.append(" ".join(words).capitalize() + ".")
+    return " ".join(sentences)
+
+
+def build_cases(sizes: list[int], input_dir: str = None, docs_per_case: int = 5) -> list[dict]:
+    """
+    Returns benchmark cases ordered by increasing document size.
+    Synthetic cases hold `docs_per_case` documents of each size; every *.txt
+    file under `input_dir` becomes its own case.
+    """
+    cases = [
+        {"name": f"synthetic_{size}", "documents": [synthetic_document(size, seed) for seed in range(docs_per_case)]}
+        for size in sorted(sizes)
+    ]
+    if input_dir:
+        files = sorted(pathlib.Path(input_dir).rglob("*.txt"), key=lambda p: p.stat().st_size)
+        for path in files:
+            cases.append({"name": f"file_{path.name}", "documents": [path.read_text(encoding="utf-8")]})
+    return cases
+
+
+def _method_kwargs(method: str, num_sentences: int) -> dict:
+    if method == "t5":
+        # Measure the production path: the generation policy sizes the summary from the input.
+        return {}
+    return {"num_sentences": num_sentences}
+
+
+def _benchmark_method(method: str, cases: list[dict], repeats: int, num_sentences: int,
+                      language: str, log_level: str) -> dict:
+    """
+    Runs in a fresh process so that model load time and peak RSS belong to one method.
+    """
+    logging.getLogger().setLevel(log_level)
+    logger.setLevel(log_level)
+    from src.modules.text_preprocessing import TextProcessor
+    from src.factory.summarizer_factory import SummarizerFactory
+
+    factory = SummarizerFactory(TextProcessor(language))
+    rss_before_load = peak_rss_mb()
+    start = time.perf_counter()
+    summarizer = factory.get_summarizer(method)
+    result = {
+        "method": method,
+        "available": summarizer.available,
+        "load_time_s": time.perf_counter() - start,
+        "load_rss_mb": peak_rss_mb() - rss_before_load,
+        "cases": {},
+    }
+    if not summarizer.available:
+        logger.warning(f"Summarizer '{method}' is unavailable offline. Skipping timings.")
+        result["peak_rss_mb"] = peak_rss_mb()
+        return result
+
+    kwargs = _method_kwargs(method, num_sentences)
+    summarizer.summarize(cases[0]["documents"][0], **kwargs)  # warm-up
+
+    for case in cases:
+        latencies = []
+        case_start = time.perf_counter()
+        for _ in range(repeats):
+            for document in case["documents"]:
+                call_start = time.perf_counter()
+                summarizer.summarize(document, **kwargs)
+                latencies.append(time.perf_counter() - call_start)
+        stats = latency_summary(latencies, time.perf_counter() - case_start)
+        stats["docs_per_sec"] = stats.pop("throughput_per_sec")
+        stats["avg_chars"] = sum(len(d) for d in case["documents"]) / len(case["documents"])
+        stats["peak_rss_mb"] = peak_rss_mb()
+        result["cases"][case["name"]] = stats
+        logger.info(f"{method}/{case['name']}: p50={stats['p50_ms']:.2f}ms p95={stats['p95_ms']:.2f}ms "
+                    f"{stats['docs_per_sec']:.2f} docs/s")
+
+    result["peak_rss_mb"] = peak_rss_mb()
+    return result
+
+
+def run_benchmark(methods: list[str], cases: list[dict], repeats: int = 3, num_sentences: int = 3,
+                  language: str = "english", log_level: str = "WARNING") -> dict:
+    """
+    Benchmarks each method in its own spawned process and returns a JSON-serializable report.
+    """
+    context = multiprocessing.get_context("spawn")
+    results = {}
+    for method in methods:
+        logger.info(f"Benchmarking summarizer '{method}'...")
+        with context.Pool(1) as pool:
+            try:
+                results[method] = pool.apply(
+                    _benchmark_method, (method, cases, repeats, num_sentences, language, log_level))
+            except Exception as e:
+                logger.error(f"Benchmark of '{method}' failed: {e}", exc_info=True)
+                results[method] = {"method": method, "available": False, "error": str(e), "cases": {}}
+
+    return {
+        "created_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "environment": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+        },
+        "settings": {"repeats": repeats, "num_sentences": num_sentences, "language": language,
+                     "cases": [{"name": c["name"], "documents": len(c["documents"])} for c in cases]},
+        "methods": results,
+    }
+
+
+def compare_to_baseline(report: dict, baseline: dict, tolerance: float = 0.2) -> list[dict]:
+    """
+    Flags metrics that got worse than the baseline by more than `tolerance` (relative).
+    Latency and memory regress upwards, throughput regresses downwards. Changes
+    smaller than a per-metric absolute floor are treated as noise.
+    """
+    # (metric, direction, absolute noise floor)
+    checks = (("p95_ms", 1, 1.0), ("p99_ms", 1, 1.0), ("peak_rss_mb", 1, 10.0), ("docs_per_sec", -1, 0.0))
+    regressions = []
+
+    def check(method, case, metric, direction, floor, base_value, value):
+        if not base_value or value is None:
+            return
+        delta = (value - base_value) * direction
+        if delta > floor and delta / base_value > tolerance:
+            regressions.append({"method": method, "case": case, "metric": metric,
+                                "baseline": base_value, "current": value})
+
+    for method, result in report["methods"].items():
+        base_result = baseline.get("methods", {}).get(method)
+        if not base_result:
+            continue
+        check(method, None, "load_time_s", 1, 0.05, base_result.get("load_time_s"), result.get("load_time_s"))
+        for case, stats in result.get("cases", {}).items():
+            base_stats = base_result.get("cases", {}).get(case)
+            if not base_stats:
+                continue
+            for metric, direction, floor in checks:
+                check(method, case, metric, direction, floor, base_stats.get(metric), stats.get(metric))
+    return regressions
+
+
+def main(argv: list[str] = None) -> int:
+    from src.factory.summarizer_factory import SummarizerFactory
+
+    all_methods = list(SummarizerFactory(text_processor=None)._summarizer_map)
+    parser = argparse.ArgumentParser(description="Benchmark latency, throughput and memory of each summarizer.")
+    parser.add_argument("--methods", nargs="+", default=all_methods, choices=all_methods)
+    parser.add_argument("--sizes", nargs="+", type=int, default=[10, 50, 200],
+                        help="Synthetic document sizes in sentences.")
+    parser.add_argument("--docs-per-case", type=int, default=5)
+    parser.add_argument("--input-dir", help="Directory of *.txt documents to benchmark as well.")
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--num-sentences", type=int, default=3,
+                        help="Summary length of extractive methods; t5 sizes its summary with its generation policy.")
+    parser.add_argument("--language", default="english")
+    parser.add_argument("--output", default="benchmark_results.json")
+    parser.add_argument("--baseline", help="Previous results JSON to compare against.")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="Relative slack before flagging a regression.")
+    parser.add_argument("--save-baseline", action="store_true", help="Also write the results to --baseline.")
+    parser.add_argument("--log-level", default="WARNING")
+    args = parser.parse_args(argv)
+
+    cases = build_cases(args.sizes, args.input_dir, args.docs_per_case)
+    report = run_benchmark(args.methods, cases, args.repeats, args.num_sentences, args.language, args.log_level)
+
+    if args.baseline and os.path.exists(args.baseline) and not args.save_baseline:
+        with open(args.baseline, "r") as f:
+            report["regressions"] = compare_to_baseline(report, json.load(f), args.tolerance)
+        for regression in report["regressions"]:
+            logger.warning(f"Regression in {regression['method']}/{regression['case']} {regression['metric']}: "
+                           f"{regression['baseline']:.4f} -> {regression['current']:.4f}")
+
+    with open(args.output, "w") as f:
+        json.dump(report, f, indent=4)
+    logger.info(f"Benchmark results saved to {args.output}")
+
+    if args.save_baseline and args.baseline:
+        with open(args.baseline, "w") as f:
+            json.dump(report, f, indent=4)
+        logger.info(f"Baseline saved to {args.baseline}")
+
+    return 1 if report.get("regressions") else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,228 @@
+# Persistent per-document sentence embedding indexes for query-focused summarization.
+#
+# Layout (one directory per document, named by a hash of its content and the
+# model/preprocessing that produced it):
+#   <root>/<key>/embeddings.f32   row-major float32 (count x dim), rows L2-normalized
+#   <root>/<key>/meta.json        count, dim, the indexed sentences and caller metadata
+# The mtime of meta.json records the last use; least recently used indexes are
+# deleted once the directory grows past its size cap.
+import hashlib
+import json
+import os
+import pathlib
+import shutil
+import tempfile
+import time
+from collections import OrderedDict
+from threading import Lock
+import numpy as np
+from src.constants.constants import (
+    EMBEDDING_INDEX_DIR_ENV,
+    EMBEDDING_INDEX_DIR_NAME,
+    EMBEDDING_INDEX_DISK_MAX_BYTES,
+    EMBEDDING_INDEX_OPEN_MAX,
+)
+from src.utils.logging_setup import logger, request_logger
+
+EMBEDDINGS_FILE = "embeddings.f32"
+META_FILE = "meta.json"
+
+
+def _default_root() -> str:
+    """
+    Per-user cache directory, so indexes are neither shared with other users
+    nor written to a world-writable location.
+    """
+    if os.environ.get(EMBEDDING_INDEX_DIR_ENV):
+        return os.environ[EMBEDDING_INDEX_DIR_ENV]
+    cache_home = os.environ.get("XDG_CACHE_HOME") or str(pathlib.Path.home() / ".cache")
+    return os.path.join(cache_home, EMBEDDING_INDEX_DIR_NAME)
+
+
+def normalize_rows(vectors: np.ndarray) -> np.ndarray:
+    vectors = np.asarray(vectors, dtype=np.float32)
+    norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+    return vectors / np.maximum(norms, 1e-12)
+
+
+def top_k(scores: np.ndarray, k: int) -> np.ndarray:
+    """
+    Indices of the `k` highest scores, best first, in O(n + k log k).
+    """
+    k = min(k, len(scores))
+    if k <= 0:
+        return np.empty(0, dtype=np.int64)
+    candidates = np.argpartition(scores, len(scores) - k)[len(scores) - k:]
+    return candidates[np.argsort(scores[candidates])[::-1]]
+
+
+class DocumentEmbeddingIndex:
+    """
+    Sentence embeddings of one document, memory-mapped read-only, so an index
+    costs no heap memory and pages are shared between processes.
+    """
+    def __init__(self, path: str):
+        self.path = path
+        with open(os.path.join(path, META_FILE), "r", encoding="utf-8") as f:
+            self.meta = json.load(f)
+        self.sentences = self.meta["sentences"]
+        count, dim = self.meta["count"], self.meta["dim"]
+        self.embeddings = (np.memmap(os.path.join(path, EMBEDDINGS_FILE), dtype=np.float32, mode="r", shape=(count, dim))
+                           if count else np.empty((0, dim), dtype=np.float32))
+
+    def search(self, query_embedding: np.ndarray, k: int) -> tuple[np.ndarray, np.ndarray]:
+        """
+        (indices, cosine similarities) of the `k` sentences closest to the query, best first.
+        """
+        scores = self.embeddings @ normalize_rows(query_embedding).reshape(-1)
+        indices = top_k(scores, k)
+        return indices, scores[indices]
+
+
+class EmbeddingIndexStore:
+    """
+    Directory of per-document embedding indexes. An index is built once per
+    document (and model) and reused by every later query on it, from this or
+    another process; recently used indexes also stay open in memory. After each
+    build, the least recently used indexes are deleted until the directory
+    holds at most `max_bytes`.
+    """
+    def __init__(self, root: str = None, max_open: int = EMBEDDING_INDEX_OPEN_MAX,
+                 max_bytes: int = EMBEDDING_INDEX_DISK_MAX_BYTES):
+        self.root = root or _default_root()
+        self.max_open = max_open
+        self.max_bytes = max_bytes
+        self._open = OrderedDict()
+        self._lock = Lock()
+        self._build_locks = {}
+
+    @staticmethod
+    def make_key(text: str, **variant) -> str:
+        """
+        Index key of a document: its content plus whatever shaped the
+        embeddings (model name, language, preprocessing settings).
+        """
+        payload = json.dumps(variant, sort_keys=True, default=str)
+        return hashlib.sha256(f"{payload}\0{text}".encode("utf-8")).hexdigest()
+
+    def _remember(self, key: str, index: DocumentEmbeddingIndex) -> DocumentEmbeddingIndex:
+        with self._lock:
+            self._open[key] = index
+            self._open.move_to_end(key)
+            while len(self._open) > self.max_open:
+                self._open.popitem(last=False)
+        return index
+
+    def _touch(self, key: str) -> None:
+        try:
+            os.utime(os.path.join(self.root, key, META_FILE))
+        except OSError:
+            pass
+
+    def get(self, key: str):
+        """
+        The index stored under `key`, or None.
+        """
+        with self._lock:
+            index = self._open.get(key)
+            if index is not None:
+                self._open.move_to_end(key)
+        if index is None:
+            path = os.path.join(self.root, key)
+            try:
+                index = DocumentEmbeddingIndex(path)
+            except (OSError, ValueError):
+                # Missing, or pruned by another process while being opened.
+                return None
+            self._remember(key, index)
+        self._touch(key)
+        return index
+
+    def get_or_build(self, key: str, build) -> DocumentEmbeddingIndex:
+        """
+        Returns the index under `key`, calling `build()` -> (sentences, embeddings,
+        metadata) to create it on first use. `metadata` (e.g. sentence offsets) is
+        stored in meta.json. Concurrent callers wait for a single build.
+        """
+        index = self.get(key)
+        if index is not None:
+            request_logger.info("Reusing embedding index %s.", key[:12])
+            return index
+        with self._lock:
+            build_lock = self._build_locks.setdefault(key, Lock())
+        with build_lock:
+            index = self.get(key)
+            if index is None:
+                start = time.perf_counter()
+                sentences, embeddings, metadata = build()
+                index = self._remember(key, self._write(key, sentences, embeddings, metadata))
+                logger.info(f"Built embedding index {key[:12]} ({len(sentences)} sentences) in {time.perf_counter() - start:.2f}s.")
+                self.prune(keep=key)
+        with self._lock:
+            self._build_locks.pop(key, None)
+        return index
+
+    def _write(self, key: str, sentences: list[str], embeddings: np.ndarray, metadata: dict = None) -> DocumentEmbeddingIndex:
+        embeddings = (normalize_rows(embeddings).reshape(len(sentences), -1) if sentences
+                      else np.empty((0, 0), dtype=np.float32))
+        os.makedirs(self.root, exist_ok=True)
+        staging_dir = tempfile.mkdtemp(prefix=".staging-", dir=self.root)
+        try:
+            embeddings.tofile(os.path.join(staging_dir, EMBEDDINGS_FILE))
+            meta = {**(metadata or {}), "count": len(sentences), "dim": int(embeddings.shape[1]), "sentences": sentences,
+                    "created_at": time.strftime("%Y-%m-%dT%H:%M:%S")}
+            with open(os.path.join(staging_dir, META_FILE), "w", encoding="utf-8") as f:
+                json.dump(meta, f, ensure_ascii=False)
+            path = os.path.join(self.root, key)
+            try:
+                os.replace(staging_dir, path)
+            except OSError:
+                # Another process published the same index first; keep theirs.
+                shutil.rmtree(staging_dir, ignore_errors=True)
+            return DocumentEmbeddingIndex(path)
+        except Exception:
+            shutil.rmtree(staging_dir, ignore_errors=True)
+            raise
+
+    def prune(self, keep: str = None) -> int:
+        """
+        Deletes the least recently used indexes (except `keep`) until the
+        directory holds at most `max_bytes`; returns how many were deleted.
+        Runs after builds, which cost far more than listing the directory.
+        """
+        entries, total = [], 0
+        try:
+            names = os.listdir(self.root)
+        except OSError:
+            return 0
+        for name in names:
+            if name.startswith("."):
+                continue
+            path = os.path.join(self.root, name)
+            try:
+                used_at = os.stat(os.path.join(path, META_FILE)).st_mtime
+                size = sum(entry.stat().st_size for entry in os.scandir(path) if entry.is_file())
+            except OSError:
+                continue
+            entries.append((used_at, name, size))
+            total += size
+        removed = 0
+        for _, name, size in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            if name == keep:
+                continue
+            self.remove(name)
+            total -= size
+            removed += 1
+        if removed:
+            logger.info(f"Pruned {removed} least recently used embedding indexes from {self.root}.")
+        return removed
+
+    def remove(self, key: str) -> None:
+        with self._lock:
+            self._open.pop(key, None)
+        shutil.rmtree(os.path.join(self.root, key), ignore_errors=True)
+
+
+embedding_index_store = EmbeddingIndexStore()
@@ -1,20 +1,121 @@
 
+import math
+import os
 import re
-from src.utils.logging_setup import logger
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+from dataclasses import dataclass
+from itertools import islice
+from statistics import NormalDist
+from src.utils.logging_setup import logger, request_logger
+from src.utils.helpers import read_jsonl
+from src.constants.constants import ROUGE_ENGINE, ROUGE_ENGINES
+from src.components.rouge_engine import NativeRougeScorer
 from rouge_score import rouge_scorer
 from nltk.translate.bleu_score import sentence_bleu, SmoothingFunction
 
 
+METRIC_NAMES = ("rouge1", "rouge2", "rougeL", "bleu")
+
+
+@dataclass
+class PreparedReference:
+    """
+    A reference summary tokenized once for ROUGE (n-grams) and BLEU so it can
+    be scored against any number of candidates. With the native ROUGE engine
+    `rouge_tokens` is unused and `native` holds the prepared reference.
+    """
+    rouge_tokens: list[str]
+    unigrams: object
+    bigrams: object
+    bleu_tokens: list[str]
+    native: object = None
+
+
+class MetricAggregator:
+    """
+    Streaming mean/variance (Welford) per group and metric, with normal
+    approximation confidence intervals. Memory does not grow with corpus size.
+    """
+    def __init__(self, confidence: float = 0.95):
+        self.confidence = confidence
+        self._stats = defaultdict(lambda: defaultdict(lambda: [0, 0.0, 0.0]))
+        self.errors = defaultdict(int)
+
+    def add(self, group: str, metrics: dict) -> None:
+        if metrics.get("evaluation_status") != "success":
+            self.errors[group] += 1
+            return
+        for name in METRIC_NAMES:
+            value = metrics.get(name)
+            if value is None:
+                continue
+            state = self._stats[group][name]
+            state[0] += 1
+            delta = value - state[1]
+            state[1] += delta / state[0]
+            state[2] += delta * (value - state[1])
+
+    def state(self) -> dict:
+        """
+        JSON-serializable snapshot of the running statistics (for checkpoints).
+        """
+        return {
+            "confidence": self.confidence,
+            "stats": {group: dict(metrics) for group, metrics in self._stats.items()},
+            "errors": dict(self.errors),
+        }
+
+    def load_state(self, state: dict) -> None:
+        """
+        Restores running statistics from a snapshot produced by `state()`.
+        """
+        self.confidence = state.get("confidence", self.confidence)
+        for group, metrics in state.get("stats", {}).items():
+            for name, values in metrics.items():
+                self._stats[group][name] = list(values)
+        for group, count in state.get("errors", {}).items():
+            self.errors[group] = count
+
+    def summary(self) -> dict:
+        z = NormalDist().inv_cdf(0.5 + self.confidence / 2)
+        report = {}
+        for group in sorted(set(self._stats) | set(self.errors)):
+            group_report = {"errors": self.errors.get(group, 0)}
+            for name, (count, mean, m2) in self._stats.get(group, {}).items():
+                std = math.sqrt(m2 / (count - 1)) if count > 1 else 0.0
+                half_width = z * std / math.sqrt(count) if count > 1 else 0.0
+                group_report["count"] = count
+                group_report[name] = {
+                    "mean": mean,
+                    "std": std,
+                    "ci_low": mean - half_width,
+                    "ci_high": mean + half_width,
+                }
+            report[group] = group_report
+        return {"confidence": self.confidence, "results": report}
+
+
 class SummarizationEvaluator:
     """
     A class to evaluate the quality of a generated summary against a reference summary.
+
+    `rouge_engine` selects how ROUGE is computed: 'rouge_score' (the reference
+    implementation) or 'native' (NativeRougeScorer: same scores, integer token
+    ids, NumPy n-gram counting and bit-parallel LCS; much faster on large sweeps).
     """
-    def __init__(self):
+    def __init__(self, rouge_engine: str = ROUGE_ENGINE):
+        if rouge_engine not in ROUGE_ENGINES:
+            raise ValueError(f"Unknown ROUGE engine '{rouge_engine}'. Choose from {ROUGE_ENGINES}.")
+        self.rouge_engine = rouge_engine
+        self.native_scorer = (NativeRougeScorer(['rouge1', 'rouge2', 'rougeL'], use_stemmer=True)
+                              if rouge_engine == "native" else None)
         try:
-            self.scorer = rouge_scorer.RougeScorer(['rouge1', 'rouge2', 'rougeL'], use_stemmer=True)
+            self.scorer = (rouge_scorer.RougeScorer(['rouge1', 'rouge2', 'rougeL'], use_stemmer=True)
+                           if rouge_engine == "rouge_score" else None)
             self.bleu_smoothing = SmoothingFunction().method4
             self.available = True
-            logger.info("SummarizationEvaluator initialized successfully.")
+            logger.info(f"SummarizationEvaluator initialized successfully (ROUGE engine: {rouge_engine}).")
         except ImportError:
             logger.error("Evaluation libraries (rouge_score or nltk) not found. Evaluation will be disabled.")
             self.available = False
@@ -25,6 +126,54 @@ class SummarizationEvaluator:
         text = ' '.join(text.split())
         return text
 
+    def prepare_reference(self, reference_summary: str) -> PreparedReference:
+        """
+        Tokenizes a reference once for reuse across many candidates.
+        """
+        if self.native_scorer is not None:
+            return PreparedReference(rouge_tokens=None, unigrams=None, bigrams=None,
+                                     bleu_tokens=self._normalize_text(reference_summary).split(),
+                                     native=self.native_scorer.prepare(reference_summary))
+        # rouge_score has no public API for scoring prepared n-grams; these private
+        # helpers are why requirements.txt pins its version (tests/test_rouge_parity.py).
+        rouge_tokens = self.scorer._tokenizer.tokenize(reference_summary)
+        return PreparedReference(
+            rouge_tokens=rouge_tokens,
+            unigrams=rouge_scorer._create_ngrams(rouge_tokens, 1),
+            bigrams=rouge_scorer._create_ngrams(rouge_tokens, 2),
+            bleu_tokens=self._normalize_text(reference_summary).split(),
+        )
+
+    def _score_rouge(self, reference: PreparedReference, generated_summary: str) -> dict:
+        candidate_rouge_tokens = self.scorer._tokenizer.tokenize(generated_summary)
+        return {
+            "rouge1": rouge_scorer._score_ngrams(
+                reference.unigrams, rouge_scorer._create_ngrams(candidate_rouge_tokens, 1)).fmeasure,
+            "rouge2": rouge_scorer._score_ngrams(
+                reference.bigrams, rouge_scorer._create_ngrams(candidate_rouge_tokens, 2)).fmeasure,
+            "rougeL": rouge_scorer._score_lcs(reference.rouge_tokens, candidate_rouge_tokens).fmeasure,
+        }
+
+    def _score_prepared(self, reference: PreparedReference, generated_summary: str) -> dict:
+        if reference.native is not None:
+            scores = self.native_scorer.score_prepared(reference.native, generated_summary)
+            metrics = {name: score.fmeasure for name, score in scores.items()}
+        else:
+            metrics = self._score_rouge(reference, generated_summary)
+
+        candidate_tokens = self._normalize_text(generated_summary).split()
+
+        # Handle cases where candidate or reference tokens are empty
+        if not candidate_tokens or not reference.bleu_tokens:
+            bleu_score = 0.0
+            request_logger.debug("Empty candidate or reference tokens for BLEU calculation. BLEU score set to 0.0.")
+        else:
+            bleu_score = sentence_bleu([reference.bleu_tokens], candidate_tokens, smoothing_function=self.bleu_smoothing)
+
+        metrics["bleu"] = bleu_score
+        metrics["evaluation_status"] = "success"
+        return metrics
+
     def evaluate_summary(self, generated_summary: str, reference_summary: str) -> dict:
         """
         Computes ROUGE and BLEU scores for a generated summary.
@@ -33,33 +182,126 @@ class SummarizationEvaluator:
             logger.warning("Evaluation libraries are not available. Skipping evaluation.")
             return {"evaluation_status": "skipped", "message": "Evaluation libraries not installed."}
 
-        logger.info("Starting evaluation of generated summary.")
-        logger.debug(f"Generated: '{generated_summary}'")
-        logger.debug(f"Reference: '{reference_summary}'")
+        request_logger.info("Starting evaluation of generated summary.")
+        logger.debug("Generated: '%s'", generated_summary)
+        logger.debug("Reference: '%s'", reference_summary)
 
         try:
-            rouge_results = self.scorer.score(reference_summary, generated_summary)
-            metrics = {
-                "rouge1": rouge_results["rouge1"].fmeasure,
-                "rouge2": rouge_results["rouge2"].fmeasure,
-                "rougeL": rouge_results["rougeL"].fmeasure
-            }
-
-            reference_tokens = self._normalize_text(reference_summary).split()
-            candidate_tokens = self._normalize_text(generated_summary).split()
-
-            # Handle cases where candidate or reference tokens are empty
-            if not candidate_tokens or not reference_tokens:
-                 bleu_score = 0.0
-                 logger.warning("Empty candidate or reference tokens for BLEU calculation. BLEU score set to 0.0.")
-            else:
-                 bleu_score = sentence_bleu([reference_tokens], candidate_tokens, smoothing_function=self.bleu_smoothing)
-
-            metrics["bleu"] = bleu_score
-            metrics["evaluation_status"] = "success"
-            logger.info("Evaluation complete. Metrics calculated.")
+            metrics = self._score_prepared(self.prepare_reference(reference_summary), generated_summary)
+            request_logger.info("Evaluation complete. Metrics calculated.")
             return metrics
         except Exception as e:
             logger.error(f"Error during summary evaluation: {e}", exc_info=True)
             return {"evaluation_status": "error", "error_message": str(e)}
 
+    def evaluate_many_candidates(self, candidates: dict[str, str], reference_summary: str) -> dict[str, dict]:
+        """
+        Scores several candidates (e.g. one per method) against the same reference,
+        preparing the reference only once.
+        """
+        if not self.available:
+            logger.warning("Evaluation libraries are not available. Skipping evaluation.")
+            return {name: {"evaluation_status": "skipped", "message": "Evaluation libraries not installed."}
+                    for name in candidates}
+
+        try:
+            reference = self.prepare_reference(reference_summary)
+        except Exception as e:
+            logger.error(f"Error preparing reference summary: {e}", exc_info=True)
+            return {name: {"evaluation_status": "error", "error_message": str(e)} for name in candidates}
+
+        results = {}
+        for name, candidate in candidates.items():
+            try:
+                results[name] = self._score_prepared(reference, candidate)
+            except Exception as e:
+                logger.error(f"Error evaluating candidate '{name}': {e}", exc_info=True)
+                results[name] = {"evaluation_status": "error", "error_message": str(e)}
+        return results
+
+    def evaluate_corpus(self, records, workers: int = None, chunk_size: int = 256,
+                        confidence: float = 0.95, reference_key: str = "reference",
+                        candidate_key: str = "candidate", candidates_key: str = "candidates") -> dict:
+        """
+        Evaluates a corpus of records and returns corpus-level aggregates with
+        confidence intervals per candidate group.
+
+        Args:
+            records: Path to a JSONL file or an iterable of dicts. Each record has a
+                reference and either a single candidate or a mapping of candidates
+                (e.g. {"t5": "...", "lsa": "..."}).
+            workers (int): Worker processes. Defaults to the CPU count; 1 scores in-process.
+            chunk_size (int): Records sent to a worker per task.
+            confidence (float): Confidence level of the reported intervals.
+        """
+        if not self.available:
+            logger.warning("Evaluation libraries are not available. Skipping evaluation.")
+            return {"evaluation_status": "skipped", "message": "Evaluation libraries not installed."}
+
+        if isinstance(records, (str, os.PathLike)):
+            records = read_jsonl(records)
+        records = iter(records)
+        workers = workers or os.cpu_count() or 1
+        keys = (reference_key, candidate_key, candidates_key)
+        aggregator = MetricAggregator(confidence)
+        num_records = 0
+
+        chunks = iter(lambda: list(islice(records, chunk_size)), [])
+        logger.info(f"Starting corpus evaluation with {workers} worker(s), chunk size {chunk_size}.")
+
+        if workers == 1:
+            for chunk in chunks:
+                for groups in _score_records(self, chunk, keys):
+                    num_records += 1
+                    for group, metrics in groups.items():
+                        aggregator.add(group, metrics)
+        else:
+            # Keep a bounded number of chunks in flight so memory stays flat.
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(self.rouge_engine,)) as executor:
+                pending = set()
+                for chunk in chunks:
+                    pending.add(executor.submit(_score_chunk, chunk, keys))
+                    if len(pending) >= workers * 2:
+                        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                        num_records += _collect(done, aggregator)
+                done, _ = wait(pending)
+                num_records += _collect(done, aggregator)
+
+        report = aggregator.summary()
+        report["num_records"] = num_records
+        report["evaluation_status"] = "success"
+        logger.info(f"Corpus evaluation complete over {num_records} records.")
+        return report
+
+
+_worker_evaluator = None
+
+
+def _init_worker(rouge_engine: str = ROUGE_ENGINE):
+    global _worker_evaluator
+    _worker_evaluator = SummarizationEvaluator(rouge_engine)
+
+
+def _score_records(evaluator: SummarizationEvaluator, chunk: list[dict], keys: tuple) -> list[dict]:
+    reference_key, candidate_key, candidates_key = keys
+    scored = []
+    for record in chunk:
+        candidates = record.get(candidates_key)
+        if candidates is None:
+            candidates = {"candidate": record.get(candidate_key, "")}
+        scored.append(evaluator.evaluate_many_candidates(candidates, record.get(reference_key, "")))
+    return scored
+
+
+def _score_chunk(chunk: list[dict], keys: tuple) -> list[dict]:
+    return _score_records(_worker_evaluator, chunk, keys)
+
+
+def _collect(futures, aggregator: MetricAggregator) -> int:
+    count = 0
+    for future in futures:
+        for groups in future.result():
+            count += 1
+            for group, metrics in groups.items():
+                aggregator.add(group, metrics)
+    return count
@@ -0,0 +1,88 @@
+from dataclasses import dataclass
+from src.constants.constants import (
+    T5_DEFAULT_PRESET,
+    T5_GENERATION_MAX_TIME,
+    T5_GENERATION_PRESETS,
+    T5_LENGTH_CEILING,
+    T5_LENGTH_FLOOR,
+    T5_MAX_LENGTH_RATIO,
+    T5_MIN_LENGTH_RATIO,
+)
+
+
+@dataclass(frozen=True, slots=True)
+class GenerationResult:
+    """
+    A generated summary and what it cost: the measured input length, the
+    length bounds used and the number of decoder steps taken.
+    """
+    summary: str
+    preset: str
+    input_tokens: int
+    min_length: int
+    max_length: int
+    decoder_steps: int
+    seconds: float
+    timed_out: bool
+
+    @property
+    def tokens_per_sec(self) -> float:
+        return self.decoder_steps / self.seconds if self.seconds > 0 else 0.0
+
+    def to_dict(self) -> dict:
+        return {"preset": self.preset, "input_tokens": self.input_tokens, "min_length": self.min_length,
+                "max_length": self.max_length, "decoder_steps": self.decoder_steps, "seconds": self.seconds,
+                "tokens_per_sec": self.tokens_per_sec, "timed_out": self.timed_out}
+
+
+class GenerationPolicy:
+    """
+    Chooses generation settings for an abstractive summary from the measured
+    input length: short inputs get short length bounds (no wasted decoder
+    steps, no padding to a fixed min_length), long ones get room for a longer
+    summary. Decoding settings come from a named preset, and generation stops
+    after `max_time` seconds.
+    """
+    def __init__(self, preset: str = T5_DEFAULT_PRESET, max_ratio: float = T5_MAX_LENGTH_RATIO,
+                 min_ratio: float = T5_MIN_LENGTH_RATIO, floor: int = T5_LENGTH_FLOOR,
+                 ceiling: int = T5_LENGTH_CEILING, max_time: float = T5_GENERATION_MAX_TIME):
+        self.preset = self.check_preset(preset)
+        if not 0 <= min_ratio <= max_ratio:
+            raise ValueError("Length ratios must satisfy 0 <= min_ratio <= max_ratio.")
+        if not 1 <= floor <= ceiling:
+            raise ValueError("Length bounds must satisfy 1 <= floor <= ceiling.")
+        self.max_ratio = max_ratio
+        self.min_ratio = min_ratio
+        self.floor = floor
+        self.ceiling = ceiling
+        self.max_time = max_time
+
+    @staticmethod
+    def check_preset(preset: str) -> str:
+        if preset not in T5_GENERATION_PRESETS:
+            raise ValueError(f"Unknown generation preset '{preset}'. Choose from {sorted(T5_GENERATION_PRESETS)}.")
+        return preset
+
+    def length_bounds(self, input_tokens: int) -> tuple[int, int]:
+        """
+        (min_length, max_length) for an input of `input_tokens` model tokens.
+        """
+        max_length = min(max(round(input_tokens * self.max_ratio), self.floor), self.ceiling)
+        min_length = min(round(input_tokens * self.min_ratio), max_length // 2)
+        return min_length, max_length
+
+    def settings(self, input_tokens: int, max_length: int = None, min_length: int = None,
+                 preset: str = None, max_time: float = None) -> tuple[str, dict]:
+        """
+        (preset name, generate() keyword arguments) for one request. Explicit
+        `max_length`/`min_length` override the adaptive bounds.
+        """
+        preset = self.check_preset(preset or self.preset)
+        adaptive_min, adaptive_max = self.length_bounds(input_tokens)
+        max_length = int(max_length) if max_length is not None else adaptive_max
+        min_length = int(min_length) if min_length is not None else min(adaptive_min, max_length // 2)
+        if max_length < 1 or min_length < 0:
+            raise ValueError("'max_length' must be positive and 'min_length' non-negative.")
+        kwargs = {**T5_GENERATION_PRESETS[preset], "max_length": max_length, "min_length": min(min_length, max_length),
+                  "max_time": max_time if max_time is not None else self.max_time}
+        return preset, kwargs
@@ -0,0 +1,131 @@
+import mmap
+import os
+from src.constants.constants import (
+    HIERARCHICAL_FAN_IN,
+    HIERARCHICAL_SECTION_BYTES,
+    HIERARCHICAL_SENTENCES_PER_SECTION,
+)
+from src.factory.summarizer_factory import SummarizerFactory
+from src.utils.logging_setup import logger
+
+EXTRACTIVE_METHODS = ('tfidf', 'textrank', 'lsa', 'bert_extractive')
+# Preferred section boundaries, best first. All are ASCII, so cutting after
+# one never splits a UTF-8 multi-byte character.
+_BOUNDARIES = (b"\n\n", b"\n", b". ", b"? ", b"! ", b" ")
+
+
+def _find_cut(buffer, start: int, limit: int) -> int:
+    """
+    End offset of the section starting at `start`: the last good boundary in
+    the second half of the next `limit` bytes.
+    """
+    end = start + limit
+    if end >= len(buffer):
+        return len(buffer)
+    lower = start + limit // 2
+    for boundary in _BOUNDARIES:
+        position = buffer.rfind(boundary, lower, end)
+        if position != -1:
+            return position + len(boundary)
+    # No whitespace at all: cut at the limit, backing off to a character boundary.
+    while end > start + 1 and (buffer[end] & 0xC0) == 0x80:
+        end -= 1
+    return end
+
+
+def iter_sections(source, section_bytes: int = HIERARCHICAL_SECTION_BYTES, encoding: str = "utf-8"):
+    """
+    Lazily yields text sections of roughly `section_bytes` from a file path
+    (read through a memory map) or a binary/text file object (read in chunks).
+    Only one section is decoded at a time.
+    """
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+                start = 0
+                while start < len(buffer):
+                    cut = _find_cut(buffer, start, section_bytes)
+                    yield buffer[start:cut].decode(encoding, errors="replace")
+                    start = cut
+        return
+
+    stream = getattr(source, "buffer", source)  # text streams such as sys.stdin
+    pending = b""
+    while True:
+        block = stream.read(section_bytes)
+        if not block:
+            break
+        pending += block.encode(encoding) if isinstance(block, str) else block
+        while len(pending) > section_bytes:
+            cut = _find_cut(pending, 0, section_bytes)
+            yield pending[:cut].decode(encoding, errors="replace")
+            pending = pending[cut:]
+    if pending:
+        yield pending.decode(encoding, errors="replace")
+
+
+class HierarchicalSummarizer:
+    """
+    Summarizes inputs far larger than memory: each section is summarized
+    extractively as it streams by, and section summaries are merged `fan_in`
+    at a time in a tree until one summary remains. Memory is bounded by the
+    section size plus O(fan_in * log(sections)) summary sentences.
+    """
+    def __init__(self, summarizer_factory: SummarizerFactory, method: str = 'textrank',
+                 section_bytes: int = HIERARCHICAL_SECTION_BYTES,
+                 sentences_per_section: int = HIERARCHICAL_SENTENCES_PER_SECTION,
+                 fan_in: int = HIERARCHICAL_FAN_IN):
+        if method.lower() not in EXTRACTIVE_METHODS:
+            raise ValueError(f"Hierarchical summarization needs an extractive method {EXTRACTIVE_METHODS}, got '{method}'.")
+        if fan_in < 2:
+            raise ValueError("fan_in must be at least 2.")
+        self.summarizer = summarizer_factory.get_summarizer(method)
+        self.method = method.lower()
+        self.section_bytes = section_bytes
+        self.sentences_per_section = sentences_per_section
+        self.fan_in = fan_in
+        logger.info(f"HierarchicalSummarizer initialized (method={method}, section_bytes={section_bytes}, fan_in={fan_in}).")
+
+    def _summarize(self, sentences: list[str], num_sentences: int) -> list[str]:
+        return self.summarizer.summarize(" ".join(sentences), num_sentences=num_sentences)
+
+    def _push(self, levels: list[list[list[str]]], level: int, summary: list[str]) -> None:
+        # Like a carry in binary addition: a full level is reduced into the next one.
+        while True:
+            if level == len(levels):
+                levels.append([])
+            levels[level].append(summary)
+            if len(levels[level]) < self.fan_in:
+                return
+            merged = [sentence for node in levels[level] for sentence in node]
+            levels[level] = []
+            summary = self._summarize(merged, self.sentences_per_section)
+            level += 1
+
+    def summarize_sections(self, sections, num_sentences: int = 5) -> list[str]:
+        """
+        Summarizes an iterable of text sections (in document order).
+        """
+        levels = []
+        num_sections = 0
+        for section in sections:
+            num_sections += 1
+            if section.strip():
+                self._push(levels, 0, self.summarizer.summarize(section, num_sentences=self.sentences_per_section))
+            if num_sections % 100 == 0:
+                logger.info(f"Summarized {num_sections} sections ({len(levels)} levels).")
+
+        # Higher levels cover earlier parts of the document.
+        remaining = [sentence for level in reversed(levels) for node in level for sentence in node]
+        logger.info(f"Hierarchical summarization reduced {num_sections} sections over {len(levels)} levels.")
+        if not remaining:
+            return []
+        return self._summarize(remaining, num_sentences)
+
+    def summarize_stream(self, source, num_sentences: int = 5, encoding: str = "utf-8") -> list[str]:
+        """
+        Summarizes a file path (memory-mapped) or a file object (read in chunks).
+        """
+        return self.summarize_sections(iter_sections(source, self.section_bytes, encoding), num_sentences)
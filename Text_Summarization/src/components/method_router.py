@@ -0,0 +1,169 @@
+import contextvars
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from src.constants.constants import (
+    AUTO_DEFAULT_LATENCY_BUDGET,
+    AUTO_METHOD_COST_PRIORS,
+    AUTO_METHOD_QUALITY_ORDER,
+)
+from src.utils.logging_setup import logger, request_logger
+
+
+class MethodCostModel:
+    """
+    Online estimate of a method's latency as a linear function of document length.
+
+    Keeps exponentially decayed sums of (length, seconds) observations and fits
+    `seconds = intercept + slope * kchars` by weighted least squares, so recent
+    timings dominate and the estimate follows changes in load or hardware.
+    """
+    def __init__(self, intercept: float, slope: float, decay: float = 0.95, min_samples: int = 3):
+        self.prior_intercept = intercept
+        self.prior_slope = slope
+        self.decay = decay
+        self.min_samples = min_samples
+        self.samples = 0
+        self._w = self._wx = self._wy = self._wxx = self._wxy = 0.0
+
+    def update(self, kchars: float, seconds: float) -> None:
+        d = self.decay
+        self._w = self._w * d + 1.0
+        self._wx = self._wx * d + kchars
+        self._wy = self._wy * d + seconds
+        self._wxx = self._wxx * d + kchars * kchars
+        self._wxy = self._wxy * d + kchars * seconds
+        self.samples += 1
+
+    def coefficients(self) -> tuple[float, float]:
+        if self.samples < self.min_samples:
+            return self.prior_intercept, self.prior_slope
+
+        mean_x = self._wx / self._w
+        mean_y = self._wy / self._w
+        var_x = self._wxx / self._w - mean_x * mean_x
+        if var_x <= 1e-9:
+            # All observations had (nearly) the same length: keep the prior
+            # overhead and attribute the rest of the mean latency to length.
+            intercept = min(self.prior_intercept, mean_y)
+            slope = (mean_y - intercept) / mean_x if mean_x > 0 else self.prior_slope
+            return intercept, max(slope, 0.0)
+
+        slope = max((self._wxy / self._w - mean_x * mean_y) / var_x, 0.0)
+        intercept = max(mean_y - slope * mean_x, 0.0)
+        return intercept, slope
+
+    def estimate(self, kchars: float) -> float:
+        intercept, slope = self.coefficients()
+        return intercept + slope * kchars
+
+
+class LatencyBudgetRouter:
+    """
+    Picks the best-quality summarization method that fits a latency budget.
+
+    Methods are tried in `quality_order`. The selected method runs on a worker
+    thread; if it has not finished when only enough time remains for the
+    cheapest method, the cheapest method is run instead and its result returned.
+    The abandoned run keeps going in the background and still updates the
+    timing statistics, so the router learns from slow calls. A run still queued
+    when its caller has already fallen back is skipped, so abandoned work
+    cannot hold the worker pool (one worker per method by default).
+    """
+    def __init__(self, summarizer_factory, quality_order: list[str] = None,
+                 cost_priors: dict = None, safety_factor: float = 1.2, max_workers: int = None):
+        self.summarizer_factory = summarizer_factory
+        self.quality_order = list(quality_order or AUTO_METHOD_QUALITY_ORDER)
+        priors = cost_priors or AUTO_METHOD_COST_PRIORS
+        self.cost_models = {
+            method: MethodCostModel(*priors.get(method, (0.0, 0.0)))
+            for method in self.quality_order
+        }
+        self.safety_factor = safety_factor
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=max_workers or len(self.quality_order),
+                                            thread_name_prefix="auto-summarizer")
+        logger.info(f"LatencyBudgetRouter initialized with order: {self.quality_order}.")
+
+    def estimate(self, method: str, num_chars: int) -> float:
+        with self._lock:
+            return self.cost_models[method].estimate(num_chars / 1000.0)
+
+    def record(self, method: str, num_chars: int, seconds: float) -> None:
+        with self._lock:
+            self.cost_models[method].update(num_chars / 1000.0, seconds)
+        logger.debug("Recorded %.4fs for '%s' on %d characters.", seconds, method, num_chars)
+
+    def _is_unavailable(self, method: str) -> bool:
+        instance = self.summarizer_factory._summarizer_instances.get(method)
+        return instance is not None and not instance.available
+
+    def cheapest_method(self, num_chars: int) -> str:
+        candidates = [m for m in self.quality_order if not self._is_unavailable(m)] or self.quality_order
+        return min(candidates, key=lambda m: self.estimate(m, num_chars))
+
+    def select(self, num_chars: int, latency_budget: float) -> str:
+        """
+        Returns the first method in quality order whose estimated latency fits the budget.
+        """
+        for method in self.quality_order:
+            if self._is_unavailable(method):
+                continue
+            if self.estimate(method, num_chars) * self.safety_factor <= latency_budget:
+                return method
+        return self.cheapest_method(num_chars)
+
+    @staticmethod
+    def _method_kwargs(method: str, kwargs: dict) -> dict:
+        if method == 't5':
+            # Length bounds follow the input size unless given explicitly.
+            return {name: kwargs[name] for name in ('max_length', 'min_length') if name in kwargs}
+        return {'num_sentences': kwargs.get('num_sentences', 3)}
+
+    def _timed_summarize(self, method: str, text: str, kwargs: dict, deadline: float = None) -> list[str]:
+        if deadline is not None and time.perf_counter() >= deadline:
+            # The caller has already fallen back; don't start work nobody waits for.
+            request_logger.debug("Skipping stale '%s' run.", method)
+            return None
+        summarizer = self.summarizer_factory.get_summarizer(method)
+        start = time.perf_counter()
+        summary = summarizer.summarize(text, **self._method_kwargs(method, kwargs))
+        if summarizer.available:
+            self.record(method, len(text), time.perf_counter() - start)
+        return summary
+
+    def summarize(self, text: str, latency_budget: float = AUTO_DEFAULT_LATENCY_BUDGET,
+                  **kwargs) -> tuple[str, list[str]]:
+        """
+        Summarizes `text` within `latency_budget` seconds.
+        Returns the method actually used and the summary.
+        """
+        start = time.perf_counter()
+        num_chars = len(text)
+        method = self.select(num_chars, latency_budget)
+        fallback = self.cheapest_method(num_chars)
+        request_logger.info("Auto-selected method '%s' for %d characters (budget %.3fs, estimate %.3fs).",
+                            method, num_chars, latency_budget, self.estimate(method, num_chars))
+
+        if method == fallback:
+            return method, self._timed_summarize(method, text, kwargs)
+
+        # Run in a copy of the caller's context so trace spans keep their parent.
+        reserve = self.estimate(fallback, num_chars) * self.safety_factor
+        wait = max(latency_budget - reserve - (time.perf_counter() - start), 0.0)
+        future = self._executor.submit(contextvars.copy_context().run, self._timed_summarize, method, text, kwargs,
+                                       time.perf_counter() + wait)
+        try:
+            summary = future.result(timeout=wait)
+            if summary is None:
+                raise FutureTimeoutError
+            if self.summarizer_factory.get_summarizer(method).available:
+                return method, summary
+            logger.warning(f"Method '{method}' is unavailable. Falling back to '{fallback}'.")
+        except FutureTimeoutError:
+            logger.warning(f"Method '{method}' did not finish within {wait:.3f}s. Falling back to '{fallback}'.")
+
+        return fallback, self._timed_summarize(fallback, text, kwargs)
+
+    def shutdown(self, wait: bool = False) -> None:
+        self._executor.shutdown(wait=wait)
@@ -0,0 +1,246 @@
+# Local registry of model artifacts so summarizers load from disk only.
+#
+# Layout (one directory per model, "/" in names becomes "--"):
+#   <root>/<name>/manifest.json   name, source, created_at and {path: {size, sha256}} per file
+#   <root>/<name>/files/...       what from_pretrained()/save_pretrained() read and write
+#   <root>/<name>/.verified       stamp of the last full checksum pass (sizes and mtimes)
+#
+# Usage (from the Text_Summarization directory):
+#   python -m src.components.model_registry prefetch t5-small http://models.internal/t5-small.zip --sha256 <hex>
+#   python -m src.components.model_registry import bert-base-uncased /path/to/save_pretrained/output
+#   python -m src.components.model_registry verify t5-small
+#   python -m src.components.model_registry list
+import argparse
+import hashlib
+import json
+import os
+import pathlib
+import shutil
+import sys
+import tempfile
+import time
+from src.constants.constants import MODEL_REGISTRY_DIR_NAME, MODEL_REGISTRY_ENV
+from src.utils.helpers import download_file, extract_zip
+from src.utils.logging_setup import logger
+
+MANIFEST_FILE = "manifest.json"
+STAMP_FILE = ".verified"
+FILES_DIR = "files"
+
+
+class ModelRegistryError(Exception):
+    """
+    Raised when a model is missing from the registry or fails verification.
+    """
+
+
+def file_sha256(path: str, block_size: int = 1 << 20) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(block_size), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _default_root() -> str:
+    return os.environ.get(MODEL_REGISTRY_ENV) or str(pathlib.Path(__file__).resolve().parents[2] / MODEL_REGISTRY_DIR_NAME)
+
+
+def _write_json_atomic(path: str, content: dict) -> None:
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(content, f, indent=4, sort_keys=True)
+    os.replace(tmp_path, path)
+
+
+class ModelRegistry:
+    """
+    Directory of model artifacts with per-file checksums.
+
+    `resolve()` is what loaders call: it never touches the network and, once a
+    model has been fully verified, only compares file sizes and mtimes with the
+    verification stamp, so load time does not grow with model size.
+    """
+    def __init__(self, root: str = None):
+        self.root = root or _default_root()
+
+    def _model_dir(self, name: str) -> str:
+        return os.path.join(self.root, name.replace("/", "--"))
+
+    def manifest(self, name: str) -> dict:
+        manifest_path = os.path.join(self._model_dir(name), MANIFEST_FILE)
+        if not os.path.exists(manifest_path):
+            raise ModelRegistryError(f"Model '{name}' is not in the registry at {self.root}; "
+                                     f"import or prefetch it first (python -m src.components.model_registry).")
+        with open(manifest_path, "r") as f:
+            return json.load(f)
+
+    def has(self, name: str) -> bool:
+        return os.path.exists(os.path.join(self._model_dir(name), MANIFEST_FILE))
+
+    def list_models(self) -> list[dict]:
+        if not os.path.isdir(self.root):
+            return []
+        manifests = []
+        for entry in sorted(os.listdir(self.root)):
+            manifest_path = os.path.join(self.root, entry, MANIFEST_FILE)
+            if os.path.exists(manifest_path):
+                with open(manifest_path, "r") as f:
+                    manifests.append(json.load(f))
+        return manifests
+
+    def _file_stats(self, files_dir: str, manifest: dict) -> dict:
+        stats = {}
+        for relative_path in manifest["files"]:
+            stat = os.stat(os.path.join(files_dir, relative_path))
+            stats[relative_path] = [stat.st_size, stat.st_mtime_ns]
+        return stats
+
+    def verify(self, name: str) -> str:
+        """
+        Checks every file against the manifest checksums, records a stamp and
+        returns the model's files directory.
+        """
+        manifest = self.manifest(name)
+        model_dir = self._model_dir(name)
+        files_dir = os.path.join(model_dir, FILES_DIR)
+        start = time.perf_counter()
+        for relative_path, expected in manifest["files"].items():
+            path = os.path.join(files_dir, relative_path)
+            if not os.path.exists(path):
+                raise ModelRegistryError(f"Model '{name}' is missing file '{relative_path}'.")
+            if os.path.getsize(path) != expected["size"] or file_sha256(path) != expected["sha256"]:
+                raise ModelRegistryError(f"Checksum mismatch for '{relative_path}' of model '{name}'.")
+        _write_json_atomic(os.path.join(model_dir, STAMP_FILE), {
+            "manifest_sha256": file_sha256(os.path.join(model_dir, MANIFEST_FILE)),
+            "files": self._file_stats(files_dir, manifest),
+        })
+        logger.info(f"Verified {len(manifest['files'])} files of model '{name}' in {time.perf_counter() - start:.2f}s.")
+        return files_dir
+
+    def resolve(self, name: str) -> str:
+        """
+        Local directory of a registered model, ready for from_pretrained().
+        Checksums are recomputed only if files changed since the last verification.
+        """
+        manifest = self.manifest(name)
+        model_dir = self._model_dir(name)
+        files_dir = os.path.join(model_dir, FILES_DIR)
+        try:
+            with open(os.path.join(model_dir, STAMP_FILE), "r") as f:
+                stamp = json.load(f)
+            if (stamp["manifest_sha256"] == file_sha256(os.path.join(model_dir, MANIFEST_FILE))
+                    and stamp["files"] == self._file_stats(files_dir, manifest)):
+                return files_dir
+        except (OSError, ValueError, KeyError):
+            pass
+        logger.info(f"Model '{name}' changed or was never verified; verifying checksums.")
+        return self.verify(name)
+
+    def import_model(self, name: str, source_path: str, source: str = None) -> dict:
+        """
+        Copies a model directory (e.g. save_pretrained() output) into the
+        registry, replacing any previous version, and writes its manifest.
+        """
+        if not os.path.isdir(source_path):
+            raise ModelRegistryError(f"Cannot import model '{name}': {source_path} is not a directory.")
+        entries = [entry for entry in os.listdir(source_path) if not entry.startswith(".")]
+        # Archives often wrap everything in a single top-level directory.
+        if len(entries) == 1 and os.path.isdir(os.path.join(source_path, entries[0])):
+            source_path = os.path.join(source_path, entries[0])
+
+        os.makedirs(self.root, exist_ok=True)
+        model_dir = self._model_dir(name)
+        staging_dir = tempfile.mkdtemp(prefix=".staging-", dir=self.root)
+        try:
+            files_dir = os.path.join(staging_dir, FILES_DIR)
+            shutil.copytree(source_path, files_dir, ignore=shutil.ignore_patterns(".*"))
+            files = {}
+            for directory, _, filenames in os.walk(files_dir):
+                for filename in sorted(filenames):
+                    path = os.path.join(directory, filename)
+                    files[os.path.relpath(path, files_dir)] = {"size": os.path.getsize(path), "sha256": file_sha256(path)}
+            manifest = {"name": name, "source": source or os.path.abspath(source_path),
+                        "created_at": time.strftime("%Y-%m-%dT%H:%M:%S"), "files": files}
+            _write_json_atomic(os.path.join(staging_dir, MANIFEST_FILE), manifest)
+
+            # Swap directories so readers never see a half-written model.
+            old_dir = None
+            if os.path.exists(model_dir):
+                old_dir = tempfile.mkdtemp(prefix=".old-", dir=self.root)
+                os.replace(model_dir, os.path.join(old_dir, "model"))
+            os.replace(staging_dir, model_dir)
+            if old_dir:
+                shutil.rmtree(old_dir, ignore_errors=True)
+        except Exception:
+            shutil.rmtree(staging_dir, ignore_errors=True)
+            raise
+        self.verify(name)
+        logger.info(f"Imported model '{name}' ({len(files)} files) into {model_dir}.")
+        return manifest
+
+    def prefetch(self, name: str, url: str, sha256: str = None) -> dict:
+        """
+        Downloads a zip archive of a model directory from any HTTP source and
+        imports it. `sha256` optionally pins the archive checksum.
+        """
+        os.makedirs(self.root, exist_ok=True)
+        with tempfile.TemporaryDirectory(prefix=".download-", dir=self.root) as download_dir:
+            archive_path = os.path.join(download_dir, "model.zip")
+            if not download_file(url, archive_path):
+                raise ModelRegistryError(f"Could not download model '{name}' from {url}.")
+            if sha256 and file_sha256(archive_path) != sha256.lower():
+                raise ModelRegistryError(f"Archive checksum mismatch for model '{name}' from {url}.")
+            extract_dir = os.path.join(download_dir, "extracted")
+            if not extract_zip(archive_path, extract_dir):
+                raise ModelRegistryError(f"Could not extract the archive of model '{name}' from {url}.")
+            return self.import_model(name, extract_dir, source=url)
+
+    def remove(self, name: str) -> None:
+        shutil.rmtree(self._model_dir(name), ignore_errors=True)
+        logger.info(f"Removed model '{name}' from the registry.")
+
+
+model_registry = ModelRegistry()
+
+
+def main(argv: list[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="Manage the local model registry.")
+    parser.add_argument("--root", default=None, help=f"Registry directory (default: ${MODEL_REGISTRY_ENV} or {model_registry.root}).")
+    commands = parser.add_subparsers(dest="command", required=True)
+    prefetch = commands.add_parser("prefetch", help="Download a zipped model directory over HTTP and import it.")
+    prefetch.add_argument("name")
+    prefetch.add_argument("url")
+    prefetch.add_argument("--sha256", default=None, help="Expected checksum of the archive.")
+    import_parser = commands.add_parser("import", help="Import a local model directory (e.g. save_pretrained output).")
+    import_parser.add_argument("name")
+    import_parser.add_argument("path")
+    verify = commands.add_parser("verify", help="Recompute and check all checksums of a model.")
+    verify.add_argument("name")
+    remove = commands.add_parser("remove")
+    remove.add_argument("name")
+    commands.add_parser("list")
+    args = parser.parse_args(argv)
+
+    registry = ModelRegistry(args.root) if args.root else model_registry
+    try:
+        if args.command == "prefetch":
+            registry.prefetch(args.name, args.url, args.sha256)
+        elif args.command == "import":
+            registry.import_model(args.name, args.path)
+        elif args.command == "verify":
+            registry.verify(args.name)
+        elif args.command == "remove":
+            registry.remove(args.name)
+        else:
+            for manifest in registry.list_models():
+                size = sum(entry["size"] for entry in manifest["files"].values())
+                print(f"{manifest['name']}\t{len(manifest['files'])} files\t{size / 1e6:.1f} MB\t{manifest['source']}")
+    except ModelRegistryError as e:
+        logger.error(str(e))
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
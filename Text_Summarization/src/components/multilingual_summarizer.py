@@ -0,0 +1,106 @@
+from threading import Lock
+from nltk.corpus import stopwords
+from src.components.summarizer import Summarizer
+from src.components.summary_store import SummaryStore
+from src.constants.constants import DEDUP_THRESHOLD
+from src.modules.language_detection import LanguageDetector
+from src.utils.logging_setup import logger
+from src.utils.metrics import LANGUAGE_REQUESTS
+
+
+class MultilingualSummarizer(Summarizer):
+    """
+    Summarizer front end that routes each text to a per-language Summarizer,
+    using the caller's language or one detected from the text.
+
+    Routes are created on first use and share the process-wide TextProcessor
+    pool and model cache, so a transformer model is loaded once for all
+    languages; only the light per-language summarizer objects are duplicated.
+    This instance itself is the route for `default_language`.
+    """
+    def __init__(self, default_language: str = 'english', languages: list[str] = None,
+                 store: SummaryStore = None, dedup_threshold=DEDUP_THRESHOLD):
+        super().__init__(default_language, store, dedup_threshold)
+        self.detector = LanguageDetector(languages, default_language)
+        self.dedup_threshold = dedup_threshold
+        self._routes = {default_language: self}
+        self._routes_lock = Lock()
+
+    def for_language(self, language: str) -> Summarizer:
+        """
+        The Summarizer handling `language`, created on first use.
+        """
+        language = language.lower()
+        if language in self._routes:
+            return self._routes[language]
+        if language not in stopwords.fileids():
+            raise ValueError(f"Unsupported language: '{language}'.")
+        with self._routes_lock:
+            if language not in self._routes:
+                logger.info(f"Adding summarization route for language '{language}'.")
+                self._routes[language] = Summarizer(language, self.store, self.dedup_threshold)
+            return self._routes[language]
+
+    def route(self, text: str, language: str = None) -> Summarizer:
+        """
+        Picks the route for `text`: the given language, else the detected one.
+        """
+        if language:
+            source = "request"
+        else:
+            language, source = self.detector.detect(text), "detected"
+        # Count only validated languages so client input cannot add label values.
+        route = self.for_language(language)
+        LANGUAGE_REQUESTS.inc(language=route.language, source=source)
+        return route
+
+    def summarize_text(self, text: str, method: str, language: str = None, **kwargs) -> list[str]:
+        """
+        Summarizes `text` with the summarizer for its language (see Summarizer.summarize_text).
+        """
+        try:
+            route = self.route(text, language)
+        except ValueError as e:
+            logger.error(f"Failed to summarize text: {e}")
+            return [f"Error: {e}"]
+        if route is self:
+            return super().summarize_text(text, method, **kwargs)
+        return route.summarize_text(text, method, **kwargs)
+
+    def summarize_result(self, text: str, method: str, language: str = None, **kwargs):
+        """
+        Sentence offsets and scores from the summarizer for the text's language.
+        """
+        route = self.route(text, language)
+        if route is self:
+            return super().summarize_result(text, method, **kwargs)
+        return route.summarize_result(text, method, **kwargs)
+
+    def summarize_item(self, item: dict) -> dict:
+        """
+        Summarizes one batch item in its `language` (detected when missing) and
+        reports the language used.
+        """
+        try:
+            route = self.route(item.get("text") or "", item.get("language"))
+        except ValueError as e:
+            return {"id": item.get("id"), "method": item.get("method", "tfidf"), "status": "error", "error": str(e)}
+        result = super().summarize_item(item) if route is self else route.summarize_item(item)
+        result["language"] = route.language
+        return result
+
+    def summarize_many(self, texts: list[str], method: str, language: str = None, **kwargs) -> list[list[str]]:
+        """
+        Summarizes many texts, grouping them by language so each route can use
+        its bulk store lookup.
+        """
+        groups = {}
+        for index, text in enumerate(texts):
+            groups.setdefault(self.route(text, language), []).append(index)
+        summaries = [None] * len(texts)
+        for route, indices in groups.items():
+            batch = [texts[index] for index in indices]
+            results = super().summarize_many(batch, method, **kwargs) if route is self else route.summarize_many(batch, method, **kwargs)
+            for index, summary in zip(indices, results):
+                summaries[index] = summary
+        return summaries
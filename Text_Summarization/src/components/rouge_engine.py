@@ -0,0 +1,187 @@
+# Native ROUGE-N/ROUGE-L scorer producing the same numbers as rouge_score's
+# RougeScorer (default tokenizer, optional Porter stemming), but much faster:
+#   - each distinct word is lowercased, stemmed and mapped to an integer id once
+#     per process (up to `max_vocabulary` words, then the tables start over),
+#     so texts become int32 arrays;
+#   - n-gram overlaps are clipped counts from np.unique / np.intersect1d over
+#     packed n-gram keys instead of Counters of tuples;
+#   - LCS uses the bit-parallel algorithm (Allison-Dix / Hyyrö) with Python
+#     integers as bit vectors, O(n * m / 64) word operations instead of a
+#     Python-level O(n * m) DP table.
+import re
+from threading import Lock
+from typing import NamedTuple
+import numpy as np
+from nltk.stem import porter
+from src.constants.constants import ROUGE_NATIVE_MAX_VOCABULARY
+
+_TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+_VALID_TOKEN = re.compile(r"^[a-z0-9]+$")
+_EMPTY = np.empty(0, dtype=np.int64)
+
+
+class RougeScore(NamedTuple):
+    precision: float
+    recall: float
+    fmeasure: float
+
+
+class PreparedRouge(NamedTuple):
+    """
+    A text tokenized once for scoring against many others. `generation` is
+    the scorer vocabulary its ids belong to; `text` allows re-preparing it.
+    """
+    ids: np.ndarray
+    ngrams: dict  # n -> (sorted unique n-gram keys, counts)
+    lcs_masks: dict  # token id -> bit mask of its positions
+    text: str = ""
+    generation: int = 0
+
+
+def fmeasure(precision: float, recall: float) -> float:
+    if precision + recall > 0:
+        return 2 * precision * recall / (precision + recall)
+    return 0.0
+
+
+def ngram_counts(ids: np.ndarray, n: int) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Sorted unique n-gram keys of a token id array and their counts.
+    """
+    if len(ids) < n:
+        return _EMPTY, _EMPTY
+    if n == 1:
+        keys = ids.astype(np.int64)
+    elif n == 2:
+        keys = (ids[:-1].astype(np.int64) << 32) | ids[1:].astype(np.int64)
+    else:
+        windows = np.ascontiguousarray(np.lib.stride_tricks.sliding_window_view(ids, n))
+        keys = windows.view(np.dtype((np.void, windows.itemsize * n))).ravel()
+    return np.unique(keys, return_counts=True)
+
+
+def ngram_overlap(target: tuple[np.ndarray, np.ndarray], prediction: tuple[np.ndarray, np.ndarray]) -> int:
+    """
+    Number of n-grams shared by two texts, each counted at most as often as in either.
+    """
+    if not len(target[0]) or not len(prediction[0]):
+        return 0
+    _, target_index, prediction_index = np.intersect1d(target[0], prediction[0], assume_unique=True, return_indices=True)
+    return int(np.minimum(target[1][target_index], prediction[1][prediction_index]).sum())
+
+
+def lcs_masks(ids: np.ndarray) -> dict[int, int]:
+    masks = {}
+    for position, token in enumerate(ids.tolist()):
+        masks[token] = masks.get(token, 0) | (1 << position)
+    return masks
+
+
+def lcs_length(masks: dict[int, int], length: int, other_ids: np.ndarray) -> int:
+    """
+    Length of the longest common subsequence of a text of `length` tokens
+    (given by its position `masks`) and `other_ids`, one bit per position.
+    """
+    if not length:
+        return 0
+    full = (1 << length) - 1
+    row = full
+    for token in other_ids.tolist():
+        mask = masks.get(token)
+        if mask:
+            matched = row & mask
+            row = ((row + matched) | (row - matched)) & full
+    return length - row.bit_count()
+
+
+class NativeRougeScorer:
+    """
+    Drop-in replacement for rouge_score.RougeScorer for 'rougeN' and 'rougeL'
+    (not 'rougeLsum'). Precision, recall and F-measure match rouge_score.
+
+    Word ids are cached for at most `max_vocabulary` distinct words; past that
+    the tables are replaced, so memory stays bounded in long-lived processes.
+    """
+    def __init__(self, rouge_types: list[str] = ("rouge1", "rouge2", "rougeL"), use_stemmer: bool = True,
+                 max_vocabulary: int = ROUGE_NATIVE_MAX_VOCABULARY):
+        self.rouge_types = list(rouge_types)
+        self.orders = {}
+        for rouge_type in self.rouge_types:
+            if rouge_type == "rougeL":
+                continue
+            match = re.fullmatch(r"rouge([1-9])", rouge_type)
+            if not match:
+                raise ValueError(f"Unsupported ROUGE type for the native engine: '{rouge_type}'.")
+            self.orders[rouge_type] = int(match.group(1))
+        self.stemmer = porter.PorterStemmer() if use_stemmer else None
+        self.max_vocabulary = max_vocabulary
+        self._word_ids = {}  # word -> id of its (stemmed) token, or None if the token is dropped
+        self._token_ids = {}  # stemmed token -> id
+        self._generation = 0  # incremented whenever the tables start over
+        self._lock = Lock()
+
+    def _add_word(self, word: str):
+        token = self.stemmer.stem(word) if self.stemmer and len(word) > 3 else word
+        with self._lock:
+            token_id = self._token_ids.setdefault(token, len(self._token_ids)) if _VALID_TOKEN.match(token) else None
+            self._word_ids[word] = token_id
+        return token_id
+
+    def _reset(self, generation: int) -> None:
+        with self._lock:
+            if self._generation == generation:
+                # New dicts rather than clear(): readers holding the old ones stay consistent.
+                self._word_ids, self._token_ids = {}, {}
+                self._generation += 1
+
+    def _tokenize(self, text: str) -> tuple[np.ndarray, int]:
+        words = _TOKEN_PATTERN.findall(text.lower())
+        while True:
+            generation, word_ids = self._generation, self._word_ids
+            if len(word_ids) >= self.max_vocabulary:
+                self._reset(generation)
+                continue
+            ids = [word_ids[word] if word in word_ids else self._add_word(word) for word in words]
+            if self._generation == generation:  # otherwise the tables started over mid-text
+                return np.fromiter((i for i in ids if i is not None), dtype=np.int32, count=-1), generation
+
+    def tokenize(self, text: str) -> np.ndarray:
+        """
+        Token ids of `text`, tokenized like rouge_score's default tokenizer.
+        """
+        return self._tokenize(text)[0]
+
+    def prepare(self, text: str) -> PreparedRouge:
+        ids, generation = self._tokenize(text)
+        return PreparedRouge(ids, {n: ngram_counts(ids, n) for n in set(self.orders.values())},
+                             lcs_masks(ids) if "rougeL" in self.rouge_types else {}, text, generation)
+
+    def score_prepared(self, target: PreparedRouge, prediction: str) -> dict[str, RougeScore]:
+        """
+        Scores `prediction` against an already prepared target (reference).
+        """
+        ids, generation = self._tokenize(prediction)
+        while target.generation != generation:  # ids were renumbered since the target was prepared
+            target = self.prepare(target.text)
+            ids, generation = self._tokenize(prediction)
+        scores = {}
+        for rouge_type in self.rouge_types:
+            if rouge_type == "rougeL":
+                if not len(target.ids) or not len(ids):
+                    scores[rouge_type] = RougeScore(0, 0, 0)
+                    continue
+                overlap = lcs_length(target.lcs_masks, len(target.ids), ids)
+                precision, recall = overlap / len(ids), overlap / len(target.ids)
+            else:
+                n = self.orders[rouge_type]
+                overlap = ngram_overlap(target.ngrams[n], ngram_counts(ids, n))
+                precision = overlap / max(len(ids) - n + 1, 1)
+                recall = overlap / max(len(target.ids) - n + 1, 1)
+            scores[rouge_type] = RougeScore(precision, recall, fmeasure(precision, recall))
+        return scores
+
+    def score(self, target: str, prediction: str) -> dict[str, RougeScore]:
+        """
+        Same signature and result layout as rouge_score.RougeScorer.score.
+        """
+        return self.score_prepared(self.prepare(target), prediction)
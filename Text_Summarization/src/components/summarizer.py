@@ -1,27 +1,185 @@
 
-from src.modules.text_preprocessing import TextProcessor
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from src.constants.constants import DEDUP_THRESHOLD
+from src.modules.text_preprocessing import text_processor_pool
 from src.factory.summarizer_factory import SummarizerFactory
-from src.utils.logging_setup import logger
+from src.components.method_router import LatencyBudgetRouter
+from src.components.hierarchical_summarizer import HierarchicalSummarizer
+from src.components.summary_store import SummaryStore
+from src.core.summary_result import SummaryResult
+from src.utils.logging_setup import logger, request_logger
+from src.utils.metrics import ERRORS_TOTAL, REQUEST_LATENCY, REQUESTS_TOTAL
+from src.utils.tracing import tracer
 
 class Summarizer:
     """
     The main orchestrator class for text summarization.
     """
-    def __init__(self, language='english'):
+    def __init__(self, language='english', store: SummaryStore = None, dedup_threshold=DEDUP_THRESHOLD):
         logger.info(f"Initializing Summarizer with language: '{language}'.")
-        self.text_processor = TextProcessor(language)
+        self.language = language
+        self.text_processor = text_processor_pool.get(language, dedup_threshold)
         self.summarizer_factory = SummarizerFactory(self.text_processor)
+        self.store = store
+        self._router = None
+
+    @property
+    def router(self) -> LatencyBudgetRouter:
+        """
+        Lazily created router backing the 'auto' method.
+        """
+        if self._router is None:
+            self._router = LatencyBudgetRouter(self.summarizer_factory)
+        return self._router
+
+    def _store_request(self, text: str, method: str, kwargs: dict) -> tuple:
+        """
+        (text, method, params, model_name) key of a request in the summary store.
+        The language and deduplication threshold are part of the parameters
+        since they change the preprocessing.
+        """
+        model_name = self.summarizer_factory.model_name(method)
+        params = {**kwargs, "language": self.language, "dedup_threshold": self.text_processor.dedup_threshold}
+        return text, method, params, model_name
+
+    def _summarize(self, text: str, method: str, _use_store: bool = True, **kwargs) -> tuple[str, list[str]]:
+        """
+        Runs one summarization and returns the method actually used with the summary.
+        Latency and outcome are recorded per requested method.
+        """
+        start = time.perf_counter()
+        status = "error"
+        # Bound label cardinality: arbitrary user-supplied names collapse to "unknown".
+        label = method.lower() if method.lower() in self.summarizer_factory._summarizer_map or method.lower() == 'auto' else "unknown"
+        # 'auto' depends on live latency estimates, so its results are not stored.
+        use_store = _use_store and self.store is not None and label not in ('auto', 'unknown')
+        stored = False
+        try:
+            with tracer.span("summarize", method=label, input_chars=len(text)) as span:
+                request = self._store_request(text, method, kwargs) if use_store else None
+                summary = self.store.get(*request) if use_store else None
+                if summary is not None:
+                    used, stored = method, True
+                elif method.lower() == 'auto':
+                    used, summary = self.router.summarize(text, **kwargs)
+                else:
+                    used, summary = method, self.summarizer_factory.get_summarizer(method).summarize(text, **kwargs)
+                # Summarizers report internal failures as a single "Error ..." sentence.
+                if not (len(summary) == 1 and summary[0].startswith("Error")):
+                    status = "success"
+                    if use_store and not stored:
+                        self.store.put(*request, summary)
+                span.set(used_method=used, status=status, stored=stored)
+            return used, summary
+        finally:
+            REQUEST_LATENCY.observe(time.perf_counter() - start, method=label)
+            REQUESTS_TOTAL.inc(method=label, status=status)
 
     def summarize_text(self, text: str, method: str, **kwargs) -> list[str]:
         """
         Summarizes the given text using the specified method.
+        Use method='auto' with `latency_budget` (seconds) to let the router pick
+        the best method that fits the budget.
         """
-        logger.info(f"Requesting summary using method: '{method}'.")
+        request_logger.info("Requesting summary using method: '%s'.", method)
         try:
-            summarizer = self.summarizer_factory.get_summarizer(method)
-            summary = summarizer.summarize(text, **kwargs)
-            logger.info(f"Summary generated successfully using '{method}'.")
+            method, summary = self._summarize(text, method, **kwargs)
+            request_logger.info("Summary generated successfully using '%s'.", method)
             return summary
         except ValueError as e:
             logger.error(f"Failed to summarize text: {e}")
             return [f"Error: {e}"]
+
+    def summarize_result(self, text: str, method: str, **kwargs) -> SummaryResult:
+        """
+        Extractive summary as sentence indices, character spans into `text` and
+        scores, for highlighting or slicing the original. Raises ValueError for
+        unknown or abstractive methods.
+        """
+        summarizer = self.summarizer_factory.get_summarizer(method)
+        with tracer.span("summarize_result", method=method.lower(), input_chars=len(text)):
+            try:
+                return summarizer.summarize_result(text, **kwargs)
+            except NotImplementedError as e:
+                raise ValueError(f"Method '{method}' does not return sentence offsets.") from e
+
+    def summarize_many(self, texts: list[str], method: str, **kwargs) -> list[list[str]]:
+        """
+        Summarizes many texts with one method. With a store, previously seen
+        documents are fetched in one bulk lookup and only new or changed ones
+        are computed; their summaries are then written back in one transaction.
+        """
+        use_store = self.store is not None and method.lower() in self.summarizer_factory._summarizer_map
+        summaries = [None] * len(texts)
+        if use_store:
+            requests = [self._store_request(text, method, kwargs) for text in texts]
+            summaries = self.store.get_many(requests)
+            logger.info(f"Summary store: {sum(s is not None for s in summaries)} of {len(texts)} documents already summarized.")
+        missing = [index for index, summary in enumerate(summaries) if summary is None]
+        for index in missing:
+            try:
+                summaries[index] = self._summarize(texts[index], method, _use_store=False, **kwargs)[1]
+            except ValueError as e:
+                logger.error(f"Failed to summarize text: {e}")
+                summaries[index] = [f"Error: {e}"]
+        if use_store:
+            self.store.put_many([(*requests[index], summaries[index]) for index in missing
+                                 if not (len(summaries[index]) == 1 and summaries[index][0].startswith("Error"))])
+        return summaries
+
+    def summarize_large(self, source, method: str = 'textrank', num_sentences: int = 5, **kwargs) -> list[str]:
+        """
+        Summarizes a book-length file path or file object section by section with
+        bounded memory (see HierarchicalSummarizer for the keyword arguments).
+        """
+        logger.info(f"Requesting hierarchical summary using method: '{method}'.")
+        hierarchical = HierarchicalSummarizer(self.summarizer_factory, method, **kwargs)
+        return hierarchical.summarize_stream(source, num_sentences)
+
+    def summarize_item(self, item: dict) -> dict:
+        """
+        Summarizes one batch item and returns a structured result (never raises
+        for bad methods or parameters; those become `status: "error"`).
+        """
+        method = item.get("method", "tfidf")
+        result = {"id": item.get("id"), "method": method}
+        try:
+            if method.lower() != 'auto' and not self.summarizer_factory.get_summarizer(method).available:
+                raise ValueError(f"Summarization method '{method}' is not available.")
+            result["method"], summary = self._summarize(item["text"], method, **item.get("params", {}))
+            result.update(status="success", summary=" ".join(summary), sentences=summary)
+        except (ValueError, TypeError) as e:
+            logger.error(f"Failed to summarize batch item {item.get('id')!r}: {e}")
+            ERRORS_TOTAL.inc(component="batch_item")
+            result.update(status="error", error=str(e))
+        return result
+
+    def iter_summarize_batch(self, items: list[dict], max_workers: int = None):
+        """
+        Summarizes a batch of items in parallel, yielding `(index, result)` pairs
+        as soon as each item finishes.
+
+        Each item is a dict with `text`, optional `method` (default 'tfidf'),
+        optional `params` (method keyword arguments) and an optional `id`.
+        """
+        max_workers = max_workers or min(len(items), os.cpu_count() or 1) or 1
+        executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="batch-summarizer")
+        try:
+            futures = {executor.submit(self.summarize_item, item): index for index, item in enumerate(items)}
+            for future in as_completed(futures):
+                yield futures[future], future.result()
+        finally:
+            # Stops queued work early if the consumer goes away (e.g. client disconnect).
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def summarize_batch(self, items: list[dict], max_workers: int = None) -> list[dict]:
+        """
+        Summarizes a batch of items in parallel and returns results in input order.
+        """
+        logger.info(f"Summarizing a batch of {len(items)} items.")
+        results = [None] * len(items)
+        for index, result in self.iter_summarize_batch(items, max_workers):
+            results[index] = result
+        return results
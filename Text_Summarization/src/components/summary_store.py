@@ -0,0 +1,229 @@
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+import unicodedata
+from src.constants.constants import SUMMARY_STORE_VERSION
+from src.utils.logging_setup import logger
+from src.utils.metrics import STORE_REQUESTS
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS summaries (
+    key TEXT PRIMARY KEY,
+    variant TEXT NOT NULL,
+    content_hash TEXT NOT NULL,
+    normalized_hash TEXT NOT NULL,
+    method TEXT NOT NULL,
+    summary TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    accessed_at REAL NOT NULL,
+    hits INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS idx_summaries_near ON summaries (normalized_hash, variant);
+CREATE INDEX IF NOT EXISTS idx_summaries_accessed ON summaries (accessed_at);
+"""
+# SQLite limits the number of bound parameters per statement.
+_QUERY_CHUNK = 500
+
+
+def content_hash(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def normalized_hash(text: str) -> str:
+    """
+    Hash that ignores Unicode form, case and whitespace differences, so trivially
+    different copies of a document map to the same value.
+    """
+    normalized = re.sub(r"\s+", " ", unicodedata.normalize("NFKC", text).casefold()).strip()
+    return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+
+
+def _normalize_with_offsets(text: str) -> tuple[str, list[int]]:
+    """
+    Per-character version of the normalized_hash normalization; also returns,
+    for each normalized character, its offset in `text`.
+    """
+    chars, offsets = [], []
+    for index, char in enumerate(text):
+        if char.isspace():
+            if chars and chars[-1] != " ":
+                chars.append(" ")
+                offsets.append(index)
+            continue
+        for piece in unicodedata.normalize("NFKC", char).casefold():
+            chars.append(piece)
+            offsets.append(index)
+    return "".join(chars), offsets
+
+
+def remap_summary(summary: list[str], text: str):
+    """
+    Maps the sentences of a near-duplicate's summary onto the matching spans of
+    `text`, so the result quotes `text` itself. Returns None if a sentence is not
+    found (e.g. an abstractive summary); the caller should then recompute.
+    """
+    normalized, offsets = _normalize_with_offsets(text)
+    remapped, position = [], 0
+    for sentence in summary:
+        target = _normalize_with_offsets(sentence)[0].strip()
+        if not target:
+            return None
+        start = normalized.find(target, position)
+        if start < 0:
+            start = normalized.find(target)
+        if start < 0:
+            return None
+        position = start + len(target)
+        remapped.append(text[offsets[start]:offsets[position - 1] + 1])
+    return remapped
+
+
+def _variant(method: str, params: dict, model_name: str) -> str:
+    payload = json.dumps({"version": SUMMARY_STORE_VERSION, "method": method.lower(),
+                          "params": params or {}, "model": model_name or ""}, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class SummaryStore:
+    """
+    SQLite-backed persistent store of summaries keyed by document content hash
+    plus method, parameters and model name.
+
+    Lookups fall back to a normalized-text hash, so near-duplicate documents
+    (differing only in case, whitespace or Unicode form) reuse a summary; its
+    sentences are re-mapped onto the requested text, and it counts as a miss if
+    they cannot be. Safe to share between threads; each process should open its
+    own instance.
+    """
+    def __init__(self, path: str, max_entries: int = None, near_duplicates: bool = True):
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        self.path = path
+        self.max_entries = max_entries
+        self.near_duplicates = near_duplicates
+        self._lock = threading.Lock()
+        self._writes_since_evict = 0
+        self._conn = sqlite3.connect(path, check_same_thread=False, timeout=30.0, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        logger.info(f"SummaryStore opened at {path} (max_entries={max_entries}).")
+
+    @staticmethod
+    def make_key(text: str, method: str, params: dict = None, model_name: str = None) -> str:
+        return hashlib.sha256(f"{content_hash(text)}:{_variant(method, params, model_name)}".encode("utf-8")).hexdigest()
+
+    def get(self, text: str, method: str, params: dict = None, model_name: str = None):
+        """
+        Returns the stored summary (list of sentences) or None.
+        """
+        return self.get_many([(text, method, params, model_name)])[0]
+
+    def get_many(self, requests: list[tuple]) -> list:
+        """
+        Bulk lookup of (text, method, params, model_name) requests; returns a
+        summary or None per request, in order.
+        """
+        keys = [self.make_key(*request) for request in requests]
+        found = {}
+        with self._lock:
+            for start in range(0, len(keys), _QUERY_CHUNK):
+                chunk = keys[start:start + _QUERY_CHUNK]
+                rows = self._conn.execute(
+                    f"SELECT key, summary FROM summaries WHERE key IN ({','.join('?' * len(chunk))})", chunk)
+                found.update(rows.fetchall())
+            results = [json.loads(found[key]) if key in found else None for key in keys]
+            near_keys = []
+            if self.near_duplicates:
+                for index, request in enumerate(requests):
+                    if results[index] is not None:
+                        continue
+                    text, method, params, model_name = request
+                    row = self._conn.execute(
+                        "SELECT key, summary FROM summaries WHERE normalized_hash = ? AND variant = ? "
+                        "ORDER BY accessed_at DESC LIMIT 1",
+                        (normalized_hash(text), _variant(method, params, model_name))).fetchone()
+                    summary = remap_summary(json.loads(row[1]), text) if row is not None else None
+                    if summary is not None:
+                        near_keys.append(row[0])
+                        results[index] = summary
+                        STORE_REQUESTS.inc(result="near_hit")
+            hit_keys = [key for key in keys if key in found] + near_keys
+            if hit_keys:
+                self._conn.executemany("UPDATE summaries SET accessed_at = ?, hits = hits + 1 WHERE key = ?",
+                                       [(time.time(), key) for key in hit_keys])
+        STORE_REQUESTS.inc(len(found), result="hit")
+        STORE_REQUESTS.inc(sum(result is None for result in results), result="miss")
+        return results
+
+    def put(self, text: str, method: str, params: dict, model_name: str, summary: list[str]) -> None:
+        self.put_many([(text, method, params, model_name, summary)])
+
+    def put_many(self, entries: list[tuple]) -> None:
+        """
+        Bulk insert (or replace) of (text, method, params, model_name, summary) entries
+        in a single transaction.
+        """
+        now = time.time()
+        rows = [
+            (self.make_key(text, method, params, model_name), _variant(method, params, model_name),
+             content_hash(text), normalized_hash(text), method.lower(), json.dumps(summary), now, now)
+            for text, method, params, model_name, summary in entries
+        ]
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO summaries "
+                    "(key, variant, content_hash, normalized_hash, method, summary, created_at, accessed_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?)", rows)
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._writes_since_evict += len(rows)
+            should_evict = self.max_entries and self._writes_since_evict >= max(1, self.max_entries // 10)
+        if should_evict:
+            self.evict(max_entries=self.max_entries)
+
+    def evict(self, max_entries: int = None, max_age: float = None) -> int:
+        """
+        Deletes entries not accessed for `max_age` seconds and then the least
+        recently used ones beyond `max_entries`. Returns the number removed.
+        """
+        removed = 0
+        with self._lock:
+            self._writes_since_evict = 0
+            if max_age is not None:
+                removed += self._conn.execute("DELETE FROM summaries WHERE accessed_at < ?",
+                                              (time.time() - max_age,)).rowcount
+            if max_entries is not None:
+                removed += self._conn.execute(
+                    "DELETE FROM summaries WHERE key IN (SELECT key FROM summaries "
+                    "ORDER BY accessed_at DESC LIMIT -1 OFFSET ?)", (max_entries,)).rowcount
+        if removed:
+            logger.info(f"Evicted {removed} summaries from {self.path}.")
+        return removed
+
+    def compact(self) -> None:
+        """
+        Reclaims space left by deleted entries (VACUUM) and truncates the WAL file.
+        """
+        with self._lock:
+            self._conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+            self._conn.execute("VACUUM")
+        logger.info(f"Compacted summary store {self.path}.")
+
+    def stats(self) -> dict:
+        with self._lock:
+            entries, hits = self._conn.execute("SELECT COUNT(*), COALESCE(SUM(hits), 0) FROM summaries").fetchone()
+        return {"path": self.path, "entries": entries, "hits": hits,
+                "size_bytes": os.path.getsize(self.path) if os.path.exists(self.path) else 0}
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
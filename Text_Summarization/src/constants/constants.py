@@ -1,2 +1,115 @@
 CONFIG_FILE_PATH = "config/config.yaml"
 PARAMS_FILE_PATH = "params.yaml"
+
+# --- Automatic (latency-budget) method selection ---
+# Methods ordered from best to lowest expected summary quality. The 'auto'
+# method picks the first one whose estimated latency fits the budget.
+AUTO_METHOD_QUALITY_ORDER = ['t5', 'bert_extractive', 'textrank', 'lsa', 'tfidf']
+AUTO_DEFAULT_LATENCY_BUDGET = 2.0  # seconds
+# Prior cost estimates (fixed overhead in seconds, seconds per 1k characters)
+# used until enough timings have been observed for a method.
+AUTO_METHOD_COST_PRIORS = {
+    't5': (0.5, 0.25),
+    'bert_extractive': (0.2, 0.10),
+    'textrank': (0.01, 0.010),
+    'lsa': (0.01, 0.008),
+    'tfidf': (0.002, 0.005),
+}
+
+# --- JSON batch API ---
+API_MAX_BATCH_SIZE = 256
+API_MAX_TEXT_LENGTH = 1_000_000  # characters per document
+
+# --- Production serving (asgi.py) ---
+# Maximum requests per method that may be queued or running at once; further
+# requests are rejected with 429 instead of piling up behind slow models.
+SERVING_QUEUE_LIMITS = {
+    't5': 4,
+    'bert_extractive': 8,
+}
+SERVING_DEFAULT_QUEUE_LIMIT = 32
+SERVING_REQUEST_TIMEOUT = 60.0  # seconds a request may wait for its result
+SERVING_DRAIN_TIMEOUT = 30.0  # seconds to finish in-flight work on shutdown
+SERVING_HTTP_THREADS = 64  # requests handled concurrently by asgi.py
+
+# --- Summary response cache (app.py) ---
+RESPONSE_CACHE_MAX_ENTRIES = 2048
+RESPONSE_CACHE_TTL = 3600.0  # seconds
+RESPONSE_CACHE_DISK_MAX_ENTRIES = 100000  # oldest entries are evicted beyond this
+# Environment variable pointing at a directory for the optional on-disk cache store.
+RESPONSE_CACHE_DIR_ENV = "SUMMARY_CACHE_DIR"
+
+# --- Tracing (src/utils/tracing.py) ---
+# Comma-separated span sinks, e.g. "memory,jsonl:logs/traces.jsonl,cprofile:0.01:profiles".
+# Tracing is disabled (no overhead) when unset.
+TRACE_SINKS_ENV = "SUMMARY_TRACE"
+TRACE_PROFILE_DIR = "profiles"
+
+# --- Logging (src/utils/logging_setup.py) ---
+LOG_LEVEL_ENV = "LOG_LEVEL"  # e.g. INFO, WARNING
+LOG_FORMAT_ENV = "LOG_FORMAT"  # "text" or "json"
+LOG_ASYNC_ENV = "LOG_ASYNC"  # "0" writes synchronously from the calling thread
+# Fraction of per-request INFO/DEBUG messages (request_logger) that are kept.
+LOG_SAMPLE_RATE_ENV = "LOG_SAMPLE_RATE"
+
+# --- Hierarchical summarization of very large inputs ---
+HIERARCHICAL_SECTION_BYTES = 64 * 1024  # source bytes summarized at a time
+HIERARCHICAL_SENTENCES_PER_SECTION = 3
+HIERARCHICAL_FAN_IN = 16  # section summaries merged per reduction step
+
+# --- Persistent summary store (src/components/summary_store.py) ---
+SUMMARY_STORE_ENV = "SUMMARY_STORE_PATH"  # SQLite file used by app.py when set
+# Bump when summarizer output changes so stale stored summaries are not reused.
+SUMMARY_STORE_VERSION = 2
+
+# --- Near-duplicate sentence collapsing (src/modules/sentence_dedup.py) ---
+DEDUP_THRESHOLD = 0.8  # estimated Jaccard similarity of content words; None disables
+DEDUP_NUM_PERM = 64  # MinHash signature length
+DEDUP_SEED = 1
+
+# --- Local model registry (src/components/model_registry.py) ---
+MODEL_REGISTRY_ENV = "SUMMARY_MODEL_REGISTRY"  # registry root; defaults to Text_Summarization/models
+MODEL_REGISTRY_DIR_NAME = "models"
+
+# --- Language routing (src/components/multilingual_summarizer.py) ---
+LANGUAGE_DETECT_SAMPLE_CHARS = 2000  # only the start of a document is inspected
+LANGUAGE_DETECT_MIN_SCORE = 0.1  # minimum share of stopword tokens; below it the default language is used
+
+# --- Query-focused BERT summarization (src/components/embedding_index.py) ---
+EMBEDDING_INDEX_DIR_ENV = "SUMMARY_EMBEDDING_INDEX_DIR"  # defaults to ~/.cache/summary_embedding_index
+EMBEDDING_INDEX_DIR_NAME = "summary_embedding_index"
+EMBEDDING_INDEX_OPEN_MAX = 64  # indexes kept open (memory-mapped) per process
+EMBEDDING_INDEX_DISK_MAX_BYTES = 2 * 1024 ** 3  # least recently used indexes are deleted beyond this
+EMBEDDING_BATCH_SIZE = 32  # sentences encoded per forward pass
+# Part of every BERT index key; bump when the stored metadata changes so older indexes are rebuilt.
+EMBEDDING_INDEX_FORMAT = 2  # 2: sentence spans and indices in meta.json
+
+# --- Inference slots for torch models (src/core/inference_scheduler.py) ---
+# The machine's cores are split among INFERENCE_SLOTS slots of INFERENCE_THREADS
+# torch threads each; tune both with src/benchmark/inference_benchmark.py.
+INFERENCE_SLOTS_ENV = "SUMMARY_INFERENCE_SLOTS"  # defaults to cores // threads per slot
+INFERENCE_THREADS_ENV = "SUMMARY_INFERENCE_THREADS"
+INFERENCE_DEFAULT_THREADS_PER_SLOT = 4
+INFERENCE_INTEROP_THREADS = 1  # slots already run side by side; extra inter-op threads would oversubscribe
+
+# --- Evaluation (src/components/evaluate.py) ---
+# 'rouge_score' uses the reference RougeScorer; 'native' (src/components/rouge_engine.py)
+# gives the same ROUGE-1/2/L scores much faster on large sweeps.
+ROUGE_ENGINES = ("rouge_score", "native")
+ROUGE_ENGINE = "rouge_score"
+ROUGE_NATIVE_MAX_VOCABULARY = 500_000  # distinct words the native engine remembers before starting over
+
+# --- Adaptive T5 generation (src/components/generation_policy.py) ---
+# Decoding settings by preset; 'no_repeat' matches t5's own summarization settings.
+T5_GENERATION_PRESETS = {
+    'greedy': {'num_beams': 1, 'do_sample': False},
+    'beam': {'num_beams': 4, 'do_sample': False, 'early_stopping': True},
+    'no_repeat': {'num_beams': 4, 'do_sample': False, 'early_stopping': True, 'no_repeat_ngram_size': 3},
+}
+T5_DEFAULT_PRESET = 'no_repeat'
+# Unless the caller sets them, max_length/min_length follow the input length (in model tokens).
+T5_MAX_LENGTH_RATIO = 0.5
+T5_MIN_LENGTH_RATIO = 0.1
+T5_LENGTH_FLOOR = 16  # shortest max_length, so very short inputs still get a sentence
+T5_LENGTH_CEILING = 256  # longest max_length
+T5_GENERATION_MAX_TIME = 30.0  # seconds of decoding before generation is stopped
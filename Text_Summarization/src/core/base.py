@@ -1,6 +1,8 @@
 
-from src.modules.text_preprocessing import TextProcessor
+from src.core.summary_result import SelectedSentence, SummaryResult
+from src.modules.text_preprocessing import PreprocessedText, TextProcessor
 from src.utils.logging_setup import logger
+from src.utils.tracing import NOOP_SPAN, tracer
 
 class BaseSummarizer:
     """
@@ -10,5 +12,40 @@ class BaseSummarizer:
         logger.info(f"Initializing BaseSummarizer with processor: {text_processor.__class__.__name__}.")
         self.text_processor = text_processor
 
+    @property
+    def available(self) -> bool:
+        """
+        Whether the summarizer can produce summaries (e.g. its model loaded).
+        """
+        return True
+
+    def span(self, stage: str, **attributes):
+        """
+        Times a stage of this summarizer (e.g. 'preprocess', 'rank') for tracing.
+        A no-op unless a trace sink is configured.
+        """
+        if not tracer.sinks:
+            return NOOP_SPAN
+        return tracer.span(f"{self.__class__.__name__}.{stage}", **attributes)
+
     def summarize(self, text: str, **kwargs) -> list[str]:
-        raise NotImplementedError("Summarization method not implemented.")
\ No newline at end of file
+        raise NotImplementedError("Summarization method not implemented.")
+
+    def summarize_result(self, text: str, **kwargs) -> SummaryResult:
+        """
+        Like summarize(), but returns sentence indices, character spans and scores.
+        Only extractive summarizers implement it.
+        """
+        raise NotImplementedError(f"{self.__class__.__name__} does not return sentence offsets.")
+
+    @staticmethod
+    def build_result(text: str, document: PreprocessedText, positions, scores=None) -> SummaryResult:
+        """
+        SummaryResult for the sentences at `positions` (into document.sentences,
+        ascending); `scores` holds one score per document sentence.
+        """
+        return SummaryResult(text, [
+            SelectedSentence(document.indices[i], document.spans[i][0], document.spans[i][1],
+                             None if scores is None else float(scores[i]), document.sentences[i])
+            for i in positions
+        ])
\ No newline at end of file
@@ -0,0 +1,165 @@
+# Runs torch forward passes on a fixed set of inference slots, each owning a
+# share of the machine's cores, so concurrent requests do not oversubscribe them.
+import os
+import queue
+import threading
+from concurrent.futures import Future
+from src.constants.constants import (
+    INFERENCE_DEFAULT_THREADS_PER_SLOT,
+    INFERENCE_INTEROP_THREADS,
+    INFERENCE_SLOTS_ENV,
+    INFERENCE_THREADS_ENV,
+)
+from src.utils.logging_setup import logger
+
+
+def available_cores() -> list[int]:
+    """
+    Cores this process may run on (honours taskset/cgroup CPU sets on Linux).
+    """
+    if hasattr(os, "sched_getaffinity"):
+        return sorted(os.sched_getaffinity(0))
+    return list(range(os.cpu_count() or 1))
+
+
+def partition_cores(cores: list[int], slots: int, threads_per_slot: int) -> list[list[int]]:
+    """
+    Splits `cores` into `slots` disjoint groups of `threads_per_slot` cores.
+    When there are too few cores the groups wrap around and share cores.
+    """
+    if slots < 1 or threads_per_slot < 1:
+        raise ValueError("'slots' and 'threads_per_slot' must be positive.")
+    if not cores:
+        raise ValueError("No cores to partition.")
+    return [list(dict.fromkeys(cores[(slot * threads_per_slot + offset) % len(cores)] for offset in range(threads_per_slot)))
+            for slot in range(slots)]
+
+
+def configure_torch_threads(threads_per_slot: int, interop_threads: int = INFERENCE_INTEROP_THREADS) -> None:
+    """
+    Sets torch's intra-op and inter-op thread counts. Both are process-wide;
+    the inter-op count can only be set before torch first uses it.
+    """
+    import torch
+
+    torch.set_num_threads(threads_per_slot)
+    if torch.get_num_interop_threads() != interop_threads:
+        try:
+            torch.set_num_interop_threads(interop_threads)
+        except RuntimeError as e:
+            logger.warning(f"Could not set torch inter-op threads to {interop_threads}: {e}")
+
+
+class InferenceScheduler:
+    """
+    Divides the cores among `slots` worker threads and runs submitted model
+    calls on whichever slot is free, in arrival order.
+
+    Every slot runs torch with `threads_per_slot` intra-op threads. On Linux a
+    slot thread is pinned to its own cores before it runs anything, and the
+    OpenMP threads torch starts for it inherit that pinning, so slots do not
+    compete for cores. Thread counts are process-wide in torch, so all slots
+    share one `threads_per_slot`. Slots start on first use.
+    """
+    def __init__(self, slots: int = None, threads_per_slot: int = None, pin: bool = True):
+        cores = available_cores()
+        self.threads_per_slot = threads_per_slot or int(os.environ.get(INFERENCE_THREADS_ENV) or 0) \
+            or min(INFERENCE_DEFAULT_THREADS_PER_SLOT, len(cores))
+        self.slots = slots or int(os.environ.get(INFERENCE_SLOTS_ENV) or 0) or max(1, len(cores) // self.threads_per_slot)
+        self.partitions = partition_cores(cores, self.slots, self.threads_per_slot)
+        self.pin = pin and hasattr(os, "sched_setaffinity")
+        self._queue = queue.SimpleQueue()
+        self._workers = []
+        self._slot = threading.local()
+        self._lock = threading.Lock()
+        self._busy = 0
+        self._completed = 0
+
+    def _start(self) -> None:
+        with self._lock:
+            if self._workers:
+                return
+            configure_torch_threads(self.threads_per_slot)
+            for slot, cores in enumerate(self.partitions):
+                worker = threading.Thread(target=self._work, args=(slot, cores), name=f"inference-slot-{slot}", daemon=True)
+                worker.start()
+                self._workers.append(worker)
+        logger.info(f"InferenceScheduler started {self.slots} slot(s) x {self.threads_per_slot} thread(s) "
+                    f"on cores {self.partitions}.")
+
+    def _work(self, slot: int, cores: list[int]) -> None:
+        import torch
+
+        self._slot.index = slot
+        if self.pin:
+            try:
+                os.sched_setaffinity(0, cores)  # pid 0 = this thread on Linux
+            except OSError as e:
+                logger.warning(f"Could not pin inference slot {slot} to cores {cores}: {e}")
+        while True:
+            job = self._queue.get()
+            if job is None:
+                return
+            future, fn, args, kwargs = job
+            if not future.set_running_or_notify_cancel():
+                continue
+            with self._lock:
+                self._busy += 1
+            try:
+                # Grad mode is per thread, so the caller's torch.no_grad() does not reach the slot.
+                with torch.no_grad():
+                    future.set_result(fn(*args, **kwargs))
+            except BaseException as e:
+                future.set_exception(e)
+            finally:
+                with self._lock:
+                    self._busy -= 1
+                    self._completed += 1
+
+    def in_slot(self) -> bool:
+        return getattr(self._slot, "index", None) is not None
+
+    def submit(self, fn, *args, **kwargs) -> Future:
+        """
+        Queues `fn(*args, **kwargs)` for the next free slot.
+        """
+        if not self._workers:
+            self._start()
+        future = Future()
+        self._queue.put((future, fn, args, kwargs))
+        return future
+
+    def run(self, fn, *args, **kwargs):
+        """
+        Runs `fn` on a slot and returns its result. Calls made from inside a
+        slot run inline, so nested model calls cannot deadlock.
+        """
+        if self.in_slot():
+            return fn(*args, **kwargs)
+        return self.submit(fn, *args, **kwargs).result()
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "slots": self.slots,
+                "threads_per_slot": self.threads_per_slot,
+                "busy": self._busy,
+                "queued": self._queue.qsize(),
+                "completed": self._completed,
+                "started": bool(self._workers),
+            }
+
+    def shutdown(self, wait: bool = True) -> None:
+        """
+        Stops the slots after the already queued calls have run.
+        """
+        with self._lock:
+            workers, self._workers = self._workers, []
+        for _ in workers:
+            self._queue.put(None)
+        if wait:
+            for worker in workers:
+                worker.join()
+
+
+inference_scheduler = InferenceScheduler()
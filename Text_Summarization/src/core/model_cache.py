@@ -0,0 +1,42 @@
+# Process-wide cache of loaded models shared by all summarizer instances.
+from threading import Lock
+from src.core.singleton import SingletonMeta
+from src.utils.logging_setup import logger
+
+
+class ModelCache(metaclass=SingletonMeta):
+    """
+    Loads each model once per process, however many factories (e.g. one per
+    language) create summarizers for it. Loading different models can proceed
+    in parallel; concurrent requests for the same model wait for one load.
+    """
+    def __init__(self):
+        self._models = {}
+        self._locks = {}
+        self._lock = Lock()
+
+    def get(self, key: tuple, loader):
+        """
+        Returns the model cached under `key`, calling `loader()` on first use.
+        Failed loads are not cached, so a later call retries.
+        """
+        if key in self._models:
+            return self._models[key]
+        with self._lock:
+            key_lock = self._locks.setdefault(key, Lock())
+        with key_lock:
+            if key not in self._models:
+                logger.info(f"Loading shared model {key}.")
+                self._models[key] = loader()
+            return self._models[key]
+
+    def keys(self) -> list[tuple]:
+        return list(self._models)
+
+    def evict(self, key: tuple) -> None:
+        with self._lock:
+            self._models.pop(key, None)
+            self._locks.pop(key, None)
+
+
+model_cache = ModelCache()
@@ -0,0 +1,63 @@
+from dataclasses import dataclass, field
+import numpy as np
+
+
+@dataclass(frozen=True, slots=True)
+class SelectedSentence:
+    """
+    One extracted sentence: its position among the document's sentences, its
+    character span in the original text, and the score it was ranked by.
+    """
+    index: int
+    start: int
+    end: int
+    score: float | None  # None when all sentences were returned unranked
+    sentence: str  # the (whitespace-normalized) sentence, as returned by summarize()
+
+
+@dataclass(slots=True)
+class SummaryResult:
+    """
+    Extractive summary as offsets into the original text, in document order.
+    """
+    text: str
+    selected: list[SelectedSentence] = field(default_factory=list)
+
+    def sentences(self) -> list[str]:
+        return [selection.sentence for selection in self.selected]
+
+    def spans(self) -> list[tuple[int, int]]:
+        return [(selection.start, selection.end) for selection in self.selected]
+
+    def summary(self, separator: str = " ") -> str:
+        return separator.join(self.sentences())
+
+    def highlight(self, before: str = "<mark>", after: str = "</mark>") -> str:
+        """
+        The original text with the selected sentences wrapped in markers.
+        """
+        parts, position = [], 0
+        for start, end in self.spans():
+            parts.extend((self.text[position:start], before, self.text[start:end], after))
+            position = end
+        parts.append(self.text[position:])
+        return "".join(parts)
+
+    def to_dict(self) -> dict:
+        return {"summary": self.summary(), "sentences": self.sentences(),
+                "selected": [{"index": s.index, "start": s.start, "end": s.end, "score": s.score} for s in self.selected]}
+
+
+def select_top(scores: np.ndarray, k: int) -> np.ndarray:
+    """
+    Positions of the `k` highest scores in ascending (document) order, in O(n).
+    Ties at the cut-off go to earlier positions.
+    """
+    scores = np.asarray(scores, dtype=np.float64)
+    k = min(k, len(scores))
+    if k <= 0:
+        return np.empty(0, dtype=np.int64)
+    kth = np.partition(scores, len(scores) - k)[len(scores) - k]
+    above = np.flatnonzero(scores > kth)
+    ties = np.flatnonzero(scores == kth)[:k - len(above)]
+    return np.sort(np.concatenate((above, ties)))
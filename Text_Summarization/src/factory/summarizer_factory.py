@@ -1,3 +1,5 @@
+import inspect
+import threading
 from typing import Type, Dict
 from dataclasses import dataclass
 from src.summarizers.Bert_summarizer import BERTExtractiveSummarizer
@@ -7,7 +9,8 @@ from src.summarizers.T5_summarizer import T5Summarizer
 from src.summarizers.tfidf_summarizer import TFIDFSummarizer
 from src.summarizers.textrank_summarizer import TextRankSummarizer
 from src.core.base import BaseSummarizer
-from src.utils.logging_setup import logger
+from src.utils.logging_setup import logger, request_logger
+from src.utils.metrics import STAGE_LATENCY
 
 
 @dataclass
@@ -29,13 +32,15 @@ class SummarizerFactory:
                 'bert_extractive': BERTExtractiveSummarizer,
                 't5': T5Summarizer,
             }
+        # Guards instance creation so concurrent callers never load a model twice.
+        self._lock = threading.Lock()
         logger.info("SummarizerFactory initialized.")
 
     def get_summarizer(self, method: str) -> BaseSummarizer:
         method_lower = method.lower()
 
         if method_lower in self._summarizer_instances:
-            logger.info(f"Returning cached instance of summarizer: '{method_lower}'.")
+            request_logger.info("Returning cached instance of summarizer: '%s'.", method_lower)
             return self._summarizer_instances[method_lower]
 
         summarizer_cls = self._summarizer_map.get(method_lower)
@@ -43,7 +48,25 @@ class SummarizerFactory:
             logger.error(f"Unknown summarization method requested: '{method_lower}'.")
             raise ValueError(f"Unknown summarization method: {method_lower}")
 
-        logger.info(f"Creating a new instance of summarizer: '{method_lower}'.")
-        instance = summarizer_cls(self.text_processor)
-        self._summarizer_instances[method_lower] = instance
-        return instance
+        with self._lock:
+            if method_lower not in self._summarizer_instances:
+                logger.info(f"Creating a new instance of summarizer: '{method_lower}'.")
+                with STAGE_LATENCY.time(stage="model_load", method=method_lower):
+                    self._summarizer_instances[method_lower] = summarizer_cls(self.text_processor)
+            return self._summarizer_instances[method_lower]
+
+    def model_name(self, method: str) -> str:
+        """
+        Model a method's summarizer uses (None for non-neural methods), without
+        loading it: an existing instance's model, otherwise the class default
+        that get_summarizer would construct it with.
+        """
+        method_lower = method.lower()
+        instance = self._summarizer_instances.get(method_lower)
+        if instance is not None:
+            return getattr(instance, "model_name", None)
+        summarizer_cls = self._summarizer_map.get(method_lower)
+        if not summarizer_cls:
+            raise ValueError(f"Unknown summarization method: {method_lower}")
+        parameter = inspect.signature(summarizer_cls).parameters.get("model_name")
+        return parameter.default if parameter is not None and parameter.default is not inspect.Parameter.empty else None
@@ -0,0 +1,55 @@
+import re
+from collections import Counter
+from nltk.corpus import stopwords
+from src.constants.constants import LANGUAGE_DETECT_MIN_SCORE, LANGUAGE_DETECT_SAMPLE_CHARS
+from src.utils.logging_setup import logger
+
+_WORD_PATTERN = re.compile(r"\w+")
+
+
+class LanguageDetector:
+    """
+    Guesses the language of a text from the share of its words that are
+    stopwords of each candidate language. Stopwords make up a large part of
+    any running text, so a few hundred characters are usually enough and the
+    cost is one dictionary lookup per word.
+    """
+    def __init__(self, languages: list[str] = None, default_language: str = 'english',
+                 sample_chars: int = LANGUAGE_DETECT_SAMPLE_CHARS, min_score: float = LANGUAGE_DETECT_MIN_SCORE):
+        self.languages = sorted(languages or stopwords.fileids())
+        if default_language not in self.languages:
+            raise ValueError(f"Default language '{default_language}' has no stopword list.")
+        self.default_language = default_language
+        self.sample_chars = sample_chars
+        self.min_score = min_score
+        # word -> languages whose stopword list contains it
+        self._index = {}
+        for language in self.languages:
+            for word in stopwords.words(language):
+                self._index.setdefault(word, []).append(language)
+        logger.info(f"LanguageDetector initialized for {len(self.languages)} languages.")
+
+    def scores(self, text: str) -> dict[str, float]:
+        """
+        Share of the sampled words that are stopwords of each language.
+        """
+        words = _WORD_PATTERN.findall(text[:self.sample_chars].lower())
+        if not words:
+            return {}
+        counts = Counter()
+        for word in words:
+            counts.update(self._index.get(word, ()))
+        return {language: count / len(words) for language, count in counts.items()}
+
+    def detect(self, text: str) -> str:
+        """
+        Most likely language, or the default one when the evidence is weak.
+        Ties go to the default language.
+        """
+        scores = self.scores(text)
+        if not scores:
+            return self.default_language
+        best = max(scores, key=lambda language: (scores[language], language == self.default_language))
+        if scores[best] < self.min_score:
+            return self.default_language
+        return best
@@ -0,0 +1,85 @@
+import zlib
+import numpy as np
+from src.constants.constants import DEDUP_NUM_PERM, DEDUP_SEED
+from src.utils.logging_setup import logger
+
+# Mersenne prime for the universal hash family (a * x + b) mod p; with x < 2**32
+# and a, b < p every product fits in uint64.
+_PRIME = np.uint64((1 << 31) - 1)
+
+
+def _lsh_bands(num_perm: int, threshold: float) -> tuple[int, int]:
+    """
+    (bands, rows) with bands * rows == num_perm whose S-curve midpoint
+    (1 / bands) ** (1 / rows) is the closest one at or below `threshold`, so
+    near-duplicates become candidates with high probability.
+    """
+    options = [(b, num_perm // b) for b in range(1, num_perm + 1) if num_perm % b == 0]
+    below = [option for option in options if (1 / option[0]) ** (1 / option[1]) <= threshold]
+    return max(below or options, key=lambda option: (1 / option[0]) ** (1 / option[1]))
+
+
+class MinHashDeduplicator:
+    """
+    Collapses near-duplicate sentences (repeated headlines, quotes, boilerplate)
+    using MinHash signatures over each sentence's content words and LSH banding.
+
+    Sentences are visited in document order and each one is either kept or
+    mapped to the earliest kept sentence whose estimated Jaccard similarity is at
+    least `threshold`. Kept sentences are the original ones, in order.
+    """
+    def __init__(self, threshold: float, num_perm: int = DEDUP_NUM_PERM, seed: int = DEDUP_SEED):
+        if not 0.0 < threshold <= 1.0:
+            raise ValueError(f"Deduplication threshold must be in (0, 1], got {threshold}.")
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.bands, self.rows = _lsh_bands(num_perm, threshold)
+        rng = np.random.default_rng(seed)
+        self._a = rng.integers(1, int(_PRIME), size=(num_perm, 1), dtype=np.uint64)
+        self._b = rng.integers(0, int(_PRIME), size=(num_perm, 1), dtype=np.uint64)
+
+    def signatures(self, sentences: list[str], sentences_words: list[list[str]]) -> np.ndarray:
+        """
+        (n_sentences, num_perm) MinHash signatures. Sentences without content
+        words are represented by their lowercased text.
+        """
+        token_hashes = {}
+        hashes, lengths = [], []
+        for sentence, words in zip(sentences, sentences_words):
+            tokens = set(words) or {sentence.strip().lower()}
+            for token in tokens:
+                if token not in token_hashes:
+                    token_hashes[token] = zlib.crc32(token.encode("utf-8"))
+                hashes.append(token_hashes[token])
+            lengths.append(len(tokens))
+        values = (self._a * np.asarray(hashes, dtype=np.uint64)[None, :] + self._b) % _PRIME
+        offsets = np.concatenate(([0], np.cumsum(lengths)[:-1]))
+        return np.minimum.reduceat(values, offsets, axis=1).T
+
+    def collapse(self, sentences: list[str], sentences_words: list[list[str]]) -> tuple[list[int], list[int]]:
+        """
+        Returns (kept_indices, representative): the indices of the sentences
+        kept, and for every input sentence the index of the kept sentence it
+        was collapsed into (itself if kept).
+        """
+        if len(sentences) < 2:
+            return list(range(len(sentences))), list(range(len(sentences)))
+        signatures = self.signatures(sentences, sentences_words)
+        band_keys = signatures.reshape(len(sentences), self.bands, self.rows)
+        buckets = [{} for _ in range(self.bands)]  # band key -> kept sentence indices
+        kept, representative = [], []
+        for i in range(len(sentences)):
+            keys = [band_keys[i, band].tobytes() for band in range(self.bands)]
+            candidates = sorted({j for band, key in enumerate(keys) for j in buckets[band].get(key, ())})
+            match = next((j for j in candidates
+                          if np.mean(signatures[i] == signatures[j]) >= self.threshold), None)
+            if match is None:
+                kept.append(i)
+                representative.append(i)
+                for band, key in enumerate(keys):
+                    buckets[band].setdefault(key, []).append(i)
+            else:
+                representative.append(match)
+        if len(kept) < len(sentences):
+            logger.debug("Collapsed %d near-duplicate sentences out of %d.", len(sentences) - len(kept), len(sentences))
+        return kept, representative
@@ -1,31 +1,67 @@
 from nltk.corpus import stopwords
-from nltk.tokenize import sent_tokenize, word_tokenize
+from nltk.tokenize import PunktTokenizer, word_tokenize
+from threading import Lock
+from typing import NamedTuple
 # from src.entity.config_entity import TextProcessingConfig
-from src.utils.logging_setup import logger
+from src.constants.constants import DEDUP_THRESHOLD
+from src.modules.sentence_dedup import MinHashDeduplicator
+from src.utils.logging_setup import logger, request_logger
+from src.utils.metrics import STAGE_LATENCY, INPUT_SENTENCES, INPUT_TOKENS
+from src.utils.tracing import tracer
 import string
 
 
+class PreprocessedText(NamedTuple):
+    sentences: list[str]  # whitespace-normalized sentences kept for ranking
+    words: list[list[str]]  # their filtered, lowercased words
+    spans: list[tuple[int, int]]  # their (start, end) character offsets in the original text
+    indices: list[int]  # their positions among all sentences, before near-duplicates were dropped
+
+
 class TextProcessor:
     """
     Initializes the TextProcessor with specified language for stopwords.
     """
-    def __init__(self, language='english'):
+    def __init__(self, language='english', dedup_threshold=DEDUP_THRESHOLD):
         """
         Initializes the TextProcessor with specified language for stopwords.
         Args:
             language (str): The language for stopwords (e.g., 'english').
+            dedup_threshold (float): Similarity above which near-duplicate sentences
+                are collapsed into their first occurrence (None disables it).
         """
         logger.info(f"Initializing TextProcessor with language: '{language}'.")
+        self.language = language
         self.stopwords = set(stopwords.words(language))
         self.punctuation = set(string.punctuation)
+        # Loaded once here rather than looked up on every sent_tokenize call.
+        try:
+            self.sentence_tokenizer = PunktTokenizer(language)
+            self.punkt_language = language
+        except LookupError:
+            logger.warning(f"No punkt sentence model for '{language}'; using the English one.")
+            self.sentence_tokenizer = PunktTokenizer('english')
+            self.punkt_language = 'english'
+        self.dedup_threshold = dedup_threshold
+        self.deduplicator = MinHashDeduplicator(dedup_threshold) if dedup_threshold else None
+
+    def tokenize_sentence_spans(self, text: str) -> list[tuple[int, int]]:
+        """
+        (start, end) character offsets of the sentences in `text`.
+        """
+        # Newlines become spaces without changing the length, so offsets index the original text.
+        return list(self.sentence_tokenizer.span_tokenize(text.replace('\n', ' ')))
+
+    @staticmethod
+    def _normalize_sentence(sentence: str) -> str:
+        return sentence.replace('\n', ' ').replace('  ', ' ')
 
     def tokenize_sentences(self, text: str) -> list[str]:
         """
         Tokenizes the input text into individual sentences.
         """
-        text = text.replace('\n', ' ').replace('  ', ' ')
-        sentences = sent_tokenize(text)
-        logger.debug(f"Tokenized text into {len(sentences)} sentences.")
+        sentences = [self._normalize_sentence(text[start:end]) for start, end in self.tokenize_sentence_spans(text)]
+        logger.debug("Tokenized text into %d sentences.", len(sentences))
         return sentences
 
     def tokenize_words(self, sentence: str) -> list[str]:
@@ -33,20 +69,70 @@ class TextProcessor:
         Tokenizes a sentence into words, converts them to lowercase,
         and removes stopwords and punctuation.
         """
-        words = word_tokenize(sentence)
+        words = word_tokenize(sentence, language=self.punkt_language)
         filtered_words = [
             word.lower() for word in words
             if word.lower() not in self.stopwords and word not in self.punctuation
         ]
-        logger.debug(f"Filtered {len(words)} words down to {len(filtered_words)}.")
+        logger.debug("Filtered %d words down to %d.", len(words), len(filtered_words))
         return filtered_words
 
+    def collapse_near_duplicates(self, sentences: list[str], sentences_words: list[list[str]]) -> tuple[list[str], list[list[str]], list[int]]:
+        """
+        Drops sentences that are near-duplicates of an earlier one. Returns the
+        kept sentences, their words, and their indices in the input.
+        """
+        if self.deduplicator is None:
+            return sentences, sentences_words, list(range(len(sentences)))
+        kept, _ = self.deduplicator.collapse(sentences, sentences_words)
+        return [sentences[i] for i in kept], [sentences_words[i] for i in kept], kept
+
+    def preprocess_document(self, text: str) -> PreprocessedText:
+        """
+        Applies the full preprocessing pipeline to the input text, keeping each
+        sentence's character span and position in the original text.
+        Near-duplicate sentences are collapsed into their first occurrence.
+        """
+        request_logger.info("Starting text preprocessing...")
+        with STAGE_LATENCY.time(stage="preprocess"):
+            with tracer.span("TextProcessor.sentences"):
+                spans = self.tokenize_sentence_spans(text)
+                sentences = [self._normalize_sentence(text[start:end]) for start, end in spans]
+            with tracer.span("TextProcessor.words"):
+                processed_sentences_words = [self.tokenize_words(s) for s in sentences]
+            INPUT_SENTENCES.observe(len(sentences))
+            INPUT_TOKENS.observe(sum(len(words) for words in processed_sentences_words))
+            with tracer.span("TextProcessor.dedup", input_sentences=len(sentences)):
+                sentences, processed_sentences_words, kept = self.collapse_near_duplicates(sentences, processed_sentences_words)
+        request_logger.info("Text preprocessing complete.")
+        return PreprocessedText(sentences, processed_sentences_words, [spans[i] for i in kept], kept)
+
     def preprocess_text(self, text: str) -> tuple[list[str], list[list[str]]]:
         """
         Applies the full preprocessing pipeline to the input text.
+        Near-duplicate sentences are collapsed into their first occurrence, so
+        the returned sentences are original sentences in document order.
         """
-        logger.info("Starting text preprocessing...")
-        sentences = self.tokenize_sentences(text)
-        processed_sentences_words = [self.tokenize_words(s) for s in sentences]
-        logger.info("Text preprocessing complete.")
-        return sentences, processed_sentences_words
+        document = self.preprocess_document(text)
+        return document.sentences, document.words
+
+class TextProcessorPool:
+    """
+    Process-wide cache of TextProcessors, one per (language, dedup threshold),
+    so stopwords and sentence models are loaded once however many summarizers
+    use a language. TextProcessors hold no per-call state and are shared freely.
+    """
+    def __init__(self):
+        self._processors = {}
+        self._lock = Lock()
+
+    def get(self, language: str = 'english', dedup_threshold=DEDUP_THRESHOLD) -> TextProcessor:
+        key = (language, dedup_threshold)
+        if key not in self._processors:
+            with self._lock:
+                if key not in self._processors:
+                    self._processors[key] = TextProcessor(language, dedup_threshold)
+        return self._processors[key]
+
+
+text_processor_pool = TextProcessorPool()
@@ -0,0 +1,264 @@
+# Offline batch summarization over text files, directory trees and JSONL streams.
+#
+# Usage (from the Text_Summarization directory):
+#   python -m src.pipeline.batch_summarization data/docs/ --method textrank --output summaries.jsonl
+#   cat corpus.jsonl | python -m src.pipeline.batch_summarization - --workers 8 --shard-index 0 --num-shards 4
+import argparse
+import json
+import os
+import sys
+import time
+import zlib
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+from itertools import islice
+from src.components.summarizer import Summarizer
+from src.components.summary_store import SummaryStore
+from src.utils.logging_setup import logger
+
+JSONL_EXTENSIONS = (".jsonl", ".ndjson")
+TEXT_EXTENSIONS = (".txt", ".md")
+
+
+def _iter_jsonl_lines(lines, source: str, id_key: str, text_key: str):
+    for line_number, line in enumerate(lines, start=1):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError as e:
+            logger.error(f"Skipping malformed JSON on line {line_number} of {source}: {e}")
+            continue
+        if not isinstance(record, dict):
+            logger.error(f"Skipping non-object JSON on line {line_number} of {source}.")
+            continue
+        yield {"id": record.get(id_key, f"{source}:{line_number}"), "text": record.get(text_key)}
+
+
+def _walk_sorted(directory: str):
+    for root, dirs, files in os.walk(directory):
+        dirs.sort()  # deterministic traversal order across runs
+        for name in sorted(files):
+            yield os.path.join(root, name)
+
+
+def iter_documents(inputs: list[str], id_key: str = "id", text_key: str = "text"):
+    """
+    Lazily yields {"id", "text"} documents from paths or "-" (JSONL on stdin).
+    Directories are walked recursively in sorted order; *.jsonl/*.ndjson files
+    hold one record per line and *.txt/*.md files are one document each, with
+    their path as id.
+    """
+    for source in inputs:
+        if source == "-":
+            yield from _iter_jsonl_lines(sys.stdin, "<stdin>", id_key, text_key)
+            continue
+        paths = _walk_sorted(source) if os.path.isdir(source) else [source]
+        for path in paths:
+            if path.endswith(JSONL_EXTENSIONS):
+                with open(path, "r", encoding="utf-8") as f:
+                    yield from _iter_jsonl_lines(f, path, id_key, text_key)
+            elif path.endswith(TEXT_EXTENSIONS) or path == source:
+                with open(path, "r", encoding="utf-8", errors="replace") as f:
+                    yield {"id": path, "text": f.read()}
+
+
+def in_shard(document_id, shard_index: int, num_shards: int) -> bool:
+    """
+    Stable assignment of a document id to one of `num_shards` shards.
+    """
+    return num_shards <= 1 or zlib.crc32(str(document_id).encode("utf-8")) % num_shards == shard_index
+
+
+def read_processed_ids(output_path: str) -> set[str]:
+    """
+    Ids with a successful result in an existing output file (truncated last
+    lines are ignored). Failed documents are not included, so a resumed run
+    retries them and appends a new record after the error.
+    """
+    processed = set()
+    if not os.path.exists(output_path):
+        return processed
+    with open(output_path, "r", encoding="utf-8") as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+                if record.get("status") == "success":
+                    processed.add(str(record["id"]))
+            except (json.JSONDecodeError, KeyError, TypeError, AttributeError):
+                continue
+    return processed
+
+
+def truncate_partial_line(output_path: str, block_size: int = 65536) -> None:
+    """
+    Drops a trailing incomplete line (left by an interrupted run) before appending.
+    """
+    if not os.path.exists(output_path):
+        return
+    with open(output_path, "r+b") as f:
+        end = position = f.seek(0, os.SEEK_END)
+        while position > 0:
+            read_size = min(block_size, position)
+            position -= read_size
+            f.seek(position)
+            block = f.read(read_size)
+            newline = block.rfind(b"\n")
+            if newline != -1:
+                keep = position + newline + 1
+                break
+        else:
+            keep = 0
+        if keep != end:
+            logger.warning(f"Removing {end - keep} bytes of an incomplete last line from {output_path}.")
+            f.truncate(keep)
+
+
+def _method_params(method: str, num_sentences: int, params: dict) -> dict:
+    if method == "t5":
+        return dict(params)  # length bounds follow each document's size
+    return {"num_sentences": num_sentences, **params}
+
+
+_worker_summarizer = None
+
+
+def _init_worker(language: str, store_path: str = None):
+    global _worker_summarizer
+    # Each process opens its own SQLite connection; WAL mode lets them write concurrently.
+    _worker_summarizer = Summarizer(language=language, store=SummaryStore(store_path) if store_path else None)
+
+
+def _summarize_chunk(chunk: list[dict]) -> list[dict]:
+    results = []
+    for item in chunk:
+        if not isinstance(item.get("text"), str) or not item["text"].strip():
+            results.append({"id": item["id"], "method": item["method"], "status": "error", "error": "Empty or missing text."})
+            continue
+        try:
+            results.append(_worker_summarizer.summarize_item(item))
+        except Exception as e:
+            logger.error(f"Unexpected error summarizing document {item['id']!r}: {e}", exc_info=True)
+            results.append({"id": item["id"], "method": item["method"], "status": "error", "error": str(e)})
+    return results
+
+
+class BatchSummarizationJob:
+    """
+    Summarizes a stream of documents with worker processes and appends one JSON
+    line per document to the output as chunks complete. Memory is bounded by the
+    number of chunks in flight, not by the corpus size.
+    """
+    def __init__(self, method: str = "tfidf", params: dict = None, language: str = "english",
+                 workers: int = None, chunk_size: int = 16, shard_index: int = 0, num_shards: int = 1,
+                 progress_every: float = 10.0, store_path: str = None):
+        if not 0 <= shard_index < max(num_shards, 1):
+            raise ValueError(f"shard_index must be in [0, {num_shards}).")
+        self.method = method
+        self.params = params or {}
+        self.language = language
+        self.workers = workers or os.cpu_count() or 1
+        self.chunk_size = max(1, chunk_size)
+        self.shard_index = shard_index
+        self.num_shards = num_shards
+        self.progress_every = progress_every
+        self.store_path = store_path
+        logger.info(f"BatchSummarizationJob initialized (method={method}, workers={self.workers}, "
+                    f"shard {shard_index}/{num_shards}).")
+
+    def _items(self, documents, processed: set[str], counts: dict):
+        for document in documents:
+            if not in_shard(document["id"], self.shard_index, self.num_shards):
+                continue
+            if str(document["id"]) in processed:
+                counts["skipped"] += 1
+                continue
+            yield {"id": document["id"], "text": document["text"], "method": self.method, "params": self.params}
+
+    def run(self, documents, output_path: str, overwrite: bool = False) -> dict:
+        """
+        Processes `documents` (an iterable of {"id", "text"}) into `output_path`
+        (JSONL). Unless `overwrite`, ids already summarized successfully are
+        skipped, so an interrupted job can simply be re-run (failed ids are retried).
+        """
+        if not overwrite:
+            truncate_partial_line(output_path)
+        processed = set() if overwrite else read_processed_ids(output_path)
+        if processed:
+            logger.info(f"Skipping {len(processed)} ids already summarized in {output_path}.")
+        counts = {"processed": 0, "errors": 0, "skipped": 0}
+        items = self._items(documents, processed, counts)
+        chunks = iter(lambda: list(islice(items, self.chunk_size)), [])
+        start = last_report = time.perf_counter()
+
+        def write(sink, results):
+            nonlocal last_report
+            for result in results:
+                sink.write(json.dumps(result, ensure_ascii=False) + "\n")
+                counts["processed"] += 1
+                counts["errors"] += result.get("status") != "success"
+            sink.flush()
+            now = time.perf_counter()
+            if now - last_report >= self.progress_every:
+                last_report = now
+                logger.info(f"Progress: {counts['processed']} summarized ({counts['processed'] / (now - start):.1f} docs/s), "
+                            f"{counts['errors']} errors, {counts['skipped']} skipped.")
+
+        with open(output_path, "w" if overwrite else "a", encoding="utf-8") as sink:
+            if self.workers == 1:
+                _init_worker(self.language, self.store_path)
+                for chunk in chunks:
+                    write(sink, _summarize_chunk(chunk))
+            else:
+                # Keep a bounded number of chunks in flight so memory stays flat.
+                with ProcessPoolExecutor(max_workers=self.workers, initializer=_init_worker,
+                                         initargs=(self.language, self.store_path)) as executor:
+                    pending = set()
+                    for chunk in chunks:
+                        pending.add(executor.submit(_summarize_chunk, chunk))
+                        if len(pending) >= self.workers * 2:
+                            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                            for future in done:
+                                write(sink, future.result())
+                    for future in wait(pending)[0]:
+                        write(sink, future.result())
+
+        counts["elapsed_s"] = time.perf_counter() - start
+        counts["docs_per_sec"] = counts["processed"] / counts["elapsed_s"] if counts["elapsed_s"] > 0 else 0.0
+        logger.info(f"Batch complete: {counts['processed']} summarized, {counts['errors']} errors, "
+                    f"{counts['skipped']} skipped in {counts['elapsed_s']:.1f}s.")
+        return counts
+
+
+def main(argv: list[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="Summarize text files, directories or JSONL streams into JSONL.")
+    parser.add_argument("inputs", nargs="+", help="Files, directories, or '-' for JSONL on stdin.")
+    parser.add_argument("--output", required=True, help="Output JSONL file (appended to unless --overwrite).")
+    parser.add_argument("--method", default="tfidf")
+    parser.add_argument("--num-sentences", type=int, default=3)
+    parser.add_argument("--params", type=json.loads, default={}, help="Extra method kwargs as JSON.")
+    parser.add_argument("--language", default="english")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: CPU count).")
+    parser.add_argument("--chunk-size", type=int, default=16, help="Documents per worker task.")
+    parser.add_argument("--shard-index", type=int, default=0)
+    parser.add_argument("--num-shards", type=int, default=1)
+    parser.add_argument("--id-key", default="id")
+    parser.add_argument("--text-key", default="text")
+    parser.add_argument("--overwrite", action="store_true", help="Start over instead of skipping processed ids.")
+    parser.add_argument("--progress-every", type=float, default=10.0, help="Seconds between progress reports.")
+    parser.add_argument("--store", default=None,
+                        help="SQLite summary store; unchanged documents are served from it instead of re-summarized.")
+    args = parser.parse_args(argv)
+
+    from src.utils.nltk_resources import download_nltk_resources
+    download_nltk_resources()
+
+    job = BatchSummarizationJob(args.method, _method_params(args.method, args.num_sentences, args.params),
+                                args.language, args.workers, args.chunk_size, args.shard_index,
+                                args.num_shards, args.progress_every, args.store)
+    counts = job.run(iter_documents(args.inputs, args.id_key, args.text_key), args.output, args.overwrite)
+    return 1 if counts["processed"] and counts["errors"] == counts["processed"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,175 @@
+import json
+import os
+import time
+from src.components.evaluate import MetricAggregator, SummarizationEvaluator
+from src.components.summarizer import Summarizer
+from src.utils.helpers import save_json
+from src.utils.logging_setup import logger
+
+
+class StreamingEvaluationPipeline:
+    """
+    Summarizes and evaluates a JSONL dataset record by record.
+
+    Records are read lazily, each result is appended to a JSONL output file as
+    soon as it is computed, and only running aggregates are kept in memory.
+    A checkpoint (input byte offset, output size, aggregate state and the run's
+    settings) is written periodically, so an interrupted run resumes from the
+    last checkpoint; a checkpoint written with other methods or keys is ignored.
+    """
+    def __init__(self, summarizer: Summarizer, evaluator: SummarizationEvaluator,
+                 methods: dict[str, dict], output_path: str, checkpoint_path: str = None,
+                 checkpoint_every: int = 50, id_key: str = "id", text_key: str = "text",
+                 reference_key: str = "reference"):
+        self.summarizer = summarizer
+        self.evaluator = evaluator
+        self.methods = methods
+        self.output_path = output_path
+        self.checkpoint_path = checkpoint_path or f"{output_path}.checkpoint.json"
+        self.checkpoint_every = max(1, checkpoint_every)
+        self.id_key = id_key
+        self.text_key = text_key
+        self.reference_key = reference_key
+        logger.info(f"StreamingEvaluationPipeline initialized for methods: {list(methods)}.")
+
+    @property
+    def config(self) -> dict:
+        """
+        Settings that shape the results; a checkpoint is only resumed under the same ones.
+        """
+        config = {
+            "methods": self.methods,
+            "id_key": self.id_key,
+            "text_key": self.text_key,
+            "reference_key": self.reference_key,
+            "language": getattr(self.summarizer, "language", None),
+            "rouge_engine": getattr(self.evaluator, "rouge_engine", None),
+        }
+        return json.loads(json.dumps(config, sort_keys=True, default=str))
+
+    def _load_checkpoint(self, dataset_path: str) -> dict:
+        if not os.path.exists(self.checkpoint_path):
+            return {}
+        with open(self.checkpoint_path, "r") as f:
+            checkpoint = json.load(f)
+        if checkpoint.get("dataset") != os.path.abspath(dataset_path):
+            logger.warning(f"Checkpoint {self.checkpoint_path} belongs to another dataset. Starting over.")
+            return {}
+        if checkpoint.get("config") != self.config:
+            logger.warning(f"Checkpoint {self.checkpoint_path} was written with different methods or settings "
+                           f"({checkpoint.get('config')}). Starting over.")
+            return {}
+        return checkpoint
+
+    def _save_checkpoint(self, dataset_path: str, input_offset: int, records_done: int,
+                         sink, aggregator: MetricAggregator) -> None:
+        # Results must be on disk before the checkpoint that points past them.
+        os.fsync(sink.fileno())
+        checkpoint = {
+            "dataset": os.path.abspath(dataset_path),
+            "config": self.config,
+            "input_offset": input_offset,
+            "records_done": records_done,
+            "output_size": sink.tell(),
+            "aggregator": aggregator.state(),
+        }
+        tmp_path = f"{self.checkpoint_path}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(checkpoint, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.checkpoint_path)
+
+    def _process_record(self, record: dict, record_number: int) -> dict:
+        text = record.get(self.text_key, "")
+        reference = record.get(self.reference_key, "")
+        summaries, metrics = {}, {}
+
+        for method, kwargs in self.methods.items():
+            try:
+                summary_list = self.summarizer.summarize_text(text, method=method, **kwargs)
+                summary = " ".join(summary_list) if isinstance(summary_list, list) else summary_list
+            except Exception as e:
+                logger.error(f"An error occurred during {method} summarization: {e}", exc_info=True)
+                summary = f"Error: {e}"
+            summaries[method] = summary
+            if not summary or "Error:" in summary:
+                metrics[method] = {"evaluation_status": "failed", "error_message": summary}
+
+        to_score = {method: summaries[method] for method in self.methods if method not in metrics}
+        if to_score and reference:
+            metrics.update(self.evaluator.evaluate_many_candidates(to_score, reference))
+        elif to_score:
+            metrics.update({method: {"evaluation_status": "skipped", "message": "No reference summary."}
+                            for method in to_score})
+
+        return {
+            "id": record.get(self.id_key, record_number),
+            "summaries": summaries,
+            "metrics": {method: metrics[method] for method in self.methods},
+        }
+
+    def run(self, dataset_path: str, summary_path: str = None, limit: int = None, resume: bool = True) -> dict:
+        """
+        Processes `dataset_path` (JSONL) and returns the corpus-level report.
+        Set `limit` to stop after that many records in this invocation, and
+        `resume=False` to ignore an existing checkpoint and start over.
+        """
+        if not resume and os.path.exists(self.checkpoint_path):
+            os.remove(self.checkpoint_path)
+        checkpoint = self._load_checkpoint(dataset_path)
+        output_size = os.path.getsize(self.output_path) if os.path.exists(self.output_path) else -1
+        if checkpoint and output_size < checkpoint.get("output_size", 0):
+            logger.warning(f"Output file {self.output_path} is missing or shorter than the checkpoint expects. "
+                           f"Discarding the checkpoint and starting over.")
+            checkpoint = {}
+        input_offset = checkpoint.get("input_offset", 0)
+        records_done = checkpoint.get("records_done", 0)
+        aggregator = MetricAggregator()
+        aggregator.load_state(checkpoint.get("aggregator", {}))
+
+        if checkpoint:
+            logger.info(f"Resuming from checkpoint: {records_done} records already processed.")
+        # Drop results written after the last checkpoint; they will be recomputed.
+        mode = "r+b" if checkpoint else "wb"
+        processed_now = 0
+        start = time.perf_counter()
+
+        with open(dataset_path, "rb") as source, open(self.output_path, mode) as sink:
+            sink.truncate(checkpoint.get("output_size", 0))
+            sink.seek(0, os.SEEK_END)
+            source.seek(input_offset)
+
+            for line in iter(source.readline, b""):
+                input_offset = source.tell()
+                if not line.strip():
+                    continue
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError as e:
+                    logger.error(f"Skipping malformed record after {records_done} records: {e}")
+                    continue
+
+                result = self._process_record(record, records_done)
+                for method, metrics in result["metrics"].items():
+                    aggregator.add(method, metrics)
+                sink.write((json.dumps(result) + "\n").encode("utf-8"))
+                sink.flush()
+                records_done += 1
+                processed_now += 1
+
+                if records_done % self.checkpoint_every == 0:
+                    self._save_checkpoint(dataset_path, input_offset, records_done, sink, aggregator)
+                    logger.info(f"Checkpoint saved after {records_done} records.")
+                if limit is not None and processed_now >= limit:
+                    break
+
+            self._save_checkpoint(dataset_path, input_offset, records_done, sink, aggregator)
+
+        elapsed = time.perf_counter() - start
+        report = aggregator.summary()
+        report["num_records"] = records_done
+        logger.info(f"Processed {processed_now} records in {elapsed:.2f}s ({records_done} total).")
+        if summary_path:
+            save_json(summary_path, report)
+        return report
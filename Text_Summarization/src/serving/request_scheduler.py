@@ -0,0 +1,147 @@
+import os
+import threading
+from collections import Counter, defaultdict
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from src.constants.constants import (
+    SERVING_DEFAULT_QUEUE_LIMIT,
+    SERVING_QUEUE_LIMITS,
+    SERVING_REQUEST_TIMEOUT,
+)
+from src.utils.logging_setup import logger
+
+
+class QueueFullError(Exception):
+    """
+    Raised when a method's request queue is full (maps to HTTP 429).
+    """
+    def __init__(self, method: str, limit: int):
+        super().__init__(f"Too many pending '{method}' requests (limit {limit}). Retry later.")
+        self.method = method
+        self.limit = limit
+
+
+class ServiceUnavailableError(Exception):
+    """
+    Raised while draining or when a request waited too long (maps to HTTP 503).
+    """
+
+
+class RequestScheduler:
+    """
+    Runs summarization work on a worker pool sized to the CPU cores, admitting
+    at most a bounded number of queued or running requests per method.
+
+    Requests beyond a method's limit are rejected immediately with
+    QueueFullError, so a burst of slow 't5' calls cannot starve cheap methods
+    or make every request time out together. `drain` stops admission and waits
+    for in-flight work before the process exits.
+    """
+    def __init__(self, max_workers: int = None, queue_limits: dict[str, int] = None,
+                 default_queue_limit: int = SERVING_DEFAULT_QUEUE_LIMIT,
+                 request_timeout: float = SERVING_REQUEST_TIMEOUT):
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.queue_limits = {**SERVING_QUEUE_LIMITS, **(queue_limits or {})}
+        self.default_queue_limit = default_queue_limit
+        self.request_timeout = request_timeout
+        self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="serving-worker")
+        self._pending = defaultdict(int)
+        self._lock = threading.Lock()
+        self._idle = threading.Condition(self._lock)
+        self._draining = False
+        logger.info(f"RequestScheduler initialized with {self.max_workers} workers.")
+
+    def queue_limit(self, method: str) -> int:
+        return self.queue_limits.get(method.lower(), self.default_queue_limit)
+
+    def _release(self, method: str, count: int = 1) -> None:
+        with self._lock:
+            self._pending[method] -= count
+            if not any(self._pending.values()):
+                self._idle.notify_all()
+
+    def _admit(self, counts: Counter) -> None:
+        """
+        Reserves `counts[method]` slots for every method at once, or none.
+        A group larger than a method's limit is admitted only while that
+        method is idle, so a legal batch is never rejected by its own size.
+        """
+        with self._lock:
+            if self._draining:
+                raise ServiceUnavailableError("Server is shutting down.")
+            for method, count in counts.items():
+                limit, pending = self.queue_limit(method), self._pending[method]
+                if pending + count > limit and (pending or count == 1):
+                    logger.warning(f"Rejecting {count} '{method}' request(s): {pending} pending (limit {limit}).")
+                    raise QueueFullError(method, limit)
+            for method, count in counts.items():
+                self._pending[method] += count
+
+    def _start(self, method: str, fn, args: tuple, kwargs: dict) -> Future:
+        future = self._executor.submit(fn, *args, **kwargs)
+        future.add_done_callback(lambda _: self._release(method))
+        return future
+
+    def submit(self, method: str, fn, *args, **kwargs) -> Future:
+        """
+        Schedules `fn(*args, **kwargs)` under `method`'s queue limit.
+        Raises QueueFullError or ServiceUnavailableError instead of queueing unboundedly.
+        """
+        method = method.lower()
+        self._admit(Counter({method: 1}))
+        try:
+            return self._start(method, fn, args, kwargs)
+        except RuntimeError:
+            self._release(method)
+            raise ServiceUnavailableError("Server is shutting down.")
+
+    def submit_batch(self, jobs: list[tuple[str, object, tuple]]) -> list[Future]:
+        """
+        Schedules (method, fn, args) jobs admitted as one unit: either all of
+        them are queued or QueueFullError/ServiceUnavailableError is raised.
+        """
+        jobs = [(method.lower(), fn, args) for method, fn, args in jobs]
+        self._admit(Counter(method for method, _, _ in jobs))
+        futures = []
+        for position, (method, fn, args) in enumerate(jobs):
+            try:
+                futures.append(self._start(method, fn, args, {}))
+            except RuntimeError:
+                for future in futures:
+                    future.cancel()
+                for unstarted, _, _ in jobs[position:]:
+                    self._release(unstarted)
+                raise ServiceUnavailableError("Server is shutting down.")
+        return futures
+
+    def run(self, method: str, fn, *args, **kwargs):
+        """
+        Submits work and waits for its result up to the request timeout.
+        """
+        future = self.submit(method, fn, *args, **kwargs)
+        try:
+            return future.result(timeout=self.request_timeout)
+        except FutureTimeoutError:
+            future.cancel()
+            raise ServiceUnavailableError(f"'{method}' request timed out after {self.request_timeout:.0f}s.")
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "workers": self.max_workers,
+                "draining": self._draining,
+                "pending": {method: count for method, count in self._pending.items() if count},
+                "limits": {**self.queue_limits, "default": self.default_queue_limit},
+            }
+
+    def drain(self, timeout: float = None) -> bool:
+        """
+        Stops admitting requests and waits for in-flight ones to finish.
+        Returns True if everything finished within `timeout`.
+        """
+        with self._lock:
+            self._draining = True
+            logger.info(f"Draining {sum(self._pending.values())} in-flight request(s)...")
+            drained = self._idle.wait_for(lambda: not any(self._pending.values()), timeout=timeout)
+        self._executor.shutdown(wait=drained, cancel_futures=not drained)
+        logger.info("Request scheduler drained." if drained else "Drain timed out; cancelled queued requests.")
+        return drained
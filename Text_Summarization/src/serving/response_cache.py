@@ -0,0 +1,168 @@
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from src.constants.constants import RESPONSE_CACHE_DISK_MAX_ENTRIES, RESPONSE_CACHE_MAX_ENTRIES, RESPONSE_CACHE_TTL
+from src.utils.logging_setup import logger
+from src.utils.metrics import CACHE_REQUESTS
+
+
+class SummaryCache:
+    """
+    TTL + LRU cache of summary results keyed by a hash of the normalized text,
+    method and parameters, with an optional on-disk store shared across restarts.
+
+    Each entry carries an ETag derived from the cached result, so clients can
+    revalidate with If-None-Match without the summary being recomputed.
+    The disk store keeps at most `disk_max_entries` files; every write removes
+    expired files and the oldest ones beyond that cap, in write (mtime) order.
+    """
+    def __init__(self, max_entries: int = RESPONSE_CACHE_MAX_ENTRIES, ttl: float = RESPONSE_CACHE_TTL,
+                 disk_dir: str = None, disk_max_entries: int = RESPONSE_CACHE_DISK_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.disk_dir = disk_dir
+        self.disk_max_entries = disk_max_entries
+        self._entries = OrderedDict()
+        self._disk_index = OrderedDict()  # key -> write time, oldest first
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        if disk_dir:
+            os.makedirs(disk_dir, exist_ok=True)
+            self._scan_disk()
+        logger.info(f"SummaryCache initialized (max_entries={max_entries}, ttl={ttl}s, disk_dir={disk_dir}).")
+
+    @staticmethod
+    def make_key(text: str, method: str, params: dict) -> str:
+        """
+        Hashes whitespace-normalized text, lower-cased method and sorted parameters.
+        """
+        normalized = " ".join(text.split())
+        payload = json.dumps({"method": method.lower(), "params": params}, sort_keys=True)
+        digest = hashlib.sha256(payload.encode("utf-8"))
+        digest.update(b"\0")
+        digest.update(normalized.encode("utf-8"))
+        return digest.hexdigest()
+
+    @staticmethod
+    def make_etag(value) -> str:
+        return hashlib.sha256(json.dumps(value, sort_keys=True).encode("utf-8")).hexdigest()[:32]
+
+    def _disk_path(self, key: str) -> str:
+        return os.path.join(self.disk_dir, key[:2], f"{key}.json")
+
+    def _scan_disk(self) -> None:
+        """
+        Indexes entries left by earlier runs, oldest first, and prunes the store.
+        """
+        found = []
+        for shard in os.scandir(self.disk_dir):
+            if not shard.is_dir():
+                continue
+            for item in os.scandir(shard.path):
+                if item.name.endswith(".json"):
+                    try:
+                        found.append((item.stat().st_mtime, item.name[:-len(".json")]))
+                    except OSError:
+                        continue
+        for written_at, key in sorted(found):
+            self._disk_index[key] = written_at
+        self._prune_disk()
+
+    def _prune_disk(self) -> None:
+        """
+        Deletes expired entries and the oldest ones beyond `disk_max_entries`.
+        Entries share one TTL, so the oldest written are the first to expire.
+        """
+        expired_before = time.time() - self.ttl
+        while self._disk_index:
+            key, written_at = next(iter(self._disk_index.items()))
+            if len(self._disk_index) <= self.disk_max_entries and written_at >= expired_before:
+                break
+            del self._disk_index[key]
+            try:
+                os.remove(self._disk_path(key))
+            except OSError:
+                pass
+
+    def _read_disk(self, key: str):
+        path = self._disk_path(key)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                entry = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return None
+        if entry["expires_at"] < time.time():
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            return None
+        return entry
+
+    def _write_disk(self, key: str, entry: dict) -> None:
+        path = self._disk_path(key)
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp_path = f"{path}.{threading.get_ident()}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(entry, f)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.error(f"Could not write cache entry {key} to disk: {e}")
+            return
+        with self._lock:
+            self._disk_index.pop(key, None)
+            self._disk_index[key] = time.time()
+            self._prune_disk()
+
+    def get(self, key: str):
+        """
+        Returns the cached entry ({"value", "etag", "expires_at"}) or None.
+        """
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if entry["expires_at"] >= now:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    CACHE_REQUESTS.inc(result="hit")
+                    return entry
+                del self._entries[key]
+
+        entry = self._read_disk(key) if self.disk_dir else None
+        with self._lock:
+            if entry is None:
+                self.misses += 1
+                CACHE_REQUESTS.inc(result="miss")
+                return None
+            self.hits += 1
+            CACHE_REQUESTS.inc(result="disk_hit")
+            self._store(key, entry)
+        return entry
+
+    def _store(self, key: str, entry: dict) -> None:
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def set(self, key: str, value) -> dict:
+        """
+        Caches `value` (JSON-serializable) and returns the stored entry.
+        """
+        entry = {"value": value, "etag": self.make_etag(value), "expires_at": time.time() + self.ttl}
+        with self._lock:
+            self._store(key, entry)
+        if self.disk_dir:
+            self._write_disk(key, entry)
+        return entry
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {"entries": len(self._entries), "disk_entries": len(self._disk_index),
+                    "hits": self.hits, "misses": self.misses}
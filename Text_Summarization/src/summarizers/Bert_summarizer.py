@@ -2,7 +2,15 @@
 import numpy as np
 from src.modules.text_preprocessing import TextProcessor
 from src.core.base import BaseSummarizer
-from src.utils.logging_setup import logger
+from src.components.model_registry import ModelRegistry, model_registry
+from src.core.model_cache import model_cache
+from src.core.inference_scheduler import InferenceScheduler, inference_scheduler
+from src.components.embedding_index import EmbeddingIndexStore, embedding_index_store
+from src.constants.constants import EMBEDDING_BATCH_SIZE, EMBEDDING_INDEX_FORMAT
+from src.core.summary_result import SummaryResult, select_top
+from src.modules.text_preprocessing import PreprocessedText
+from src.utils.logging_setup import logger, request_logger
+from src.utils.metrics import STAGE_LATENCY, ERRORS_TOTAL
 from transformers import AutoTokenizer, AutoModel
 import torch
 from sklearn.metrics.pairwise import cosine_similarity
@@ -11,53 +19,139 @@ class BERTExtractiveSummarizer(BaseSummarizer):
     """
     Extractive summarizer using BERT embeddings.
     """
-    def __init__(self, text_processor: TextProcessor, model_name: str = "bert-base-uncased"):
+    def __init__(self, text_processor: TextProcessor, model_name: str = "bert-base-uncased",
+                 registry: ModelRegistry = None, index_store: EmbeddingIndexStore = None,
+                 scheduler: InferenceScheduler = None):
         super().__init__(text_processor)
         self.model_name = model_name
+        self.registry = registry or model_registry
+        self.index_store = index_store or embedding_index_store
+        self.scheduler = scheduler or inference_scheduler
         self.tokenizer = None
         self.model = None
         self.device = None
         self._load_model()
         logger.info(f"BERTExtractiveSummarizer initialized with model '{model_name}'.")
 
+    @property
+    def available(self) -> bool:
+        return self.model is not None
+
+    def _load_artifacts(self) -> tuple:
+        # Only the local registry is consulted, so loading never touches the network.
+        model_path = self.registry.resolve(self.model_name)
+        tokenizer = AutoTokenizer.from_pretrained(model_path, local_files_only=True)
+        model = AutoModel.from_pretrained(model_path, local_files_only=True)
+        device = torch.device('cuda' if torch.cuda.is_available() else 'cpu')
+        model.to(device)
+        model.eval()
+        return tokenizer, model, device
+
     def _load_model(self):
         try:
-            import torch
-            self.tokenizer = AutoTokenizer.from_pretrained(self.model_name)
-            self.model = AutoModel.from_pretrained(self.model_name)
-            self.device = torch.device('cuda' if torch.cuda.is_available() else 'cpu')
-            self.model.to(self.device)
+            # Shared process-wide, so summarizers for other languages reuse the same weights.
+            self.tokenizer, self.model, self.device = model_cache.get(
+                ("bert_extractive", self.registry.root, self.model_name), self._load_artifacts)
             logger.info(f"BERT model '{self.model_name}' loaded successfully on {self.device}.")
         except Exception as e:
             logger.error(f"Could not load BERT model '{self.model_name}': {e}")
             self.model = None
 
-    def summarize(self, text: str, num_sentences: int = 3) -> list[str]:
-        logger.info(f"Starting BERT extractive summarization for {num_sentences} sentences.")
+    def embed(self, sentences: list[str], batch_size: int = EMBEDDING_BATCH_SIZE) -> np.ndarray:
+        """
+        [CLS] embeddings of `sentences`, encoded `batch_size` at a time on the
+        inference scheduler's slots.
+        """
+        batches = []
+        with STAGE_LATENCY.time(stage="forward", method="bert_extractive"):
+            for start in range(0, len(sentences), batch_size):
+                batch = sentences[start:start + batch_size]
+                with self.span("tokenize"):
+                    encoded_input = self.tokenizer(batch, padding=True, truncation=True, return_tensors='pt').to(self.device)
+                with self.span("inference", batch_size=len(batch)):
+                    batches.append(self.scheduler.run(self._forward, encoded_input))
+        return np.concatenate(batches).astype(np.float32)
+
+    def _forward(self, encoded_input) -> np.ndarray:
+        with torch.no_grad():
+            model_output = self.model(**encoded_input)
+        return model_output.last_hidden_state[:, 0, :].cpu().numpy()
+
+    def index_key(self, text: str) -> str:
+        return self.index_store.make_key(text, format=EMBEDDING_INDEX_FORMAT, model=self.model_name,
+                                         registry=self.registry.root,
+                                         language=getattr(self.text_processor, "language", None),
+                                         dedup_threshold=getattr(self.text_processor, "dedup_threshold", None))
+
+    def document_index(self, text: str):
+        """
+        The document's persistent sentence embedding index, built on first use.
+        """
+        def build():
+            with self.span("preprocess"):
+                document = self.text_processor.preprocess_document(text)
+            embeddings = self.embed(document.sentences) if document.sentences else np.empty((0, 0), dtype=np.float32)
+            return document.sentences, embeddings, {"spans": document.spans, "indices": document.indices}
+        return self.index_store.get_or_build(self.index_key(text), build)
+
+    def summarize_query(self, text: str, query: str, num_sentences: int = 3) -> SummaryResult:
+        """
+        The `num_sentences` sentences most similar to `query`, in document order.
+        Repeated queries on a document reuse its index, so each one costs a
+        single query encoding plus a matrix-vector product.
+        """
+        request_logger.info("Starting query-focused BERT summarization for %d sentences.", num_sentences)
+        index = self.document_index(text)
+        document = PreprocessedText(index.sentences, [], index.meta["spans"], index.meta["indices"])
+        if index.meta["count"] <= num_sentences:
+            return self.build_result(text, document, range(index.meta["count"]))
+        with self.span("query_encode"):
+            query_embedding = self.embed([query])[0]
+        with self.span("rank"):
+            top_indices, scores = index.search(query_embedding, num_sentences)
+            result = self.build_result(text, document, sorted(top_indices), dict(zip(top_indices, scores)))
+        request_logger.info("Query-focused BERT summarization complete. Extracted %d sentences.", len(result.selected))
+        return result
+
+    def summarize_result(self, text: str, num_sentences: int = 3, query: str = None) -> SummaryResult:
+        """
+        Ranks sentences by similarity to the document centroid or, when `query`
+        is given, to the query (see summarize_query).
+        """
         if self.model is None:
-            return ["BERT summarizer not available due to missing dependencies or loading error."]
+            raise ValueError("BERT summarizer not available due to missing dependencies or loading error.")
+        if query is not None and not str(query).strip():
+            raise ValueError("'query' must be a non-empty string.")
+        if query is not None:
+            return self.summarize_query(text, str(query), num_sentences)
 
-        original_sentences, _ = self.text_processor.preprocess_text(text)
+        request_logger.info("Starting BERT extractive summarization for %d sentences.", num_sentences)
+        with self.span("preprocess"):
+            document = self.text_processor.preprocess_document(text)
 
-        if not original_sentences or len(original_sentences) <= num_sentences:
-            return original_sentences
+        if not document.sentences or len(document.sentences) <= num_sentences:
+            return self.build_result(text, document, range(len(document.sentences)))
 
-        try:
-            encoded_input = self.tokenizer(original_sentences, padding=True, truncation=True, return_tensors='pt').to(self.device)
-            with torch.no_grad():
-                model_output = self.model(**encoded_input)
+        sentence_embeddings = self.embed(document.sentences)
 
-            sentence_embeddings = model_output.last_hidden_state[:, 0, :].cpu().numpy()
+        with self.span("similarity"):
             centroid = np.mean(sentence_embeddings, axis=0)
-            similarity_to_centroid = cosine_similarity(sentence_embeddings, centroid.reshape(1, -1))
+            similarity_to_centroid = cosine_similarity(sentence_embeddings, centroid.reshape(1, -1)).flatten()
 
-            ranked_sentence_indices = np.argsort(similarity_to_centroid.flatten())[::-1]
-            top_sentence_indices = ranked_sentence_indices[:num_sentences]
+        with self.span("rank"):
+            result = self.build_result(text, document, select_top(similarity_to_centroid, num_sentences), similarity_to_centroid)
 
-            final_summary = [original_sentences[i] for i in sorted(top_sentence_indices)]
-            logger.info(f"BERT extractive summarization complete. Extracted {len(final_summary)} sentences.")
-            return final_summary
+        request_logger.info("BERT extractive summarization complete. Extracted %d sentences.", len(result.selected))
+        return result
 
+    def summarize(self, text: str, num_sentences: int = 3, query: str = None) -> list[str]:
+        if self.model is None:
+            return ["BERT summarizer not available due to missing dependencies or loading error."]
+        if query is not None and not str(query).strip():
+            raise ValueError("'query' must be a non-empty string.")
+        try:
+            return self.summarize_result(text, num_sentences, query).sentences()
         except Exception as e:
             logger.error(f"Error during BERT summarization: {e}")
+            ERRORS_TOTAL.inc(component="bert_extractive")
             return [f"Error during BERT summarization: {e}"]
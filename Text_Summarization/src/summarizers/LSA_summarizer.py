@@ -1,9 +1,11 @@
 import numpy as np
 from sklearn.decomposition import TruncatedSVD
+from src.core.summary_result import SummaryResult, select_top
 from src.modules.text_preprocessing import TextProcessor
 from src.core.base import BaseSummarizer
+from sklearn.base import clone
 from sklearn.feature_extraction.text import TfidfVectorizer
-from src.utils.logging_setup import logger
+from src.utils.logging_setup import logger, request_logger
 
 class LSASummarizer(BaseSummarizer):
     """
@@ -14,36 +16,43 @@ class LSASummarizer(BaseSummarizer):
         self.vectorizer = TfidfVectorizer()
         logger.info("LSASummarizer initialized.")
 
-    def summarize(self, text: str, num_sentences: int = 3) -> list[str]:
-        logger.info(f"Starting LSA summarization for {num_sentences} sentences.")
-        original_sentences, _ = self.text_processor.preprocess_text(text)
+    def summarize_result(self, text: str, num_sentences: int = 3) -> SummaryResult:
+        request_logger.info("Starting LSA summarization for %d sentences.", num_sentences)
+        with self.span("preprocess"):
+            document = self.text_processor.preprocess_document(text)
+        original_sentences = document.sentences
 
         if not original_sentences:
             logger.warning("No sentences found in the input text. Returning an empty summary.")
-            return []
+            return SummaryResult(text)
 
         if len(original_sentences) <= num_sentences:
-            logger.info("Number of sentences requested is greater than or equal to the total sentences. Returning all.")
-            return original_sentences
+            request_logger.info("Number of sentences requested is greater than or equal to the total sentences. Returning all.")
+            return self.build_result(text, document, range(len(original_sentences)))
 
         if len(original_sentences) < 2:
             logger.warning("Not enough sentences for LSA. Returning all available sentences.")
-            return original_sentences
+            return self.build_result(text, document, range(len(original_sentences)))
 
-        tfidf_matrix = self.vectorizer.fit_transform(original_sentences)
+        # Fit a copy so concurrent calls never share a fitted vocabulary.
+        with self.span("vectorize"):
+            tfidf_matrix = clone(self.vectorizer).fit_transform(original_sentences)
         n_components = min(num_sentences, tfidf_matrix.shape[0] - 1)
 
         if n_components <= 0:
             logger.warning("Not enough sentences for SVD. Returning first sentences.")
-            return original_sentences[:num_sentences]
+            return self.build_result(text, document, range(num_sentences))
+
+        with self.span("svd", n_components=n_components):
+            svd = TruncatedSVD(n_components=n_components, random_state=42)
+            transformed_sentences = svd.fit_transform(tfidf_matrix)
 
-        svd = TruncatedSVD(n_components=n_components, random_state=42)
-        transformed_sentences = svd.fit_transform(tfidf_matrix)
+        with self.span("rank"):
+            sentence_scores = np.abs(transformed_sentences[:, 0])
+            result = self.build_result(text, document, select_top(sentence_scores, num_sentences), sentence_scores)
 
-        sentence_scores = np.abs(transformed_sentences[:, 0])
-        ranked_sentence_indices = np.argsort(sentence_scores)[::-1]
-        top_sentence_indices = ranked_sentence_indices[:num_sentences]
+        request_logger.info("LSA summarization complete. Extracted %d sentences.", len(result.selected))
+        return result
 
-        final_summary = [original_sentences[i] for i in sorted(top_sentence_indices)]
-        logger.info(f"LSA summarization complete. Extracted {len(final_summary)} sentences.")
-        return final_summary
+    def summarize(self, text: str, num_sentences: int = 3) -> list[str]:
+        return self.summarize_result(text, num_sentences).sentences()
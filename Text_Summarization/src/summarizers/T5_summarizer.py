@@ -1,44 +1,200 @@
+import queue
+import threading
+import time
 from src.modules.text_preprocessing import TextProcessor
 from src.core.base import BaseSummarizer
-from src.utils.logging_setup import logger
-from transformers import pipeline
+from src.components.model_registry import ModelRegistry, model_registry
+from src.core.model_cache import model_cache
+from src.core.inference_scheduler import InferenceScheduler, inference_scheduler
+from src.components.generation_policy import GenerationPolicy, GenerationResult
+from src.utils.logging_setup import logger, request_logger
+from src.utils.metrics import STAGE_LATENCY, ERRORS_TOTAL, GENERATION_STEPS, GENERATION_TOKENS_PER_SECOND
+from transformers import pipeline, MaxTimeCriteria, StoppingCriteria, StoppingCriteriaList, TextIteratorStreamer
+import torch
+
+
+class CancelGenerationCriteria(StoppingCriteria):
+    """
+    Stops generation as soon as `cancel_event` is set (e.g. the client disconnected).
+    """
+    def __init__(self, cancel_event: threading.Event):
+        self.cancel_event = cancel_event
+
+    def __call__(self, input_ids, scores, **kwargs):
+        return torch.full((input_ids.shape[0],), self.cancel_event.is_set(), dtype=torch.bool, device=input_ids.device)
 
 
 class T5Summarizer(BaseSummarizer):
     """
     Abstractive summarizer using a pre-trained T5 model from Hugging Face Transformers.
+
+    Length bounds and decoding settings come from a GenerationPolicy unless
+    the caller passes `max_length`/`min_length`.
     """
-    def __init__(self, text_processor: TextProcessor, model_name: str = "t5-small"):
+    def __init__(self, text_processor: TextProcessor, model_name: str = "t5-small",
+                 registry: ModelRegistry = None, scheduler: InferenceScheduler = None,
+                 policy: GenerationPolicy = None):
         super().__init__(text_processor)
         self.model_name = model_name
+        self.registry = registry or model_registry
+        self.scheduler = scheduler or inference_scheduler
+        self.policy = policy or GenerationPolicy()
         self.summarization_pipeline = None
         self._load_model()
         logger.info(f"T5Summarizer initialized with model '{model_name}'.")
 
+    @property
+    def available(self) -> bool:
+        return self.summarization_pipeline is not None
+
+    def _build_pipeline(self):
+        # Only the local registry is consulted, so loading never touches the network.
+        model_path = self.registry.resolve(self.model_name)
+        return pipeline("summarization", model=model_path, tokenizer=model_path,
+                        model_kwargs={"local_files_only": True})
+
     def _load_model(self):
         try:
-            self.summarization_pipeline = pipeline("summarization", model=self.model_name)
+            # Shared process-wide, so summarizers for other languages reuse the same weights.
+            self.summarization_pipeline = model_cache.get(("t5", self.registry.root, self.model_name), self._build_pipeline)
             logger.info(f"T5 abstractive model '{self.model_name}' loaded successfully.")
         except Exception as e:
             logger.error(f"Could not load abstractive T5 model '{self.model_name}': {e}")
             self.summarization_pipeline = None
 
-    def summarize(self, text: str, max_length: int = 150, min_length: int = 30) -> list[str]:
-        logger.info(f"Starting T5 abstractive summarization (max_length={max_length}, min_length={min_length}).")
+    def _encode(self, text: str):
+        model = self.summarization_pipeline.model
+        # Mirror the pipeline's input prefix (e.g. "summarize: ").
+        prefix = getattr(self.summarization_pipeline, "prefix", None) or getattr(model.config, "prefix", None) or ""
+        return self.summarization_pipeline.tokenizer(prefix + text, return_tensors="pt", truncation=True).to(model.device)
+
+    def _generation_kwargs(self, inputs, max_length: int, min_length: int, preset: str, max_time: float) -> tuple[str, dict]:
+        preset, kwargs = self.policy.settings(int(inputs["input_ids"].shape[1]), max_length, min_length, preset, max_time)
+        return preset, dict(**inputs, generation_config=getattr(self.summarization_pipeline, "generation_config", None), **kwargs)
+
+    def _run_generate(self, max_time: float, extra_criteria: list = (), **generation_kwargs):
+        """
+        Runs model.generate on the current inference slot and returns (output
+        ids, seconds). The time limit starts here, after any wait for the slot
+        (MaxTimeCriteria starts its clock when created).
+        """
+        stopping_criteria = StoppingCriteriaList([MaxTimeCriteria(max_time), *extra_criteria])
+        start = time.perf_counter()
+        output_ids = self.summarization_pipeline.model.generate(**generation_kwargs, stopping_criteria=stopping_criteria)
+        return output_ids, time.perf_counter() - start
+
+    def generate(self, text: str, max_length: int = None, min_length: int = None, preset: str = None,
+                 max_time: float = None) -> GenerationResult:
+        """
+        Generates a summary and reports its input length, length bounds,
+        decoder steps and decoding speed. Raises ValueError if the model is unavailable.
+        """
+        if self.summarization_pipeline is None:
+            raise ValueError("T5 summarizer not available due to missing dependencies or loading error.")
+        inputs = self._encode(text)
+        preset, generation_kwargs = self._generation_kwargs(inputs, max_length, min_length, preset, max_time)
+        with STAGE_LATENCY.time(stage="forward", method="t5"), self.span("inference", input_chars=len(text), preset=preset):
+            output_ids, seconds = self.scheduler.run(self._run_generate, **generation_kwargs)
+        summary = self.summarization_pipeline.tokenizer.decode(output_ids[0], skip_special_tokens=True,
+                                                               clean_up_tokenization_spaces=True)
+        time_limit = generation_kwargs["max_time"]
+        result = GenerationResult(
+            summary=summary,
+            preset=preset,
+            input_tokens=int(inputs["input_ids"].shape[1]),
+            min_length=generation_kwargs["min_length"],
+            max_length=generation_kwargs["max_length"],
+            decoder_steps=int(output_ids.shape[1]) - 1,  # minus the decoder start token
+            seconds=seconds,
+            timed_out=seconds >= time_limit,
+        )
+        GENERATION_STEPS.observe(result.decoder_steps, preset=preset)
+        GENERATION_TOKENS_PER_SECOND.observe(result.tokens_per_sec, preset=preset)
+        request_logger.info("T5 generation (%s): %d input tokens, length %d-%d, %d decoder steps in %.2fs (%.1f tokens/s).",
+                            preset, result.input_tokens, result.min_length, result.max_length, result.decoder_steps,
+                            seconds, result.tokens_per_sec)
+        if result.timed_out:
+            logger.warning(f"T5 generation stopped at the {time_limit:g}s time limit after {result.decoder_steps} steps.")
+        return result
+
+    def summarize(self, text: str, max_length: int = None, min_length: int = None, preset: str = None,
+                  max_time: float = None) -> list[str]:
+        request_logger.info("Starting T5 abstractive summarization (max_length=%s, min_length=%s).", max_length, min_length)
         if self.summarization_pipeline is None:
             return ["T5 summarizer not available due to missing dependencies or loading error."]
 
         try:
-            summary = self.summarization_pipeline(
-                text,
-                max_length=max_length,
-                min_length=min_length,
-                do_sample=False,
-                truncation=True
-            )
-            summary_text = summary[0]['summary_text']
-            logger.info("T5 abstractive summarization complete.")
+            summary_text = self.generate(text, max_length, min_length, preset, max_time).summary
+            request_logger.info("T5 abstractive summarization complete.")
             return [summary_text]
         except Exception as e:
             logger.error(f"Error during T5 summarization: {e}")
+            ERRORS_TOTAL.inc(component="t5")
             return [f"Error during T5 summarization: {e}"]
+
+    def stream_summarize(self, text: str, max_length: int = None, min_length: int = None,
+                         cancel_event: threading.Event = None, submit=None, timeout: float = None,
+                         max_time: float = None):
+        """
+        Starts generation in the background and returns an iterator over text
+        pieces as they are decoded.
+
+        Streaming uses greedy decoding (streamers do not support beam search)
+        and the policy's length bounds unless given. Closing the iterator,
+        setting `cancel_event` or reaching `max_time` stops generation.
+        `submit(fn)` runs the generation job (e.g. on a request scheduler) and
+        defaults to a new thread; the decoding itself runs on an inference
+        slot. `timeout` bounds the wait for each piece.
+        """
+        request_logger.info("Starting T5 streaming summarization (max_length=%s, min_length=%s).", max_length, min_length)
+        if self.summarization_pipeline is None:
+            raise ValueError("T5 summarizer not available due to missing dependencies or loading error.")
+
+        tokenizer = self.summarization_pipeline.tokenizer
+        inputs = self._encode(text)
+        cancel_event = cancel_event or threading.Event()
+        streamer = TextIteratorStreamer(tokenizer, skip_prompt=True, skip_special_tokens=True, timeout=timeout)
+        _, generation_kwargs = self._generation_kwargs(inputs, max_length, min_length, "greedy", max_time)
+        generation_kwargs["extra_criteria"] = [CancelGenerationCriteria(cancel_event)]
+        generation_kwargs["streamer"] = streamer
+        errors = []
+
+        def generate():
+            if cancel_event.is_set():  # cancelled while waiting for a worker
+                streamer.end()
+                return
+            try:
+                with STAGE_LATENCY.time(stage="forward", method="t5"), self.span("stream_inference"):
+                    self.scheduler.run(self._run_generate, **generation_kwargs)
+            except Exception as e:
+                logger.error(f"Error during T5 streaming generation: {e}")
+                ERRORS_TOTAL.inc(component="t5")
+                errors.append(e)
+                streamer.end()
+
+        if submit is None:
+            threading.Thread(target=generate, name="t5-stream", daemon=True).start()
+        else:
+            submit(generate)
+        return self._iter_stream(streamer, cancel_event, errors)
+
+    @staticmethod
+    def _iter_stream(streamer: TextIteratorStreamer, cancel_event: threading.Event, errors: list):
+        start = time.perf_counter()
+        first = True
+        try:
+            for piece in streamer:
+                if not piece:
+                    continue
+                if first:
+                    STAGE_LATENCY.observe(time.perf_counter() - start, stage="first_token", method="t5")
+                    first = False
+                yield piece
+            if errors:
+                raise ValueError(f"Error during T5 summarization: {errors[0]}")
+            request_logger.info("T5 streaming summarization complete.")
+        except queue.Empty:
+            raise TimeoutError("Timed out waiting for the next generated token.")
+        finally:
+            # Runs on normal completion, errors and early close (client disconnect).
+            cancel_event.set()
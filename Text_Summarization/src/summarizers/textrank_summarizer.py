@@ -1,11 +1,13 @@
 
 from src.core.base import BaseSummarizer
+from sklearn.base import clone
 from sklearn.feature_extraction.text import TfidfVectorizer
 import numpy as np
 from sklearn.metrics.pairwise import cosine_similarity
 import networkx as nx
+from src.core.summary_result import SummaryResult, select_top
 from src.modules.text_preprocessing import TextProcessor
-from src.utils.logging_setup import logger
+from src.utils.logging_setup import logger, request_logger
 
 class TextRankSummarizer(BaseSummarizer):
     """
@@ -20,36 +22,43 @@ class TextRankSummarizer(BaseSummarizer):
         if not sentences:
             return np.array([])
 
-        sentence_vectors = self.vectorizer.fit_transform(sentences)
-        similarity_matrix = cosine_similarity(sentence_vectors)
+        # Fit a copy so concurrent calls never share a fitted vocabulary.
+        with self.span("vectorize"):
+            sentence_vectors = clone(self.vectorizer).fit_transform(sentences)
+        with self.span("similarity"):
+            similarity_matrix = cosine_similarity(sentence_vectors)
         np.fill_diagonal(similarity_matrix, 0)
-        logger.debug(f"Built similarity matrix of shape: {similarity_matrix.shape}")
+        logger.debug("Built similarity matrix of shape: %s", similarity_matrix.shape)
         return similarity_matrix
 
-    def summarize(self, text: str, num_sentences: int = 3) -> list[str]:
-        logger.info(f"Starting TextRank summarization for {num_sentences} sentences.")
-        original_sentences, _ = self.text_processor.preprocess_text(text)
+    def summarize_result(self, text: str, num_sentences: int = 3) -> SummaryResult:
+        request_logger.info("Starting TextRank summarization for %d sentences.", num_sentences)
+        with self.span("preprocess"):
+            document = self.text_processor.preprocess_document(text)
 
-        if not original_sentences:
+        if not document.sentences:
             logger.warning("No sentences found in the input text. Returning an empty summary.")
-            return []
+            return SummaryResult(text)
 
-        if len(original_sentences) <= num_sentences:
-            logger.info("Number of sentences requested is greater than or equal to the total sentences. Returning all.")
-            return original_sentences
+        if len(document.sentences) <= num_sentences:
+            request_logger.info("Number of sentences requested is greater than or equal to the total sentences. Returning all.")
+            return self.build_result(text, document, range(len(document.sentences)))
 
-        similarity_matrix = self._build_similarity_matrix(original_sentences)
+        similarity_matrix = self._build_similarity_matrix(document.sentences)
         if similarity_matrix.size == 0:
             logger.warning("Similarity matrix is empty. Not enough sentences to build a graph.")
-            return []
-
-        nx_graph = nx.from_numpy_array(similarity_matrix)
-        scores = nx.pagerank(nx_graph)
-
-        ranked_sentences = sorted(((scores[i], s) for i, s in enumerate(original_sentences)), reverse=True)
-        top_sentences_set = set(sentence for _, sentence in ranked_sentences[:num_sentences])
-        
-        final_summary = [s for s in original_sentences if s in top_sentences_set]
-        
-        logger.info(f"TextRank summarization complete. Extracted {len(final_summary)} sentences.")
-        return final_summary[:num_sentences]
+            return SummaryResult(text)
+
+        with self.span("pagerank"):
+            nx_graph = nx.from_numpy_array(similarity_matrix)
+            scores = nx.pagerank(nx_graph)
+
+        with self.span("rank"):
+            sentence_scores = np.array([scores[i] for i in range(len(document.sentences))])
+            result = self.build_result(text, document, select_top(sentence_scores, num_sentences), sentence_scores)
+
+        request_logger.info("TextRank summarization complete. Extracted %d sentences.", len(result.selected))
+        return result
+
+    def summarize(self, text: str, num_sentences: int = 3) -> list[str]:
+        return self.summarize_result(text, num_sentences).sentences()
@@ -1,7 +1,9 @@
 from collections import defaultdict
+import numpy as np
+from src.core.summary_result import SummaryResult, select_top
 from src.modules.text_preprocessing import TextProcessor
 from src.core.base import BaseSummarizer
-from src.utils.logging_setup import logger
+from src.utils.logging_setup import logger, request_logger
 
 class TFIDFSummarizer(BaseSummarizer):
     """
@@ -17,42 +19,41 @@ class TFIDFSummarizer(BaseSummarizer):
         for sentence_words in sentences_words:
             for word in sentence_words:
                 word_frequencies[word] += 1
-        logger.debug(f"Found {len(word_frequencies)} unique words.")
+        logger.debug("Found %d unique words.", len(word_frequencies))
         return word_frequencies
 
-    def _calculate_sentence_scores(self, original_sentences: list[str],
-                                   sentences_words: list[list[str]],
-                                   word_frequencies: dict) -> dict[str, float]:
+    def _calculate_sentence_scores(self, sentences_words: list[list[str]], word_frequencies: dict) -> np.ndarray:
         logger.debug("Calculating sentence scores...")
-        sentence_scores = defaultdict(float)
         max_freq = max(word_frequencies.values()) if word_frequencies else 1
-
-        for i, sentence_word_list in enumerate(sentences_words):
-            for word in sentence_word_list:
-                sentence_scores[original_sentences[i]] += word_frequencies[word] / max_freq
-
-        logger.debug(f"Calculated scores for {len(sentence_scores)} sentences.")
+        # Scores are per sentence position, so repeated sentences are scored separately.
+        sentence_scores = np.array([sum(word_frequencies[word] / max_freq for word in sentence_word_list)
+                                    for sentence_word_list in sentences_words])
+        logger.debug("Calculated scores for %d sentences.", len(sentence_scores))
         return sentence_scores
 
-    def summarize(self, text: str, num_sentences: int = 3) -> list[str]:
-        logger.info(f"Starting TF-IDF summarization for {num_sentences} sentences.")
-        original_sentences, processed_sentences_words = self.text_processor.preprocess_text(text)
+    def summarize_result(self, text: str, num_sentences: int = 3) -> SummaryResult:
+        request_logger.info("Starting TF-IDF summarization for %d sentences.", num_sentences)
+        with self.span("preprocess"):
+            document = self.text_processor.preprocess_document(text)
 
-        if not original_sentences:
+        if not document.sentences:
             logger.warning("No sentences found in the input text. Returning an empty summary.")
-            return []
+            return SummaryResult(text)
 
-        if len(original_sentences) <= num_sentences:
-            logger.info("Number of sentences requested is greater than or equal to the total sentences. Returning all.")
-            return original_sentences
+        if len(document.sentences) <= num_sentences:
+            request_logger.info("Number of sentences requested is greater than or equal to the total sentences. Returning all.")
+            return self.build_result(text, document, range(len(document.sentences)))
 
-        word_frequencies = self._calculate_word_frequencies(processed_sentences_words)
-        sentence_scores = self._calculate_sentence_scores(original_sentences, processed_sentences_words, word_frequencies)
+        with self.span("word_frequencies"):
+            word_frequencies = self._calculate_word_frequencies(document.words)
+        with self.span("score"):
+            sentence_scores = self._calculate_sentence_scores(document.words, word_frequencies)
 
-        ranked_sentences = sorted(sentence_scores.items(), key=lambda x: x[1], reverse=True)
-        top_sentences_set = set(sentence for sentence, _ in ranked_sentences[:num_sentences])
+        with self.span("rank"):
+            result = self.build_result(text, document, select_top(sentence_scores, num_sentences), sentence_scores)
 
-        final_summary = [s for s in original_sentences if s in top_sentences_set]
+        request_logger.info("TF-IDF summarization complete. Extracted %d sentences.", len(result.selected))
+        return result
 
-        logger.info(f"TF-IDF summarization complete. Extracted {len(final_summary)} sentences.")
-        return final_summary[:num_sentences]
+    def summarize(self, text: str, num_sentences: int = 3) -> list[str]:
+        return self.summarize_result(text, num_sentences).sentences()
@@ -84,4 +84,18 @@ def extract_zip(zip_path: str, extract_to: str) -> bool:
             return False
         except Exception as e:
             logger.error(f"Error extracting {zip_path}: {e}")
-            return False
\ No newline at end of file
+            return False
+
+def read_jsonl(file_path: str):
+    """
+    Lazily yields one parsed JSON object per non-empty line of a JSONL file.
+    """
+    with open(file_path, 'r', encoding='utf-8') as file:
+        for line_number, line in enumerate(file, start=1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError as e:
+                logger.error(f"Skipping malformed JSON on line {line_number} of {file_path}: {e}")
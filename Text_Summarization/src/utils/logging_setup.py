@@ -1,12 +1,78 @@
+import atexit
+import json
 import logging
+import logging.handlers
 import os
+import queue
+import random
 import sys
+from src.constants.constants import LOG_ASYNC_ENV, LOG_FORMAT_ENV, LOG_LEVEL_ENV, LOG_SAMPLE_RATE_ENV
 from src.core.singleton import SingletonMeta
 
+# Attributes every LogRecord has; anything else came from `extra=` and is structured data.
+_RECORD_ATTRIBUTES = set(vars(logging.LogRecord("", 0, "", 0, "", (), None))) | {"message", "asctime"}
+
+
+class JsonFormatter(logging.Formatter):
+    """
+    Formats records as one JSON object per line, including `extra=` fields.
+    """
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "time": self.formatTime(record),
+            "level": record.levelname,
+            "logger": record.name,
+            "module": record.module,
+            "message": record.getMessage(),
+        }
+        entry.update({key: value for key, value in vars(record).items() if key not in _RECORD_ATTRIBUTES})
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            entry["exception"] = record.exc_text
+        return json.dumps(entry, default=str)
+
+
+class DeferredQueueHandler(logging.handlers.QueueHandler):
+    """
+    Enqueues records without formatting them; the listener thread formats and writes.
+    Message arguments are therefore rendered later, so log values, not objects
+    that are mutated right after the call.
+    """
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        if record.exc_info:
+            # Tracebacks are rendered now so frames are not kept alive in the queue.
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+
+class SampledLoggerAdapter(logging.LoggerAdapter):
+    """
+    Keeps only a fraction of INFO/DEBUG messages (warnings and errors always pass).
+    The decision is made before the record is created, so dropped calls are cheap.
+    """
+    def __init__(self, logger: logging.Logger, sample_rate: float = 1.0):
+        super().__init__(logger, {})
+        self.sample_rate = sample_rate
+
+    def isEnabledFor(self, level: int) -> bool:
+        if not self.logger.isEnabledFor(level):
+            return False
+        return level >= logging.WARNING or self.sample_rate >= 1.0 or random.random() < self.sample_rate
+
+    def process(self, msg, kwargs):
+        return msg, kwargs
+
+
 class Logger(metaclass=SingletonMeta):
     """
     A singleton class for managing application-wide logging.
     It configures and provides a pre-configured logger instance.
+
+    Records are handed to a queue and written to the log file and stdout by a
+    background listener thread, so callers never block on I/O. Behaviour is
+    controlled by LOG_LEVEL, LOG_FORMAT (text/json), LOG_ASYNC and LOG_SAMPLE_RATE.
     """
     def __init__(self, logger_name="Text_Summarization", log_dir="logs", log_file_name="running_logs.log"):
         """
@@ -19,6 +85,9 @@ class Logger(metaclass=SingletonMeta):
             log_file_name (str): The name of the log file.
         """
         self._logger = None
+        self._listener = None
+        self._queue_handler = None
+        self._handlers = []
         self._logger_name = logger_name
         self._log_dir = log_dir
         self._log_file_name = log_file_name
@@ -34,17 +103,47 @@ class Logger(metaclass=SingletonMeta):
 
         # Basic configuration applied only once
         if not self._logger: # Check if logger is already set up (important for potential re-init calls if not truly singleton)
-            logging.basicConfig(
-                level=logging.INFO,
-                format=logging_str,
-                handlers=[
-                    logging.FileHandler(log_filepath),
-                    logging.StreamHandler(sys.stdout)
-                ]
-            )
+            level = os.environ.get(LOG_LEVEL_ENV, "INFO").upper()
+            formatter = JsonFormatter() if os.environ.get(LOG_FORMAT_ENV) == "json" else logging.Formatter(logging_str)
+            self._handlers = [logging.FileHandler(log_filepath), logging.StreamHandler(sys.stdout)]
+            for handler in self._handlers:
+                handler.setFormatter(formatter)
+
+            if os.environ.get(LOG_ASYNC_ENV, "1") != "0":
+                self._queue_handler = DeferredQueueHandler(queue.SimpleQueue())
+                logging.basicConfig(level=level, handlers=[self._queue_handler])
+                self._start_listener()
+                atexit.register(self.shutdown)
+                # A forked child inherits the handler but not the listener thread.
+                os.register_at_fork(after_in_child=self._restart_in_child)
+            else:
+                logging.basicConfig(level=level, handlers=self._handlers)
+
             self._logger = logging.getLogger(self._logger_name)
+            sample_rate = float(os.environ.get(LOG_SAMPLE_RATE_ENV, "1.0"))
+            self._request_logger = SampledLoggerAdapter(self._logger, sample_rate)
             self._logger.info("Logging initialized successfully.")
 
+    def _start_listener(self):
+        self._listener = logging.handlers.QueueListener(
+            self._queue_handler.queue, *self._handlers, respect_handler_level=True)
+        self._listener.start()
+
+    def _restart_in_child(self):
+        self._queue_handler.queue = queue.SimpleQueue()
+        self._start_listener()
+        # multiprocessing children exit via os._exit and skip atexit; flush from its finalizers.
+        from multiprocessing.util import Finalize
+        Finalize(self, self.shutdown, exitpriority=-100)
+
+    def shutdown(self):
+        """
+        Flushes queued records and stops the background writer.
+        """
+        if self._listener is not None:
+            self._listener.stop()
+            self._listener = None
+
     @property
     def logger(self):
         """
@@ -52,4 +151,12 @@ class Logger(metaclass=SingletonMeta):
         """
         return self._logger
 
+    @property
+    def request_logger(self):
+        """
+        Sampled logger for per-request INFO/DEBUG messages on the hot path.
+        """
+        return self._request_logger
+
 logger = Logger().logger
+request_logger = Logger().request_logger
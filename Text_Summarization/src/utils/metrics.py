@@ -0,0 +1,158 @@
+# Minimal Prometheus-compatible metrics (counters and histograms) rendered in
+# the text exposition format, so the service needs no extra client library.
+import bisect
+import threading
+import time
+from contextlib import contextmanager
+
+LATENCY_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+SENTENCE_BUCKETS = (1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 5000)
+TOKEN_BUCKETS = (10, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 50000, 100000)
+STEP_BUCKETS = (8, 16, 32, 64, 128, 256, 512, 1024)
+RATE_BUCKETS = (1, 5, 10, 25, 50, 100, 250, 500, 1000)
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(labelnames: tuple, values: tuple, extra: str = "") -> str:
+    # Empty label values are equivalent to absent labels in Prometheus; omit them.
+    parts = [f'{name}="{_escape(value)}"' for name, value in zip(labelnames, values) if value != ""]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+class Counter:
+    """
+    Monotonically increasing value per label combination.
+    """
+    kind = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: tuple = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1.0, **labels) -> None:
+        key = tuple(labels.get(name, "") for name in self.labelnames)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def samples(self) -> list[str]:
+        with self._lock:
+            return [f"{self.name}{_format_labels(self.labelnames, key)} {value}"
+                    for key, value in sorted(self._values.items())]
+
+
+class Histogram:
+    """
+    Cumulative-bucket histogram per label combination.
+    """
+    kind = "histogram"
+
+    def __init__(self, name: str, documentation: str, labelnames: tuple = (), buckets: tuple = LATENCY_BUCKETS):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(sorted(buckets))
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, **labels) -> None:
+        key = tuple(labels.get(name, "") for name in self.labelnames)
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            state = self._values.get(key)
+            if state is None:
+                state = self._values[key] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+            state[0][index] += 1
+            state[1] += value
+            state[2] += 1
+
+    @contextmanager
+    def time(self, **labels):
+        """
+        Observes the duration of the enclosed block in seconds.
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start, **labels)
+
+    def samples(self) -> list[str]:
+        lines = []
+        with self._lock:
+            for key, (counts, total, count) in sorted(self._values.items()):
+                cumulative = 0
+                for bound, bucket_count in zip(self.buckets + (float("inf"),), counts):
+                    cumulative += bucket_count
+                    le = 'le="+Inf"' if bound == float("inf") else f'le="{float(bound)}"'
+                    lines.append(f"{self.name}_bucket{_format_labels(self.labelnames, key, le)} {cumulative}")
+                lines.append(f"{self.name}_sum{_format_labels(self.labelnames, key)} {total}")
+                lines.append(f"{self.name}_count{_format_labels(self.labelnames, key)} {count}")
+        return lines
+
+
+class MetricsRegistry:
+    """
+    Process-wide collection of metrics, rendered in Prometheus text format.
+    """
+    def __init__(self):
+        self._metrics = {}
+        self._lock = threading.Lock()
+
+    def _get_or_create(self, cls, name: str, *args, **kwargs):
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = self._metrics[name] = cls(name, *args, **kwargs)
+            return metric
+
+    def counter(self, name: str, documentation: str, labelnames: tuple = ()) -> Counter:
+        return self._get_or_create(Counter, name, documentation, labelnames)
+
+    def histogram(self, name: str, documentation: str, labelnames: tuple = (),
+                  buckets: tuple = LATENCY_BUCKETS) -> Histogram:
+        return self._get_or_create(Histogram, name, documentation, labelnames, buckets)
+
+    def render(self) -> str:
+        with self._lock:
+            metrics = list(self._metrics.values())
+        lines = []
+        for metric in metrics:
+            lines.append(f"# HELP {metric.name} {metric.documentation}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            lines.extend(metric.samples())
+        return "\n".join(lines) + "\n"
+
+
+registry = MetricsRegistry()
+
+REQUEST_LATENCY = registry.histogram(
+    "summarizer_request_latency_seconds", "Latency of summarization requests by method.", ("method",))
+REQUESTS_TOTAL = registry.counter(
+    "summarizer_requests_total", "Summarization requests by method and status.", ("method", "status"))
+STAGE_LATENCY = registry.histogram(
+    "summarizer_stage_latency_seconds", "Latency of internal pipeline stages.", ("stage", "method"))
+INPUT_SENTENCES = registry.histogram(
+    "summarizer_input_sentences", "Sentences per preprocessed input document.", buckets=SENTENCE_BUCKETS)
+INPUT_TOKENS = registry.histogram(
+    "summarizer_input_tokens", "Filtered word tokens per preprocessed input document.", buckets=TOKEN_BUCKETS)
+CACHE_REQUESTS = registry.counter(
+    "summarizer_cache_requests_total", "Summary cache lookups by result.", ("result",))
+ERRORS_TOTAL = registry.counter(
+    "summarizer_errors_total", "Errors by component.", ("component",))
+STORE_REQUESTS = registry.counter(
+    "summarizer_store_requests_total", "Persistent summary store lookups by result.", ("result",))
+LANGUAGE_REQUESTS = registry.counter(
+    "summarizer_language_requests_total", "Requests routed per language and how it was chosen.", ("language", "source"))
+GENERATION_STEPS = registry.histogram(
+    "summarizer_generation_decoder_steps", "Decoder steps per generated summary.", ("preset",), buckets=STEP_BUCKETS)
+GENERATION_TOKENS_PER_SECOND = registry.histogram(
+    "summarizer_generation_tokens_per_second", "Generated tokens per second per request.", ("preset",),
+    buckets=RATE_BUCKETS)
@@ -0,0 +1,252 @@
+# Lightweight span tracing for the summarization hot path.
+#
+# Code reports timed stages with `tracer.span("name", **attributes)`. Without
+# sinks the call returns a shared no-op context manager, so instrumentation
+# costs one attribute check when tracing is off. Sinks are configured through
+# the SUMMARY_TRACE environment variable (see `Tracer.from_env`).
+import contextvars
+import json
+import os
+import random
+import threading
+import time
+import uuid
+from collections import defaultdict
+from src.constants.constants import TRACE_PROFILE_DIR, TRACE_SINKS_ENV
+from src.utils.logging_setup import logger
+
+_current_span = contextvars.ContextVar("current_span", default=None)
+
+
+class _NoopSpan:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+    def set(self, **attributes) -> None:
+        pass
+
+
+NOOP_SPAN = _NoopSpan()
+
+
+class Span:
+    """
+    A timed stage. Nested spans share the root's trace id and know their parent.
+    """
+    __slots__ = ("tracer", "name", "attributes", "trace_id", "span_id", "parent",
+                 "started_at", "start", "duration", "profiler", "_token")
+
+    def __init__(self, tracer, name: str, attributes: dict):
+        self.tracer = tracer
+        self.name = name
+        self.attributes = attributes
+        self.profiler = None
+
+    def set(self, **attributes) -> None:
+        self.attributes.update(attributes)
+
+    def __enter__(self):
+        self.parent = _current_span.get()
+        self.trace_id = self.parent.trace_id if self.parent else uuid.uuid4().hex[:16]
+        self.span_id = uuid.uuid4().hex[:8]
+        self._token = _current_span.set(self)
+        for sink in self.tracer.sinks:
+            sink.on_start(self)
+        self.started_at = time.time()
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.duration = time.perf_counter() - self.start
+        _current_span.reset(self._token)
+        if exc_type is not None:
+            self.attributes["error"] = exc_type.__name__
+        for sink in self.tracer.sinks:
+            try:
+                sink.on_end(self)
+            except Exception as e:
+                logger.error(f"Trace sink {sink.__class__.__name__} failed: {e}")
+        return False
+
+
+class SpanSink:
+    """
+    Receives span start/end notifications. Subclasses override what they need.
+    """
+    def on_start(self, span: Span) -> None:
+        pass
+
+    def on_end(self, span: Span) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+
+class MemorySink(SpanSink):
+    """
+    Aggregates count, total, min and max duration per span name.
+    """
+    def __init__(self):
+        self._stats = defaultdict(lambda: [0, 0.0, float("inf"), 0.0])
+        self._lock = threading.Lock()
+
+    def on_end(self, span: Span) -> None:
+        with self._lock:
+            stats = self._stats[span.name]
+            stats[0] += 1
+            stats[1] += span.duration
+            stats[2] = min(stats[2], span.duration)
+            stats[3] = max(stats[3], span.duration)
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {
+                name: {"count": count, "total_ms": total * 1000, "mean_ms": total / count * 1000,
+                       "min_ms": low * 1000, "max_ms": high * 1000}
+                for name, (count, total, low, high) in sorted(self._stats.items())
+            }
+
+    def reset(self) -> None:
+        with self._lock:
+            self._stats.clear()
+
+
+class JsonlSink(SpanSink):
+    """
+    Appends one JSON line per finished span.
+    """
+    def __init__(self, path: str):
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self.path = path
+        self._file = open(path, "a", buffering=1, encoding="utf-8")
+        self._lock = threading.Lock()
+
+    def on_end(self, span: Span) -> None:
+        record = {
+            "trace_id": span.trace_id,
+            "span_id": span.span_id,
+            "parent_id": span.parent.span_id if span.parent else None,
+            "name": span.name,
+            "start": span.started_at,
+            "duration_ms": span.duration * 1000,
+            "attributes": span.attributes,
+        }
+        line = json.dumps(record, default=str) + "\n"
+        with self._lock:
+            self._file.write(line)
+
+    def close(self) -> None:
+        with self._lock:
+            self._file.close()
+
+
+class ProfilerSink(SpanSink):
+    """
+    Profiles a sampled fraction of root spans (whole requests) with cProfile or
+    pyinstrument and writes one profile file per sampled request.
+    """
+    def __init__(self, sample_rate: float = 0.01, output_dir: str = TRACE_PROFILE_DIR, engine: str = "cprofile"):
+        if engine not in ("cprofile", "pyinstrument"):
+            raise ValueError(f"Unknown profiler engine: {engine}")
+        if engine == "pyinstrument":
+            import pyinstrument  # noqa: F401  (fail at configuration time if missing)
+        self.sample_rate = sample_rate
+        self.output_dir = output_dir
+        self.engine = engine
+        os.makedirs(output_dir, exist_ok=True)
+
+    def on_start(self, span: Span) -> None:
+        if span.parent is not None or random.random() >= self.sample_rate:
+            return
+        try:
+            if self.engine == "pyinstrument":
+                from pyinstrument import Profiler
+                profiler = Profiler(async_mode="disabled")
+                profiler.start()
+            else:
+                import cProfile
+                profiler = cProfile.Profile()
+                profiler.enable()
+            span.profiler = profiler
+        except (RuntimeError, ValueError) as e:
+            # Only one profiler may be active per thread/interpreter; skip this sample.
+            logger.debug(f"Skipping profile of span '{span.name}': {e}")
+
+    def on_end(self, span: Span) -> None:
+        if span.profiler is None:
+            return
+        base = os.path.join(self.output_dir, f"{span.name}-{span.trace_id}")
+        if self.engine == "pyinstrument":
+            span.profiler.stop()
+            with open(f"{base}.html", "w", encoding="utf-8") as f:
+                f.write(span.profiler.output_html())
+        else:
+            span.profiler.disable()
+            span.profiler.dump_stats(f"{base}.prof")
+        span.profiler = None
+        logger.info(f"Saved profile of span '{span.name}' ({span.duration * 1000:.1f}ms) to {base}.")
+
+
+def parse_sink_spec(spec: str) -> SpanSink:
+    """
+    Builds a sink from "memory", "jsonl:<path>", "cprofile:<rate>[:<dir>]"
+    or "pyinstrument:<rate>[:<dir>]".
+    """
+    kind, _, rest = spec.strip().partition(":")
+    if kind == "memory":
+        return MemorySink()
+    if kind == "jsonl":
+        return JsonlSink(rest or "logs/traces.jsonl")
+    if kind in ("cprofile", "pyinstrument"):
+        rate, _, output_dir = rest.partition(":")
+        return ProfilerSink(float(rate or 0.01), output_dir or TRACE_PROFILE_DIR, engine=kind)
+    raise ValueError(f"Unknown trace sink: {spec!r}")
+
+
+class Tracer:
+    """
+    Creates spans and fans them out to the configured sinks.
+    """
+    def __init__(self, sinks: list[SpanSink] = None):
+        self.sinks = list(sinks or [])
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.sinks)
+
+    @classmethod
+    def from_env(cls) -> "Tracer":
+        sinks = []
+        for spec in filter(str.strip, os.environ.get(TRACE_SINKS_ENV, "").split(",")):
+            try:
+                sinks.append(parse_sink_spec(spec))
+            except (ImportError, ValueError, OSError) as e:
+                logger.error(f"Ignoring trace sink {spec!r}: {e}")
+        if sinks:
+            logger.info(f"Tracing enabled with sinks: {[sink.__class__.__name__ for sink in sinks]}.")
+        return cls(sinks)
+
+    def add_sink(self, sink: SpanSink) -> SpanSink:
+        self.sinks = self.sinks + [sink]
+        return sink
+
+    def remove_sink(self, sink: SpanSink) -> None:
+        self.sinks = [s for s in self.sinks if s is not sink]
+        sink.close()
+
+    def find_sink(self, sink_cls: type):
+        return next((sink for sink in self.sinks if isinstance(sink, sink_cls)), None)
+
+    def span(self, name: str, **attributes):
+        if not self.sinks:
+            return NOOP_SPAN
+        return Span(self, name, attributes)
+
+
+tracer = Tracer.from_env()
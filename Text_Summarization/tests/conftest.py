@@ -0,0 +1,10 @@
+# Makes `src` (Text_Summarization) and the serving entry points at the
+# repository root (app.py, asgi.py) importable however pytest is started.
+import os
+import sys
+
+PACKAGE_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+REPO_ROOT = os.path.dirname(PACKAGE_ROOT)
+for path in (PACKAGE_ROOT, REPO_ROOT):
+    if path not in sys.path:
+        sys.path.insert(0, path)
@@ -0,0 +1,41 @@
+# HTTP behaviour of the Flask app (app.py at the repository root).
+import json
+import pytest
+
+app_module = pytest.importorskip("app")
+
+
+@pytest.fixture
+def client():
+    return app_module.app.test_client()
+
+
+def test_batch_revalidation_returns_304(client):
+    payload = {"documents": [{"id": "doc-1", "text": "Cached text for revalidation."}], "method": "tfidf"}
+    items, error = app_module.parse_batch_request(payload)
+    assert not error
+    app_module.cache_result(app_module.item_cache_key(items[0]),
+                            {"id": "doc-1", "method": "tfidf", "status": "success", "summary": "Cached text."})
+
+    first = client.post("/api/summarize", json=payload)
+    assert first.status_code == 200
+    assert first.headers["X-Cache"] == "HIT"
+    etag = first.headers["ETag"]
+
+    revalidated = client.post("/api/summarize", json=payload, headers={"If-None-Match": etag})
+    assert revalidated.status_code == 304
+    assert revalidated.data == b""
+
+    stale = client.post("/api/summarize", json=payload, headers={"If-None-Match": '"stale"'})
+    assert stale.status_code == 200
+    assert stale.get_json()["results"][0]["summary"] == "Cached text."
+
+
+@pytest.mark.parametrize("body", [[], "x", 3, None])
+def test_stream_rejects_non_object_json(client, body):
+    body = json.dumps(body)
+    response = client.post("/api/summarize/stream", data=body, content_type="application/json")
+    assert response.status_code == 400
+    assert response.get_json() == {"error": "Request body must be a JSON object."}
+    batch = client.post("/api/summarize", data=body, content_type="application/json")
+    assert batch.status_code == 400 and batch.get_json() == response.get_json()
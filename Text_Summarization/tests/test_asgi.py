@@ -0,0 +1,94 @@
+# Concurrency of the production ASGI wrapper (asgi.py at the repository root).
+import asyncio
+import json
+import time
+import uuid
+import pytest
+
+asgi = pytest.importorskip("asgi")
+app_module = pytest.importorskip("app")
+from src.serving.request_scheduler import RequestScheduler
+
+
+async def call(application, method: str, path: str, payload: dict = None) -> tuple[int, bytes]:
+    body = json.dumps(payload).encode("utf-8") if payload is not None else b""
+    scope = {
+        "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1", "method": method, "scheme": "http",
+        "path": path, "raw_path": path.encode("ascii"), "query_string": b"", "root_path": "",
+        "headers": [(b"content-type", b"application/json"), (b"content-length", str(len(body)).encode("ascii"))],
+        "client": ("127.0.0.1", 50000), "server": ("testserver", 80),
+    }
+    messages = [{"type": "http.request", "body": body, "more_body": False}]
+    sent = []
+
+    async def receive():
+        if messages:
+            return messages.pop(0)
+        await asyncio.Event().wait()
+
+    async def send(message):
+        sent.append(message)
+
+    await application(scope, receive, send)
+    return sent[0]["status"], b"".join(message.get("body", b"") for message in sent[1:])
+
+
+@pytest.fixture
+def application():
+    application = asgi.ServingApplication(app_module.app, threads=8)
+    yield application
+    application.executor.shutdown(wait=True)
+
+
+@pytest.fixture
+def slow_summaries(monkeypatch):
+    scheduler = RequestScheduler(max_workers=2, queue_limits={"tfidf": 2})
+    monkeypatch.setattr(app_module, "scheduler", scheduler)
+
+    def summarize_item(item):
+        time.sleep(0.5)
+        return {"id": item["id"], "method": item["method"], "status": "success", "summary": "Slow."}
+    monkeypatch.setattr(app_module.summarizer, "summarize_item", summarize_item)
+    yield scheduler
+    scheduler.drain(timeout=5)
+
+
+def test_requests_overlap_and_overflow_is_rejected(application, slow_summaries):
+    async def scenario():
+        payloads = [{"documents": [f"Uncached text {uuid.uuid4()}."], "method": "tfidf"} for _ in range(3)]
+        summaries = [asyncio.create_task(call(application, "POST", "/api/summarize", payload)) for payload in payloads]
+        await asyncio.sleep(0.1)
+        start = time.perf_counter()
+        health = await call(application, "GET", "/healthz")
+        health_elapsed = time.perf_counter() - start
+        return await asyncio.gather(*summaries), health, health_elapsed
+
+    start = time.perf_counter()
+    responses, health, health_elapsed = asyncio.run(scenario())
+    elapsed = time.perf_counter() - start
+
+    # Two requests fill the tfidf queue and run side by side; the third is turned away.
+    assert sorted(status for status, _ in responses) == [200, 200, 429]
+    assert elapsed < 1.0
+    assert health[0] == 200 and health_elapsed < 0.3
+
+
+def test_response_iterable_is_closed(application):
+    closed = []
+
+    class Body:
+        def __iter__(self):
+            yield b"partial"
+            raise ConnectionResetError("client went away")
+
+        def close(self):
+            closed.append(True)
+
+    def wsgi_app(environ, start_response):
+        start_response("200 OK", [("Content-Type", "text/plain")])
+        return Body()
+
+    application.wsgi_app = wsgi_app
+    with pytest.raises(ConnectionResetError):
+        asyncio.run(call(application, "GET", "/"))
+    assert closed == [True]
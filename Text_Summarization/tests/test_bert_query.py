@@ -0,0 +1,80 @@
+# Query-focused BERT summarization over persistent indexes, with a tiny randomly
+# initialised BERT imported into a temporary model registry.
+import os
+import numpy as np
+import pytest
+
+torch = pytest.importorskip("torch")
+transformers = pytest.importorskip("transformers")
+from src.components.embedding_index import EmbeddingIndexStore
+from src.components.model_registry import ModelRegistry
+from src.modules.text_preprocessing import TextProcessor
+from src.summarizers.Bert_summarizer import BERTExtractiveSummarizer
+
+WORDS = ("the a markets fell rose sharply on tuesday investors central bank rates storm hit coast "
+         "residents fled inland team won final match city council approved budget . , ?").split()
+TEXT = ("Markets fell sharply on Tuesday.  The storm hit the coast.\n"
+        "Markets fell sharply on Tuesday. Residents fled inland.\n\n"
+        "The team won the final match. The city council approved the budget.")
+
+
+@pytest.fixture(scope="module")
+def registry(tmp_path_factory):
+    source = tmp_path_factory.mktemp("tiny-bert")
+    with open(source / "vocab.txt", "w") as f:
+        f.write("\n".join(["[PAD]", "[UNK]", "[CLS]", "[SEP]", "[MASK]", *WORDS]) + "\n")
+    transformers.BertTokenizerFast(str(source / "vocab.txt")).save_pretrained(str(source))
+    torch.manual_seed(0)
+    config = transformers.BertConfig(vocab_size=len(WORDS) + 5, hidden_size=32, num_hidden_layers=2,
+                                     num_attention_heads=2, intermediate_size=64)
+    transformers.BertModel(config).save_pretrained(str(source))
+    registry = ModelRegistry(str(tmp_path_factory.mktemp("registry")))
+    registry.import_model("test/tiny-bert", str(source))
+    return registry
+
+
+@pytest.fixture
+def summarizer(registry, tmp_path):
+    try:
+        text_processor = TextProcessor("english")
+    except LookupError:
+        pytest.skip("NLTK punkt/stopwords data is not installed.")
+    summarizer = BERTExtractiveSummarizer(text_processor, model_name="test/tiny-bert", registry=registry,
+                                          index_store=EmbeddingIndexStore(str(tmp_path / "indexes")))
+    assert summarizer.available
+    return summarizer
+
+
+def test_query_results_map_to_source_spans(summarizer):
+    result = summarizer.summarize_result(TEXT, num_sentences=1, query="The team won the final match.")
+    [selected] = result.selected
+    assert TEXT[selected.start:selected.end] == "The team won the final match."
+    assert selected.index == 4  # counted before the repeated sentence was collapsed
+    assert selected.score == pytest.approx(1.0, abs=1e-4)
+
+    # Spans of the stored index point into the original text, across newlines and double spaces.
+    index = summarizer.document_index(TEXT)
+    for sentence, (start, end) in zip(index.sentences, index.meta["spans"]):
+        assert " ".join(TEXT[start:end].split()) == sentence
+    assert index.meta["indices"] == [0, 1, 3, 4, 5]
+
+    again = summarizer.summarize_result(TEXT, num_sentences=2, query="Residents fled inland.")
+    assert again.spans() == sorted(again.spans())
+    assert "Residents fled inland." in [TEXT[start:end] for start, end in again.spans()]
+
+
+def test_pre_span_index_is_rebuilt(summarizer):
+    # An index written before spans were stored used a key without a format version.
+    store = summarizer.index_store
+    old_key = store.make_key(TEXT, model=summarizer.model_name, registry=summarizer.registry.root,
+                             language="english", dedup_threshold=summarizer.text_processor.dedup_threshold)
+    sentences = ["Markets fell sharply on Tuesday.", "The storm hit the coast."]
+    store.get_or_build(old_key, lambda: (sentences, np.ones((2, 32)), {}))
+    assert "spans" not in store.get(old_key).meta
+
+    result = summarizer.summarize_result(TEXT, num_sentences=1, query="The storm hit the coast.")
+    assert [TEXT[start:end] for start, end in result.spans()] == ["The storm hit the coast."]
+    new_key = summarizer.index_key(TEXT)
+    assert new_key != old_key
+    assert sorted(os.listdir(store.root)) == sorted([old_key, new_key])
+    assert store.get(new_key).meta["count"] == 5
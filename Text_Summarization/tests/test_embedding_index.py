@@ -0,0 +1,63 @@
+# Persistent sentence embedding indexes (src/components/embedding_index.py).
+import os
+import numpy as np
+import pytest
+from src.components import embedding_index
+from src.components.embedding_index import EmbeddingIndexStore
+
+
+def build(count: int, dim: int = 64, seed: int = 0):
+    def build():
+        rng = np.random.default_rng(seed)
+        return [f"Sentence {index}." for index in range(count)], rng.normal(size=(count, dim)), {"source": seed}
+    return build
+
+
+def set_last_use(store: EmbeddingIndexStore, key: str, timestamp: float) -> None:
+    os.utime(os.path.join(store.root, key, embedding_index.META_FILE), (timestamp, timestamp))
+
+
+def test_default_root_is_per_user(monkeypatch, tmp_path):
+    monkeypatch.delenv(embedding_index.EMBEDDING_INDEX_DIR_ENV, raising=False)
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    assert EmbeddingIndexStore().root == str(tmp_path / "cache" / "summary_embedding_index")
+    monkeypatch.delenv("XDG_CACHE_HOME")
+    assert EmbeddingIndexStore().root.startswith(os.path.expanduser("~"))
+    monkeypatch.setenv(embedding_index.EMBEDDING_INDEX_DIR_ENV, str(tmp_path / "explicit"))
+    assert EmbeddingIndexStore().root == str(tmp_path / "explicit")
+
+
+def test_index_is_built_once_and_searched(tmp_path):
+    store = EmbeddingIndexStore(str(tmp_path))
+    calls = []
+    index = store.get_or_build("doc", lambda: calls.append(1) or build(10)())
+    assert store.get_or_build("doc", lambda: calls.append(1) or build(10)()) is index
+    assert EmbeddingIndexStore(str(tmp_path)).get("doc").meta["source"] == 0  # reused by another store
+    assert calls == [1]
+
+    indices, scores = index.search(index.embeddings[3] * 5, k=3)
+    assert indices[0] == 3 and scores[0] == pytest.approx(1.0, abs=1e-5)
+    assert list(scores) == sorted(scores, reverse=True)
+
+
+def test_least_recently_used_indexes_are_pruned(tmp_path):
+    index_bytes = 10 * 64 * 4
+    store = EmbeddingIndexStore(str(tmp_path), max_bytes=3 * index_bytes + 3000)
+    for number in range(3):
+        store.get_or_build(f"doc-{number}", build(10, seed=number))
+        set_last_use(store, f"doc-{number}", 1_000_000 + number)
+    store.get("doc-0")  # used again: now the most recent
+
+    store.get_or_build("doc-3", build(10, seed=3))
+    assert sorted(os.listdir(tmp_path)) == ["doc-0", "doc-2", "doc-3"]
+    assert store.get("doc-1") is None
+    assert EmbeddingIndexStore(str(tmp_path)).get("doc-1") is None
+
+
+def test_new_index_is_kept_even_if_over_the_cap(tmp_path):
+    store = EmbeddingIndexStore(str(tmp_path), max_bytes=1)
+    store.get_or_build("old", build(5))
+    store.get_or_build("new", build(5, seed=1))
+    assert os.listdir(tmp_path) == ["new"]
+    # A pruned index is rebuilt on the next request.
+    assert store.get_or_build("old", build(5)).meta["count"] == 5
@@ -0,0 +1,127 @@
+# Local model registry (src/components/model_registry.py), fed from a local HTTP server.
+import functools
+import hashlib
+import http.server
+import os
+import threading
+import zipfile
+import pytest
+from src.components import model_registry as registry_module
+from src.components.model_registry import ModelRegistry, ModelRegistryError, STAMP_FILE
+
+FILES = {
+    "config.json": b'{"model_type": "tiny"}',
+    "model.safetensors": bytes(range(256)) * 64,
+    "tokenizer/vocab.txt": b"[PAD]\n[UNK]\nhello\nworld\n",
+}
+
+
+class QuietHandler(http.server.SimpleHTTPRequestHandler):
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture(scope="module")
+def archive_url(tmp_path_factory):
+    served = tmp_path_factory.mktemp("served")
+    with zipfile.ZipFile(served / "tiny.zip", "w") as archive:
+        for path, content in FILES.items():
+            archive.writestr(f"tiny-model/{path}", content)  # wrapped in a top-level directory
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), functools.partial(QuietHandler, directory=str(served)))
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}/tiny.zip"
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def registry(tmp_path, archive_url):
+    registry = ModelRegistry(str(tmp_path / "registry"))
+    registry.prefetch("org/tiny", archive_url)
+    return registry
+
+
+@pytest.fixture
+def hash_calls(monkeypatch):
+    calls = []
+    original = registry_module.file_sha256
+    monkeypatch.setattr(registry_module, "file_sha256", lambda path: calls.append(path) or original(path))
+    return calls
+
+
+def corrupt(path: str) -> None:
+    stat = os.stat(path)
+    with open(path, "r+b") as f:
+        first = f.read(1)
+        f.seek(0)
+        f.write(bytes([first[0] ^ 0xFF]))
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+
+def test_prefetch_writes_manifest_with_checksums(registry, archive_url):
+    manifest = registry.manifest("org/tiny")
+    assert manifest["name"] == "org/tiny" and manifest["source"] == archive_url
+    assert manifest["files"] == {path: {"size": len(content), "sha256": hashlib.sha256(content).hexdigest()}
+                                 for path, content in FILES.items()}
+    files_dir = registry.resolve("org/tiny")
+    assert files_dir == os.path.join(registry.root, "org--tiny", "files")
+    for path, content in FILES.items():
+        with open(os.path.join(files_dir, path), "rb") as f:
+            assert f.read() == content
+    assert [entry["name"] for entry in registry.list_models()] == ["org/tiny"]
+
+
+def test_prefetch_rejects_bad_archives(tmp_path, archive_url):
+    registry = ModelRegistry(str(tmp_path / "registry"))
+    with pytest.raises(ModelRegistryError, match="checksum"):
+        registry.prefetch("org/tiny", archive_url, sha256="0" * 64)
+    with pytest.raises(ModelRegistryError, match="download"):
+        registry.prefetch("org/tiny", archive_url.replace("tiny.zip", "missing.zip"))
+    assert not registry.has("org/tiny")
+
+
+def test_verified_stamp_skips_checksums(registry, hash_calls):
+    registry.resolve("org/tiny")
+    # Only the manifest is hashed; model files are compared by size and mtime.
+    assert [os.path.basename(path) for path in hash_calls] == ["manifest.json"]
+
+    path = os.path.join(registry.root, "org--tiny", "files", "config.json")
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    hash_calls.clear()
+    registry.resolve("org/tiny")  # touched, so verified again (and it still matches)
+    assert len(hash_calls) > len(FILES)
+
+
+def test_verify_fails_after_one_byte_changes(registry):
+    corrupt(os.path.join(registry.root, "org--tiny", "files", "model.safetensors"))
+    with pytest.raises(ModelRegistryError, match="model.safetensors"):
+        registry.verify("org/tiny")
+    with pytest.raises(ModelRegistryError, match="Checksum mismatch"):
+        registry.resolve("org/tiny")
+
+
+def test_resolve_missing_or_unverified_model(registry):
+    with pytest.raises(ModelRegistryError, match="not in the registry"):
+        registry.resolve("org/absent")
+
+    stamp_path = os.path.join(registry.root, "org--tiny", STAMP_FILE)
+    os.remove(stamp_path)
+    assert registry.resolve("org/tiny")  # never verified: checks, then stamps
+    assert os.path.exists(stamp_path)
+
+    os.remove(stamp_path)
+    corrupt(os.path.join(registry.root, "org--tiny", "files", "tokenizer", "vocab.txt"))
+    with pytest.raises(ModelRegistryError):
+        registry.resolve("org/tiny")
+    assert not os.path.exists(stamp_path)
+
+
+def test_remove(registry):
+    registry.remove("org/tiny")
+    assert not registry.has("org/tiny")
+    assert registry.list_models() == []
+    with pytest.raises(ModelRegistryError):
+        registry.resolve("org/tiny")
+    registry.remove("org/tiny")  # removing again is a no-op
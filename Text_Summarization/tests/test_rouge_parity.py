@@ -0,0 +1,119 @@
+# Parity of the native ROUGE engine with rouge_score, and of the rouge_score
+# private helpers the evaluator relies on (which is why requirements.txt pins
+# rouge_score; re-run these tests before raising the pin).
+#
+# Run from the Text_Summarization directory:
+#   python -m pytest tests
+import random
+import pytest
+from rouge_score import rouge_scorer
+from src.benchmark.summarizer_benchmark import synthetic_document
+from src.components.evaluate import SummarizationEvaluator
+from src.components.rouge_engine import NativeRougeScorer
+
+ROUGE_TYPES = ["rouge1", "rouge2", "rouge3", "rougeL"]
+TOLERANCE = 1e-12
+
+PAIRS = [
+    ("", ""),
+    ("", "The cat sat on the mat."),
+    ("The cat sat on the mat.", ""),
+    ("!!! ... ???", "The cat sat."),
+    ("Cat", "cat"),  # shorter than n for rouge2/rouge3
+    ("A b", "a b c"),
+    ("the the the the", "the the"),  # repeated tokens: clipped counts
+    ("a b a b a b a", "b a b a"),
+    ("Running runners ran quickly; the runner runs.", "The runners were running and run."),
+    ("Generously generalized generations generate generators.", "generalization of a general generator"),
+    ("Café naïve résumé über straße", "cafe naive resume uber strasse"),  # non-ASCII is dropped, digits kept
+    ("Прив мир 東京 2024 year", "2024 years in 東京"),
+    ("It's state-of-the-art: U.S. GDP rose 3.5% in Q4.", "US GDP rose 3.5 percent in Q4, state of the art."),
+    ("abc123 def_456 GHI-789", "abc123 def 456 ghi 789"),
+    ("Markets fell sharply. Markets fell sharply.", "Markets fell. Sharply, markets fell."),
+]
+
+
+def assert_same(expected: dict, actual: dict):
+    for rouge_type in expected:
+        for e, a in zip(expected[rouge_type], actual[rouge_type]):
+            assert a == pytest.approx(e, abs=TOLERANCE), rouge_type
+
+
+def random_pairs(count: int, seed: int = 0) -> list[tuple[str, str]]:
+    rng = random.Random(seed)
+    pairs = []
+    for index in range(count):
+        reference = synthetic_document(rng.randint(1, 6), seed=seed + 2 * index)
+        sentences = reference.split(". ")
+        candidate = ". ".join(rng.sample(sentences, rng.randint(1, len(sentences))))
+        pairs.append((reference, candidate + " " + synthetic_document(rng.randint(0, 2), seed=seed + 2 * index + 1)))
+    return pairs
+
+
+@pytest.fixture(scope="module")
+def reference_scorer():
+    return rouge_scorer.RougeScorer(ROUGE_TYPES, use_stemmer=True)
+
+
+@pytest.mark.parametrize("use_stemmer", [True, False])
+@pytest.mark.parametrize("target,prediction", PAIRS)
+def test_native_matches_rouge_score(target, prediction, use_stemmer):
+    expected = rouge_scorer.RougeScorer(ROUGE_TYPES, use_stemmer=use_stemmer).score(target, prediction)
+    assert_same(expected, NativeRougeScorer(ROUGE_TYPES, use_stemmer=use_stemmer).score(target, prediction))
+
+
+def test_native_matches_rouge_score_on_random_pairs(reference_scorer):
+    native = NativeRougeScorer(ROUGE_TYPES)
+    for target, prediction in random_pairs(200):
+        assert_same(reference_scorer.score(target, prediction), native.score(target, prediction))
+
+
+def test_prepared_reference_matches_rouge_score(reference_scorer):
+    native = NativeRougeScorer(ROUGE_TYPES)
+    target = PAIRS[-1][0]
+    prepared = native.prepare(target)
+    for _, prediction in PAIRS:
+        assert_same(reference_scorer.score(target, prediction), native.score_prepared(prepared, prediction))
+
+
+def test_bounded_vocabulary_keeps_scores(reference_scorer):
+    native = NativeRougeScorer(ROUGE_TYPES, max_vocabulary=8)
+    target = PAIRS[8][0]
+    prepared = native.prepare(target)  # prepared before the tables start over
+    predictions = [prediction for _, prediction in random_pairs(20, seed=7)]
+    for prediction in predictions:
+        assert_same(reference_scorer.score(target, prediction), native.score_prepared(prepared, prediction))
+    assert native._generation > 0
+    # The tables only grow past the limit by the words of the text being tokenized.
+    assert len(native._word_ids) <= 8 + max(len(prediction.split()) for prediction in predictions)
+
+
+def test_unsupported_rouge_type():
+    with pytest.raises(ValueError):
+        NativeRougeScorer(["rougeLsum"])
+
+
+@pytest.mark.parametrize("target,prediction", PAIRS)
+def test_rouge_score_private_helpers(reference_scorer, target, prediction):
+    # SummarizationEvaluator (rouge_score engine) scores from prepared n-grams
+    # through these private functions; they must agree with RougeScorer.score.
+    target_tokens = reference_scorer._tokenizer.tokenize(target)
+    prediction_tokens = reference_scorer._tokenizer.tokenize(prediction)
+    expected = reference_scorer.score(target, prediction)
+    for n in (1, 2, 3):
+        actual = rouge_scorer._score_ngrams(rouge_scorer._create_ngrams(target_tokens, n),
+                                            rouge_scorer._create_ngrams(prediction_tokens, n))
+        assert tuple(actual) == pytest.approx(tuple(expected[f"rouge{n}"]), abs=TOLERANCE)
+    actual = rouge_scorer._score_lcs(target_tokens, prediction_tokens)
+    assert tuple(actual) == pytest.approx(tuple(expected["rougeL"]), abs=TOLERANCE)
+
+
+def test_evaluator_engines_agree():
+    engines = SummarizationEvaluator("rouge_score"), SummarizationEvaluator("native")
+    assert engines[1].scorer is None
+    for target, prediction in PAIRS + random_pairs(20):
+        expected, actual = (engine.evaluate_summary(prediction, target) for engine in engines)
+        assert expected["evaluation_status"] == actual["evaluation_status"]
+        for name in ("rouge1", "rouge2", "rougeL"):
+            if name in expected:
+                assert actual[name] == pytest.approx(expected[name], abs=TOLERANCE)
@@ -0,0 +1,73 @@
+# MinHash/LSH near-duplicate sentence collapsing (src/modules/sentence_dedup.py).
+import os
+import subprocess
+import sys
+import numpy as np
+import pytest
+from src.modules.sentence_dedup import MinHashDeduplicator, _lsh_bands
+
+BASE = "markets fell sharply tuesday investors weighed central bank rate outlook amid slowing growth " \
+       "weak factory orders falling exports rising unemployment claims cautious retail spending"
+SENTENCES = [
+    BASE,
+    "quarterly earnings beat forecasts software maker raised annual guidance",
+    BASE.upper() + "!",  # same content words
+    BASE + " today",  # 20 of 21 words shared
+    "heavy rain flooded several roads city council opened emergency shelters",
+    "quarterly earnings beat forecasts software maker cut annual guidance",  # 8 of 10 shared
+]
+
+
+def words_of(sentence: str) -> list[str]:
+    return sentence.lower().strip("!").split()
+
+
+def collapse(deduplicator, sentences):
+    return deduplicator.collapse(sentences, [words_of(sentence) for sentence in sentences])
+
+
+def test_near_duplicates_are_collapsed_into_the_first_occurrence():
+    kept, representative = collapse(MinHashDeduplicator(0.8), SENTENCES)
+    assert kept == [0, 1, 4, 5]
+    assert representative == [0, 1, 0, 0, 4, 5]
+
+
+def test_distinct_sentences_are_kept():
+    sentences = [SENTENCES[0], SENTENCES[1], SENTENCES[4], "", "   "]
+    kept, representative = collapse(MinHashDeduplicator(0.8), sentences)
+    assert kept == [0, 1, 2, 3]  # blank sentences fall back to their text, and match each other
+    assert representative == [0, 1, 2, 3, 3]
+
+
+def test_threshold_controls_what_counts_as_a_duplicate():
+    kept, _ = collapse(MinHashDeduplicator(0.5), SENTENCES)
+    assert kept == [0, 1, 4]
+    kept, _ = collapse(MinHashDeduplicator(1.0), SENTENCES)
+    assert kept == [0, 1, 3, 4, 5]
+    with pytest.raises(ValueError):
+        MinHashDeduplicator(0.0)
+
+
+def test_lsh_bands_cover_the_signature():
+    for num_perm in (16, 64, 128):
+        for threshold in (0.5, 0.8, 0.95):
+            bands, rows = _lsh_bands(num_perm, threshold)
+            assert bands * rows == num_perm
+            assert (1 / bands) ** (1 / rows) <= threshold
+
+
+def test_results_are_stable_across_runs():
+    sentences_words = [words_of(sentence) for sentence in SENTENCES]
+    signatures = MinHashDeduplicator(0.8).signatures(SENTENCES, sentences_words)
+    assert np.array_equal(signatures, MinHashDeduplicator(0.8).signatures(SENTENCES, sentences_words))
+
+    # Token hashing must not depend on Python's per-process string hash seed.
+    script = ("import sys; from src.modules.sentence_dedup import MinHashDeduplicator; "
+              "words = [line.split() for line in sys.stdin.read().splitlines()]; "
+              "print(MinHashDeduplicator(0.8).signatures([' '.join(w) for w in words], words).tolist())")
+    stdin = "\n".join(" ".join(words) for words in sentences_words)
+    for hash_seed in ("1", "2"):
+        output = subprocess.run([sys.executable, "-c", script], input=stdin, capture_output=True, text=True, check=True,
+                                cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                                env={**os.environ, "PYTHONHASHSEED": hash_seed, "LOG_LEVEL": "WARNING"}).stdout
+        assert output.strip() == str(signatures.tolist())
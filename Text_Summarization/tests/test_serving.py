@@ -0,0 +1,92 @@
+# Admission control, drain and the response cache used by app.py / asgi.py.
+import threading
+import time
+import pytest
+from src.serving.request_scheduler import QueueFullError, RequestScheduler, ServiceUnavailableError
+from src.serving.response_cache import SummaryCache
+
+
+@pytest.fixture
+def scheduler():
+    scheduler = RequestScheduler(max_workers=2, queue_limits={"t5": 2})
+    yield scheduler
+    scheduler.drain(timeout=5)
+
+
+def test_queue_full_rejects_without_changing_counters(scheduler):
+    release = threading.Event()
+    futures = [scheduler.submit("t5", release.wait) for _ in range(2)]
+    with pytest.raises(QueueFullError) as error:
+        scheduler.submit("T5", release.wait)
+    assert error.value.limit == 2
+    assert scheduler.stats()["pending"] == {"t5": 2}
+
+    # All-or-nothing: the tfidf job of a rejected batch is not admitted either.
+    with pytest.raises(QueueFullError):
+        scheduler.submit_batch([("tfidf", release.wait, ()), ("t5", release.wait, ())])
+    assert scheduler.stats()["pending"] == {"t5": 2}
+
+    release.set()
+    for future in futures:
+        future.result(timeout=5)
+    time.sleep(0.05)
+    assert scheduler.stats()["pending"] == {}
+
+
+def test_batch_larger_than_limit_is_admitted_when_idle(scheduler):
+    release = threading.Event()
+    futures = scheduler.submit_batch([("t5", release.wait, ()) for _ in range(5)])
+    assert scheduler.stats()["pending"] == {"t5": 5}
+    with pytest.raises(QueueFullError):
+        scheduler.submit("t5", release.wait)
+    release.set()
+    assert all(future.result(timeout=5) for future in futures)
+
+
+def test_drain_waits_for_work_and_rejects_new_requests(scheduler):
+    future = scheduler.submit("tfidf", time.sleep, 0.2)
+    assert scheduler.drain(timeout=5)
+    assert future.done()
+    assert scheduler.stats()["draining"]
+    with pytest.raises(ServiceUnavailableError):
+        scheduler.submit("tfidf", time.sleep, 0)
+    with pytest.raises(ServiceUnavailableError):
+        scheduler.submit_batch([("tfidf", time.sleep, (0,))])
+
+
+def test_cache_key_is_stable():
+    key = SummaryCache.make_key("A  text\nhere.", "TFIDF", {"num_sentences": 3, "language": "english"})
+    assert key == SummaryCache.make_key("A text here.", "tfidf", {"language": "english", "num_sentences": 3})
+    assert key != SummaryCache.make_key("A text here.", "tfidf", {"language": "english", "num_sentences": 2})
+    assert key != SummaryCache.make_key("A text here.", "lsa", {"language": "english", "num_sentences": 3})
+
+
+def test_cache_entry_expires():
+    cache = SummaryCache(ttl=0.05)
+    entry = cache.set("key", {"summary": "x"})
+    assert cache.get("key")["etag"] == entry["etag"] == SummaryCache.make_etag({"summary": "x"})
+    time.sleep(0.1)
+    assert cache.get("key") is None
+
+
+def test_disk_tier_is_pruned(tmp_path):
+    cache = SummaryCache(disk_dir=str(tmp_path), disk_max_entries=3)
+    keys = [SummaryCache.make_key(f"text {index}", "tfidf", {}) for index in range(6)]
+    for index, key in enumerate(keys):
+        cache.set(key, {"summary": index})
+    assert len(list(tmp_path.glob("*/*.json"))) == 3
+    assert cache.stats()["disk_entries"] == 3
+
+    # A new process sees only the newest entries, and honours a smaller cap.
+    reopened = SummaryCache(disk_dir=str(tmp_path), disk_max_entries=2)
+    assert len(list(tmp_path.glob("*/*.json"))) == 2
+    assert reopened.get(keys[-1])["value"] == {"summary": 5}
+    assert reopened.get(keys[0]) is None
+
+
+def test_disk_tier_drops_expired_entries_on_write(tmp_path):
+    cache = SummaryCache(disk_dir=str(tmp_path), ttl=0.05)
+    cache.set(SummaryCache.make_key("old", "tfidf", {}), {"summary": "old"})
+    time.sleep(0.1)
+    cache.set(SummaryCache.make_key("new", "tfidf", {}), {"summary": "new"})
+    assert len(list(tmp_path.glob("*/*.json"))) == 1
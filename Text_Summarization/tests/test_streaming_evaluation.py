@@ -0,0 +1,88 @@
+# Resumable streaming evaluation (src/pipeline/streaming_evaluation.py).
+import json
+import pytest
+from src.pipeline.streaming_evaluation import StreamingEvaluationPipeline
+
+
+class Interrupted(KeyboardInterrupt):
+    """Stands in for Ctrl-C: per-method errors are caught, this is not."""
+
+
+class FakeSummarizer:
+    language = "english"
+
+    def __init__(self, fail_at: int = None):
+        self.fail_at = fail_at
+        self.calls = 0
+
+    def summarize_text(self, text: str, method: str, **kwargs) -> list[str]:
+        self.calls += 1
+        if self.calls == self.fail_at:
+            raise Interrupted()
+        return [text.split(".")[0] + "."]
+
+
+class FakeEvaluator:
+    rouge_engine = "native"
+
+    def evaluate_many_candidates(self, candidates: dict, reference: str) -> dict:
+        return {method: {"evaluation_status": "success", "rouge1": float(len(summary) % 7) / 7}
+                for method, summary in candidates.items()}
+
+
+@pytest.fixture
+def dataset(tmp_path):
+    path = tmp_path / "dataset.jsonl"
+    with open(path, "w") as f:
+        for index in range(23):
+            f.write(json.dumps({"id": index, "text": f"Sentence {index} here. Another one.", "reference": "ref"}) + "\n")
+    return str(path)
+
+
+def run(tmp_path, dataset, summarizer, methods=None, name="out.jsonl"):
+    pipeline = StreamingEvaluationPipeline(summarizer, FakeEvaluator(), methods or {"tfidf": {"num_sentences": 1}},
+                                           str(tmp_path / name), checkpoint_every=5)
+    return pipeline.run(dataset)
+
+
+def read_ids(path) -> list:
+    with open(path) as f:
+        return [json.loads(line)["id"] for line in f]
+
+
+def test_interrupted_run_resumes_without_duplicates(tmp_path, dataset):
+    expected = run(tmp_path, dataset, FakeSummarizer(), name="reference.jsonl")
+
+    with pytest.raises(Interrupted):
+        run(tmp_path, dataset, FakeSummarizer(fail_at=13))
+    assert len(read_ids(tmp_path / "out.jsonl")) == 12  # written, but only 10 are checkpointed
+
+    summarizer = FakeSummarizer()
+    report = run(tmp_path, dataset, summarizer)
+    assert summarizer.calls == 13  # records 10..22 are recomputed
+    assert read_ids(tmp_path / "out.jsonl") == list(range(23))
+    assert report == expected
+
+
+def test_checkpoint_with_other_methods_is_not_resumed(tmp_path, dataset):
+    with pytest.raises(Interrupted):
+        run(tmp_path, dataset, FakeSummarizer(fail_at=8))
+
+    summarizer = FakeSummarizer()
+    report = run(tmp_path, dataset, summarizer, methods={"lsa": {"num_sentences": 2}})
+    assert summarizer.calls == 23  # started over
+    assert read_ids(tmp_path / "out.jsonl") == list(range(23))
+    assert set(report["results"]) == {"lsa"}
+    with open(tmp_path / "out.jsonl") as f:
+        assert all(set(json.loads(line)["summaries"]) == {"lsa"} for line in f)
+
+
+def test_missing_output_discards_checkpoint(tmp_path, dataset):
+    with pytest.raises(Interrupted):
+        run(tmp_path, dataset, FakeSummarizer(fail_at=8))
+    (tmp_path / "out.jsonl").unlink()
+
+    report = run(tmp_path, dataset, FakeSummarizer())
+    assert read_ids(tmp_path / "out.jsonl") == list(range(23))
+    assert report["num_records"] == 23
+    assert b"\0" not in (tmp_path / "out.jsonl").read_bytes()
@@ -0,0 +1,37 @@
+# Exact and near-duplicate reuse in the persistent summary store.
+import pytest
+from src.components.summary_store import SummaryStore
+
+
+@pytest.fixture
+def store(tmp_path):
+    return SummaryStore(str(tmp_path / "summaries.db"))
+
+
+def test_exact_reuse_is_keyed_on_the_raw_text(store):
+    store.put("The cat sat. It purred.", "tfidf", {"num_sentences": 1}, None, ["The cat sat."])
+    assert store.get("The cat sat. It purred.", "tfidf", {"num_sentences": 1}) == ["The cat sat."]
+    assert store.get("The cat sat. It purred.", "tfidf", {"num_sentences": 2}) is None
+    assert SummaryStore.make_key("The cat sat.", "tfidf") != SummaryStore.make_key("THE CAT SAT.", "tfidf")
+
+
+def test_case_variant_gets_its_own_sentences(store):
+    store.put("The cat sat.  It purred loudly.", "tfidf", {}, None, ["It purred loudly."])
+    variant = "THE CAT SAT.\nIT  PURRED LOUDLY."
+    assert store.get(variant, "tfidf", {}) == ["IT  PURRED LOUDLY."]
+
+    store.put("Ｆｕｌｌ width. Second sentence.", "tfidf", {}, None, ["Ｆｕｌｌ width."])
+    assert store.get("full WIDTH. second sentence.", "tfidf", {}) == ["full WIDTH."]
+
+
+def test_near_duplicate_that_cannot_be_remapped_is_a_miss(store):
+    # An abstractive summary does not quote the text, so it is recomputed.
+    store.put("The cat sat. It purred.", "t5", {}, None, ["A cat was sitting and purring."])
+    assert store.get("The cat sat. It purred.", "t5", {}) == ["A cat was sitting and purring."]
+    assert store.get("the cat sat. it purred.", "t5", {}) is None
+
+
+def test_near_duplicates_can_be_disabled(tmp_path):
+    store = SummaryStore(str(tmp_path / "summaries.db"), near_duplicates=False)
+    store.put("The cat sat. It purred.", "tfidf", {}, None, ["The cat sat."])
+    assert store.get("the cat sat. it purred.", "tfidf", {}) is None
@@ -1,11 +1,33 @@
 # --- Flask Application Setup ---
-from flask import Flask, render_template, request, flash, redirect, url_for
+from collections.abc import Mapping
+from concurrent.futures import as_completed, TimeoutError as FutureTimeoutError
+from flask import Flask, render_template, request, flash, redirect, url_for, jsonify, Response, stream_with_context
+import hashlib
+import json
+import os
 import sys
+import threading
 import pathlib
 
-from Text_Summarization.src.components.summarizer import Summarizer
-from Text_Summarization.src.utils.nltk_resources import download_nltk_resources
-# from src.components.summarizer import Summarizer
+from src.components.multilingual_summarizer import MultilingualSummarizer
+from src.constants.constants import (
+    AUTO_DEFAULT_LATENCY_BUDGET,
+    API_MAX_BATCH_SIZE,
+    API_MAX_TEXT_LENGTH,
+    RESPONSE_CACHE_DIR_ENV,
+    SUMMARY_STORE_ENV,
+)
+from src.components.summary_store import SummaryStore
+from src.core.inference_scheduler import inference_scheduler
+from src.serving.response_cache import SummaryCache
+from src.serving.request_scheduler import (
+    QueueFullError,
+    RequestScheduler,
+    ServiceUnavailableError,
+)
+from src.utils.metrics import registry
+from src.utils.tracing import MemorySink, tracer
+from src.utils.nltk_resources import download_nltk_resources
 
 
 app_dir = pathlib.Path(__file__).parent.resolve()
@@ -18,7 +40,14 @@ app = Flask(__name__,
     static_folder=str(static_path)
     )
 app.secret_key = 'super_secret_key'
-summarizer = Summarizer(language='english')
+# Summaries persist across restarts in a SQLite store when SUMMARY_STORE_PATH is set.
+# Texts are routed by their "language" (detected when not given); models are shared across languages.
+summarizer = MultilingualSummarizer(default_language='english',
+                                    store=SummaryStore(os.environ[SUMMARY_STORE_ENV]) if os.environ.get(SUMMARY_STORE_ENV) else None)
+# All summarization work runs on a bounded, per-method admission-controlled pool.
+scheduler = RequestScheduler()
+# Identical text/method/params requests are answered from this cache.
+response_cache = SummaryCache(disk_dir=os.environ.get(RESPONSE_CACHE_DIR_ENV) or None)
 
 # Ensure NLTK resources are available when the app starts
 download_nltk_resources()
@@ -30,6 +59,7 @@ def index():
     summary = ""
     selected_method = "tfidf"
     num_sentences = 3
+    status_code = 200
 
     if request.method == 'POST':
         original_text = request.form.get('text_input', '').strip()
@@ -39,42 +69,287 @@ def index():
         if not original_text:
             flash("Please provide some text to summarize.", 'error')
             return render_template('index.html', original_text=original_text, summary=summary, method=selected_method, num_sentences=num_sentences)
-        kwargs = {
-            "text": original_text,
-            "method": selected_method
-        }
+        if selected_method in ['tfidf', 'lsa', 'bert_extractive', 'textrank']:
+            params = {"num_sentences": num_sentences}
+        elif selected_method in ['t5']:
+            params = {}  # length bounds follow the input size (GenerationPolicy)
+        elif selected_method == 'auto':
+            params = {"num_sentences": num_sentences, "latency_budget": AUTO_DEFAULT_LATENCY_BUDGET}
+        else:
+            # Fallback if method not recognized
+            params = {}
 
         try:
-            if selected_method in ['tfidf', 'lsa', 'bert_extractive', 'textrank']:
-                summary_list = summarizer.summarize_text(
-                    num_sentences=num_sentences,
-                    **kwargs
-            )
-            elif selected_method in ['t5']:
-                summary_list = summarizer.summarize_text(
-                    max_length=num_sentences * 30,
-                    min_length=num_sentences * 10,
-                    **kwargs)
-                
-            else:
-                # Fallback if method not recognized
-                summary_list = summarizer.summarize_text(
-                    text=original_text,
-                    method=selected_method
-                )
-            summary = " ".join(summary_list)
-            
-            if "Error:" in summary:
-                flash(summary, 'error')
-                summary = ""
-            else:
+            result, _ = summarize_with_cache({"text": original_text, "method": selected_method, "params": params})
+            if result["status"] == "success":
+                summary = result["summary"]
                 flash(f"Summarization successful using {selected_method.upper()}.", 'success')
+            else:
+                flash(f"Error: {result['error']}", 'error')
 
+        except QueueFullError as e:
+            flash(f"The server is busy: {e}", 'error')
+            status_code = 429
+        except ServiceUnavailableError as e:
+            flash(f"The service is temporarily unavailable: {e}", 'error')
+            status_code = 503
         except Exception as e:
             flash(f"An unexpected error occurred: {e}", 'error')
             print(f"ERROR during summarization: {e}", file=sys.stderr)
     
-    return render_template('index.html', original_text=original_text, summary=summary, method=selected_method, num_sentences=num_sentences)
+    return render_template('index.html', original_text=original_text, summary=summary, method=selected_method, num_sentences=num_sentences), status_code
+
+
+def cache_result(key: str, result: dict) -> str:
+    """
+    Caches a successful result (without its request id) and returns its ETag.
+    """
+    if result.get("status") != "success":
+        return None
+    return response_cache.set(key, {k: v for k, v in result.items() if k != "id"})["etag"]
+
+
+def item_cache_key(item: dict) -> str:
+    # A requested language changes the result; a detected one follows from the text.
+    params = {**item["params"], "language": item["language"]} if item.get("language") else item["params"]
+    return SummaryCache.make_key(item["text"], item["method"], params)
+
+
+def summarize_with_cache(item: dict) -> tuple[dict, str]:
+    """
+    Returns (result, etag) for one item, computing it on the scheduler on a cache miss.
+    """
+    key = item_cache_key(item)
+    entry = response_cache.get(key)
+    if entry is not None:
+        return {"id": item.get("id"), **entry["value"]}, entry["etag"]
+    result = scheduler.run(item["method"], summarizer.summarize_item, item)
+    return result, cache_result(key, result)
+
+
+@app.errorhandler(QueueFullError)
+def handle_queue_full(error):
+    response = jsonify({"error": str(error), "method": error.method})
+    response.headers["Retry-After"] = "1"
+    return response, 429
+
+
+@app.errorhandler(ServiceUnavailableError)
+def handle_service_unavailable(error):
+    response = jsonify({"error": str(error)})
+    response.headers["Retry-After"] = "5"
+    return response, 503
+
+def parse_batch_request(payload) -> tuple[list[dict], str]:
+    """
+    Validates a batch request body and returns (items, error message).
+
+    Body: {"documents": [{"id": ..., "text": ..., "method": ..., "params": {...}, "language": ...}, ...],
+           "method": default method, "params": default params, "language": default language
+           (detected per document when absent), "stream": bool}
+    """
+    if not isinstance(payload, dict):
+        return [], "Request body must be a JSON object."
+    documents = payload.get("documents")
+    if not isinstance(documents, list) or not documents:
+        return [], "'documents' must be a non-empty list."
+    if len(documents) > API_MAX_BATCH_SIZE:
+        return [], f"Batch too large: {len(documents)} documents (max {API_MAX_BATCH_SIZE})."
+
+    default_method = payload.get("method", "tfidf")
+    if not isinstance(default_method, str):
+        return [], "'method' must be a string."
+    default_params = payload.get("params", {})
+    if not isinstance(default_params, dict):
+        return [], "'params' must be an object."
+
+    items = []
+    for index, document in enumerate(documents):
+        if isinstance(document, str):
+            document = {"text": document}
+        if not isinstance(document, dict):
+            return [], f"Document {index} must be a string or an object."
+        text = document.get("text")
+        if not isinstance(text, str) or not text.strip():
+            return [], f"Document {index} has no 'text'."
+        if len(text) > API_MAX_TEXT_LENGTH:
+            return [], f"Document {index} exceeds {API_MAX_TEXT_LENGTH} characters."
+        document_params = document.get("params", {})
+        if not isinstance(document_params, dict):
+            return [], f"Document {index} has an invalid 'params'."
+        method = document.get("method", default_method)
+        if not isinstance(method, str):
+            return [], f"Document {index} has an invalid 'method'."
+        params = {**default_params, **document_params}
+        if method == 't5':
+            # Unless max_length/min_length are given, t5 sizes its summary from the input.
+            params.pop('num_sentences', None)
+        language = document.get("language", payload.get("language"))
+        if language is not None and not isinstance(language, str):
+            return [], f"Document {index} has an invalid 'language'."
+        items.append({"id": document.get("id", index), "text": text, "method": method, "params": params,
+                      "language": language})
+    return items, ""
+
+
+@app.route('/api/summarize', methods=['POST'])
+def api_summarize():
+    """
+    Summarizes a batch of documents. Returns {"results": [...]} in input order, or
+    newline-delimited JSON in completion order when "stream" is true or the client
+    accepts application/x-ndjson.
+    """
+    payload = request.get_json(silent=True)
+    items, error = parse_batch_request(payload)
+    if error:
+        return jsonify({"error": error}), 400
+
+    keys = [item_cache_key(item) for item in items]
+    results, etags = [None] * len(items), [None] * len(items)
+    for index, (item, key) in enumerate(zip(items, keys)):
+        entry = response_cache.get(key)
+        if entry is not None:
+            results[index], etags[index] = {"id": item["id"], **entry["value"]}, entry["etag"]
+    cache_status = "HIT" if all(results) else "MISS" if not any(results) else "PARTIAL"
+
+    # Admit the whole batch as one unit before responding so rejections surface as 429/503.
+    missing = [index for index, result in enumerate(results) if result is None]
+    submitted = scheduler.submit_batch([(items[index]["method"], summarizer.summarize_item, (items[index],))
+                                        for index in missing])
+    futures = dict(zip(submitted, missing))
+
+    stream = payload.get("stream") or request.accept_mimetypes.best == 'application/x-ndjson'
+    if stream:
+        def generate():
+            try:
+                for index, result in enumerate(results):
+                    if result is not None:
+                        yield json.dumps({"index": index, **result}) + "\n"
+                for future in as_completed(futures):
+                    index, result = futures[future], future.result()
+                    cache_result(keys[index], result)
+                    yield json.dumps({"index": index, **result}) + "\n"
+            finally:
+                for future in futures:
+                    future.cancel()
+        response = Response(stream_with_context(generate()), mimetype='application/x-ndjson')
+        response.headers["X-Cache"] = cache_status
+        return response
+
+    try:
+        for future in as_completed(futures, timeout=scheduler.request_timeout):
+            index = futures[future]
+            results[index] = future.result()
+            etags[index] = cache_result(keys[index], results[index])
+    except FutureTimeoutError:
+        for future in futures:
+            future.cancel()
+        raise ServiceUnavailableError(f"Batch timed out after {scheduler.request_timeout:.0f}s.")
+
+    response = jsonify({"results": results})
+    response.headers["X-Cache"] = cache_status
+    if all(etags):
+        # The batch ETag covers every item's id and result, so clients can
+        # revalidate with If-None-Match and get a 304 without a body.
+        batch_tag = hashlib.sha256(json.dumps([[item["id"], etag] for item, etag in zip(items, etags)]).encode("utf-8"))
+        batch_etag = batch_tag.hexdigest()[:32]
+        if request.if_none_match.contains(batch_etag):
+            response = Response(status=304)
+            response.headers["X-Cache"] = cache_status
+        response.set_etag(batch_etag)
+        response.headers["Cache-Control"] = "no-cache"
+    return response
+
+
+def sse_event(event: str, data: dict) -> str:
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+
+@app.route('/api/summarize/stream', methods=['GET', 'POST'])
+def api_summarize_stream():
+    """
+    Streams a t5 summary as Server-Sent Events: one "token" event per decoded
+    piece, then "done" with the full summary (or "error"). Disconnecting
+    cancels generation. Accepts a JSON body or query parameters (for EventSource):
+    text, and optionally max_length/min_length (by default they follow the input size).
+    """
+    payload = request.get_json(silent=True) if request.is_json else request.values
+    if not isinstance(payload, Mapping):
+        return jsonify({"error": "Request body must be a JSON object."}), 400
+    text = payload.get("text")
+    if not isinstance(text, str) or not text.strip():
+        return jsonify({"error": "'text' is required."}), 400
+    if len(text) > API_MAX_TEXT_LENGTH:
+        return jsonify({"error": f"Text exceeds {API_MAX_TEXT_LENGTH} characters."}), 400
+    try:
+        params = {name: int(payload[name]) for name in ("max_length", "min_length") if payload.get(name) is not None}
+    except (TypeError, ValueError):
+        return jsonify({"error": "Length parameters must be integers."}), 400
+
+    # Streaming decodes greedily, so its results are cached apart from batch t5 results.
+    key = SummaryCache.make_key(text, "t5", {**params, "decoding": "greedy"})
+    entry = response_cache.get(key)
+    if entry is not None:
+        summary = entry["value"]["summary"]
+        body = sse_event("token", {"text": summary}) + sse_event("done", {"summary": summary})
+        response = Response(body, mimetype='text/event-stream')
+        response.headers["X-Cache"] = "HIT"
+        return response
+
+    t5 = summarizer.summarizer_factory.get_summarizer('t5')
+    if not t5.available:
+        raise ServiceUnavailableError("Summarization method 't5' is not available.")
+    # Admission happens here, before any bytes are sent, so overload is a 429/503.
+    cancel_event = threading.Event()
+    pieces = t5.stream_summarize(text, **params, cancel_event=cancel_event,
+                                 submit=lambda fn: scheduler.submit('t5', fn), timeout=scheduler.request_timeout)
+
+    def generate():
+        summary = []
+        try:
+            for piece in pieces:
+                summary.append(piece)
+                yield sse_event("token", {"text": piece})
+            summary = "".join(summary).strip()
+            if summary:
+                response_cache.set(key, {"method": "t5", "status": "success", "summary": summary, "sentences": [summary]})
+            yield sse_event("done", {"summary": summary})
+        except (ValueError, TimeoutError) as e:
+            yield sse_event("error", {"error": str(e)})
+        finally:
+            pieces.close()
+
+    response = Response(stream_with_context(generate()), mimetype='text/event-stream')
+    # Fires when the server closes the response, even if the body was never
+    # iterated (client gone before the first byte), so generation stops.
+    response.call_on_close(cancel_event.set)
+    response.headers["Cache-Control"] = "no-cache"
+    response.headers["X-Accel-Buffering"] = "no"
+    response.headers["X-Cache"] = "MISS"
+    return response
+
+
+@app.route('/healthz', methods=['GET'])
+def healthz():
+    """Reports scheduler load; returns 503 while draining."""
+    stats = {**scheduler.stats(), "inference": inference_scheduler.stats(), "cache": response_cache.stats()}
+    return jsonify(stats), 503 if stats["draining"] else 200
+
+
+@app.route('/metrics', methods=['GET'])
+def metrics():
+    """Exports latency histograms and counters in Prometheus text format."""
+    return Response(registry.render(), content_type="text/plain; version=0.0.4; charset=utf-8")
+
+
+@app.route('/debug/traces', methods=['GET'])
+def debug_traces():
+    """Per-span timing aggregates from the in-memory trace sink (SUMMARY_TRACE=memory)."""
+    sink = tracer.find_sink(MemorySink)
+    if sink is None:
+        return jsonify({"error": "In-memory tracing is not enabled. Set SUMMARY_TRACE=memory."}), 404
+    return jsonify(sink.snapshot())
+
 
 if __name__ == '__main__':
     app.run(host='0.0.0.0', port=5000, debug=True)
@@ -0,0 +1,111 @@
+# --- Production ASGI entry point ---
+# Serves the Flask app through uvicorn with a bounded request scheduler:
+#   python asgi.py --host 0.0.0.0 --port 8000
+#   uvicorn asgi:application --host 0.0.0.0 --port 8000 --timeout-graceful-shutdown 30
+import argparse
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+import uvicorn
+from asgiref.sync import sync_to_async
+from asgiref.wsgi import WsgiToAsgiInstance
+
+from app import app, scheduler
+from src.constants.constants import SERVING_DRAIN_TIMEOUT, SERVING_HTTP_THREADS
+from src.utils.logging_setup import logger
+
+
+class ThreadedWsgiInstance(WsgiToAsgiInstance):
+    """
+    Runs one WSGI request on a thread of a shared pool.
+
+    asgiref's WsgiToAsgi runs every request on a single thread, so requests
+    would queue behind each other before reaching the scheduler (no 429s, and
+    a long stream blocks /healthz). The response iterable is also closed, so
+    `call_on_close` handlers fire when a client goes away.
+    """
+    def __init__(self, wsgi_application, executor: ThreadPoolExecutor):
+        super().__init__(self._record_response(wsgi_application))
+        self.executor = executor
+        self.response_iterable = None
+
+    def _record_response(self, wsgi_application):
+        def call(environ, start_response):
+            self.response_iterable = wsgi_application(environ, start_response)
+            return self.response_iterable
+        return call
+
+    def _run_and_close(self, body):
+        try:
+            # The undecorated body of asgiref's run_wsgi_app, called on this thread.
+            WsgiToAsgiInstance.__dict__["run_wsgi_app"].func(self, body)
+        finally:
+            if hasattr(self.response_iterable, "close"):
+                self.response_iterable.close()
+
+    async def run_wsgi_app(self, body):
+        await sync_to_async(self._run_and_close, thread_sensitive=False, executor=self.executor)(body)
+
+
+class ServingApplication:
+    """
+    ASGI wrapper around the WSGI Flask app that handles the lifespan protocol,
+    draining the request scheduler on shutdown so in-flight summaries finish.
+    HTTP requests run concurrently on up to `threads` threads.
+    """
+    def __init__(self, wsgi_app, drain_timeout: float = SERVING_DRAIN_TIMEOUT, threads: int = SERVING_HTTP_THREADS):
+        self.wsgi_app = wsgi_app
+        self.drain_timeout = drain_timeout
+        self.threads = threads
+        self.executor = None
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "lifespan":
+            if self.executor is None:
+                self.executor = ThreadPoolExecutor(max_workers=self.threads, thread_name_prefix="http")
+            await ThreadedWsgiInstance(self.wsgi_app, self.executor)(scope, receive, send)
+            return
+
+        while True:
+            message = await receive()
+            if message["type"] == "lifespan.startup":
+                logger.info(f"Serving with {scheduler.max_workers} summarization workers.")
+                await send({"type": "lifespan.startup.complete"})
+            elif message["type"] == "lifespan.shutdown":
+                drained = await asyncio.to_thread(scheduler.drain, self.drain_timeout)
+                if not drained:
+                    logger.warning("Shutdown drain timed out; some requests were cancelled.")
+                if self.executor is not None:
+                    self.executor.shutdown(wait=False)
+                await send({"type": "lifespan.shutdown.complete"})
+                return
+
+
+application = ServingApplication(app)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run the summarization service in production mode.")
+    parser.add_argument("--host", default="0.0.0.0")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--limit-concurrency", type=int, default=256,
+                        help="Connections beyond this are answered with 503 by the server.")
+    parser.add_argument("--drain-timeout", type=float, default=SERVING_DRAIN_TIMEOUT)
+    parser.add_argument("--threads", type=int, default=SERVING_HTTP_THREADS,
+                        help="Requests handled at once; the scheduler's queue limits apply within these.")
+    args = parser.parse_args()
+
+    application.drain_timeout = args.drain_timeout
+    application.threads = args.threads
+    uvicorn.run(
+        application,
+        host=args.host,
+        port=args.port,
+        lifespan="on",
+        limit_concurrency=args.limit_concurrency,
+        timeout_graceful_shutdown=int(args.drain_timeout),
+    )
+
+
+if __name__ == '__main__':
+    main()